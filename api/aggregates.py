@@ -0,0 +1,186 @@
+"""
+Read-only JSON API exposing the aggregates behind the dashboard pages.
+
+Responses carry strong ETags derived from the dataset fingerprint and the
+normalized query, so clients polling with If-None-Match get a 304 without
+any aggregation being computed.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Dict, Optional, Tuple
+
+from flask import Blueprint, request
+
+from api.responses import json_response, not_modified
+from utils.data_loading import filter_data, get_year_range
+from utils.data_processing import (
+    calculate_market_share,
+    analyze_time_trends,
+    get_top_performers
+)
+from utils.shared_data import get_shared_dataset
+
+logger = logging.getLogger(__name__)
+
+API_VERSION = 'v1'
+DIMENSIONS = ['Platform', 'Genre', 'Publisher']
+METRICS = ['Global_Sales', 'NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']
+MAX_TOP_N = 1000
+
+api_v1 = Blueprint('api_v1', __name__, url_prefix=f'/api/{API_VERSION}')
+
+class ApiError(Exception):
+    """Raised for invalid API query parameters."""
+    pass
+
+def _parse_years(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Parse a 'YYYY' or 'YYYY-YYYY' year range."""
+    if not value:
+        return None
+    try:
+        parts = [int(part) for part in value.split('-')]
+    except ValueError:
+        raise ApiError(f"Invalid years '{value}', expected YYYY or YYYY-YYYY")
+    if len(parts) == 1:
+        parts = parts * 2
+    if len(parts) != 2 or parts[0] > parts[1]:
+        raise ApiError(f"Invalid years '{value}', expected YYYY or YYYY-YYYY")
+    return parts[0], parts[1]
+
+def _parse_choice(name: str, value: Optional[str], choices: list, default: str) -> str:
+    """Validate an enumerated query parameter."""
+    value = value or default
+    if value not in choices:
+        raise ApiError(f"Invalid {name} '{value}', expected one of {choices}")
+    return value
+
+def _make_etag(fingerprint: str, endpoint: str, query: Dict) -> str:
+    """Build a strong ETag from the dataset version and normalized query."""
+    key = json.dumps([API_VERSION, fingerprint, endpoint, query], sort_keys=True)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+def _aggregate_endpoint(endpoint: str, parse_query, compute):
+    """
+    Serve an aggregate with conditional GET support.
+
+    Args:
+        endpoint (str): Endpoint name used in the ETag
+        parse_query (Callable): Returns the normalized query dict from request args
+        compute (Callable): Computes a DataFrame from (filtered df, query);
+            only the columns it returns are serialized
+
+    Returns:
+        Response: 200 with JSON data, 304 when the ETag matches, or 400
+    """
+    try:
+        query = parse_query(request.args)
+    except ApiError as e:
+        return json_response({'error': str(e)}, status=400)
+
+    dataset = get_shared_dataset()
+    etag = _make_etag(dataset.fingerprint, endpoint, query)
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+
+    years = tuple(query['years']) if query.get('years') else None
+    df = filter_data(dataset.clean_frame, year_range=years)
+    result = compute(df, query)
+
+    body = {
+        'version': API_VERSION,
+        'dataset': dataset.fingerprint,
+        'query': query,
+        'data': json.loads(result.to_json(orient='records'))
+    }
+    return json_response(body, etag=etag)
+
+@api_v1.route('/market-share')
+def market_share():
+    """Market share by Platform, Genre or Publisher (see calculate_market_share)."""
+    def parse(args):
+        return {
+            'by': _parse_choice('by', args.get('by'), DIMENSIONS, 'Platform'),
+            'years': _parse_years(args.get('years'))
+        }
+
+    return _aggregate_endpoint(
+        'market-share', parse,
+        lambda df, q: calculate_market_share(df, q['by'])[[q['by'], 'Global_Sales', 'Market_Share']]
+    )
+
+@api_v1.route('/time-trends')
+def time_trends():
+    """Yearly sales trends, optionally split by a dimension (see analyze_time_trends)."""
+    def parse(args):
+        group_by = args.get('group_by')
+        return {
+            'group_by': _parse_choice('group_by', group_by, DIMENSIONS, None) if group_by else None,
+            'years': _parse_years(args.get('years'))
+        }
+
+    def compute(df, q):
+        trends = analyze_time_trends(df, q['group_by'] or 'Year')
+        return trends[['Year'] + ([q['group_by']] if q['group_by'] else []) + METRICS]
+
+    return _aggregate_endpoint('time-trends', parse, compute)
+
+@api_v1.route('/top-performers')
+def top_performers():
+    """Top games, platforms, genres or publishers by a sales metric (see get_top_performers)."""
+    def parse(args):
+        try:
+            top_n = int(args.get('n', 10))
+        except ValueError:
+            raise ApiError(f"Invalid n '{args.get('n')}', expected an integer")
+        if not 1 <= top_n <= MAX_TOP_N:
+            raise ApiError(f"Invalid n {top_n}, expected 1-{MAX_TOP_N}")
+        return {
+            'category': _parse_choice('category', args.get('category'), ['Name'] + DIMENSIONS, 'Name'),
+            'metric': _parse_choice('metric', args.get('metric'), METRICS, 'Global_Sales'),
+            'n': top_n,
+            'years': _parse_years(args.get('years'))
+        }
+
+    def compute(df, q):
+        top = get_top_performers(df, q['category'], q['metric'], q['n'])
+        # Grouped results carry a game count under 'Rank'; games keep their rows
+        return top if q['category'] == 'Name' else top[[q['category'], q['metric']]]
+
+    return _aggregate_endpoint('top-performers', parse, compute)
+
+@api_v1.route('/games/<int:row_id>')
+def game_detail(row_id: int):
+    """Full record of a single game by row id (as plotted by the game explorer)."""
+    dataset = get_shared_dataset()
+    etag = _make_etag(dataset.fingerprint, 'games', {'row_id': row_id})
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+
+    try:
+        game = dataset.game(row_id)
+    except IndexError as e:
+        return json_response({'error': str(e)}, status=404)
+
+    return json_response({
+        'version': API_VERSION,
+        'dataset': dataset.fingerprint,
+        'data': game
+    }, etag=etag)
+
+@api_v1.route('/dataset')
+def dataset_info():
+    """Dataset version and coverage, useful for cheap change detection."""
+    dataset = get_shared_dataset()
+    etag = _make_etag(dataset.fingerprint, 'dataset', {})
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+
+    start_year, end_year = get_year_range(dataset.clean_frame)
+    return json_response({
+        'version': API_VERSION,
+        'dataset': dataset.fingerprint,
+        'rows': len(dataset),
+        'years': [start_year, end_year]
+    }, etag=etag)
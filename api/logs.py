@@ -0,0 +1,65 @@
+"""
+JSON API for searching the dashboard logs.
+
+Backed by the incremental SQLite index in utils.log_index, so searches cover
+the current log files and their rotated backups without rereading them.
+"""
+
+import logging
+import re
+from typing import Optional
+
+from flask import Blueprint, request
+
+from api.aggregates import API_VERSION, ApiError
+from api.responses import json_response
+from utils.log_index import LEVELS, search_logs
+from utils.constants import LOG_INDEX_CONFIG
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2})?)?$')
+
+logs_api = Blueprint('logs_api', __name__, url_prefix=f'/api/{API_VERSION}/logs')
+
+def _parse_timestamp(name: str, value: Optional[str]) -> Optional[str]:
+    """Validate a 'YYYY-MM-DD[ HH:MM[:SS]]' time bound."""
+    if not value:
+        return None
+    if not TIMESTAMP_PATTERN.match(value):
+        raise ApiError(f"Invalid {name} '{value}', expected YYYY-MM-DD[THH:MM[:SS]]")
+    return value.replace('T', ' ')
+
+@logs_api.route('/search')
+def search():
+    """Log entries matching text, levels and a time range, newest first."""
+    args = request.args
+    try:
+        levels = [level.upper() for level in args.getlist('level') for level in level.split(',') if level]
+        unknown = [level for level in levels if level not in LEVELS]
+        if unknown:
+            raise ApiError(f"Invalid level {unknown}, expected any of {LEVELS}")
+        try:
+            limit = int(args.get('limit', LOG_INDEX_CONFIG['max_results']))
+        except ValueError:
+            raise ApiError(f"Invalid limit '{args.get('limit')}', expected an integer")
+        if not 1 <= limit <= LOG_INDEX_CONFIG['max_results']:
+            raise ApiError(f"Invalid limit {limit}, expected 1-{LOG_INDEX_CONFIG['max_results']}")
+        query = {
+            'q': args.get('q') or None,
+            'levels': levels,
+            'start': _parse_timestamp('start', args.get('start')),
+            'end': _parse_timestamp('end', args.get('end')),
+            'limit': limit
+        }
+    except ApiError as e:
+        return json_response({'error': str(e)}, status=400)
+
+    result = search_logs(query['q'], query['levels'], query['start'], query['end'], query['limit'])
+    return json_response({
+        'version': API_VERSION,
+        'query': query,
+        'total': result['total'],
+        'elapsed_ms': round(result['elapsed_ms'], 2),
+        'data': result['entries']
+    })
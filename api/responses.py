@@ -0,0 +1,23 @@
+"""
+JSON response helpers shared by the API blueprints.
+"""
+
+import json
+from typing import Dict
+
+from flask import Response
+
+def json_response(body: Dict, status: int = 200, etag: str = None) -> Response:
+    """Serialize a response body, attaching caching headers when an ETag is given."""
+    response = Response(json.dumps(body), status=status, mimetype='application/json')
+    if etag:
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response for a matching ETag."""
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
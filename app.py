@@ -618,6 +618,13 @@ import pandas as pd
 import logging
 from pathlib import Path
 from utils.logging_setup import setup_logging
+from utils.background import create_background_manager
+from utils.shared_data import get_shared_dataset
+from utils.prerender import get_prerendered_layout, prerender_bp
+from utils.metrics import init_metrics
+from utils.profiling import profiling_bp
+from api.aggregates import api_v1
+from api.logs import logs_api
 
 # Import our utility modules
 from utils.data_loading import load_vgsales_data, DataLoadingError
@@ -636,14 +643,13 @@ from pages import (
     genre_analysis,
     platform_analysis,
     publisher_analysis,
-    log_viewer
+    game_explorer,
+    games_table,
+    log_viewer,
+    perf
 )
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = setup_logging()
 
 # Initialize the Dash app
@@ -653,15 +659,20 @@ app = dash.Dash(
         dbc.themes.BOOTSTRAP,
         'https://use.fontawesome.com/releases/v5.15.4/css/all.css'
     ],
-    suppress_callback_exceptions=True
+    suppress_callback_exceptions=True,
+    background_callback_manager=create_background_manager()
 )
 server = app.server
+server.register_blueprint(api_v1)
+server.register_blueprint(logs_api)
+server.register_blueprint(prerender_bp)
+server.register_blueprint(profiling_bp)
 
 # Load and process data
 try:
     df = load_vgsales_data()
     print("Raw data shape:", df.shape)
-    df_clean = clean_dataset(df)
+    df_clean = get_shared_dataset().clean_frame
     print("Cleaned data shape:", df_clean.shape)
     print("Sample data:", df_clean.head())
     logger.info("Data loaded and cleaned successfully")
@@ -687,7 +698,10 @@ def create_header():
                 dbc.NavItem(dbc.NavLink("Genre Analysis", href="/genre", active="exact")),
                 dbc.NavItem(dbc.NavLink("Platform Analysis", href="/platform", active="exact")),
                 dbc.NavItem(dbc.NavLink("Publisher Analysis", href="/publisher", active="exact")),
+                dbc.NavItem(dbc.NavLink("Game Explorer", href="/explorer", active="exact")),
+                dbc.NavItem(dbc.NavLink("All Games", href="/games", active="exact")),
                 dbc.NavItem(dbc.NavLink("Logs", href="/logs", active="exact")),
+                dbc.NavItem(dbc.NavLink("Performance", href="/perf", active="exact")),
             ], navbar=True),
         ]),
         color="dark",
@@ -787,6 +801,7 @@ def create_header():
 app.layout = html.Div([
     # Store components for sharing data between callbacks
     dcc.Store(id='filtered-data-store'),
+    dcc.Store(id='viewport-store'),
     dcc.Location(id='url', refresh=False),
     
     # Header
@@ -806,6 +821,17 @@ app.layout = html.Div([
     ], fluid=True)
 ])
 
+# Record the browser viewport so charts can pick a level of detail
+app.clientside_callback(
+    """
+    function(pathname) {
+        return {width: window.innerWidth, height: window.innerHeight};
+    }
+    """,
+    Output('viewport-store', 'data'),
+    Input('url', 'pathname')
+)
+
 # Callback for page routing
 @app.callback(
     Output('page-content', 'children'),
@@ -813,6 +839,10 @@ app.layout = html.Div([
 )
 def display_page(pathname):
     """Route to the appropriate page based on URL pathname."""
+    prerendered = get_prerendered_layout(pathname)
+    if prerendered is not None:
+        return prerendered
+
     if pathname == '/' or pathname == '/overview':
         return overview.create_overview_layout()
     elif pathname == '/sales':
@@ -823,8 +853,14 @@ def display_page(pathname):
         return platform_analysis.create_platform_analysis_layout()
     elif pathname == '/publisher':
         return publisher_analysis.create_publisher_analysis_layout()
+    elif pathname == '/explorer':
+        return game_explorer.create_game_explorer_layout()
+    elif pathname == '/games':
+        return games_table.create_games_table_layout()
     elif pathname == '/logs':
         return log_viewer.create_log_viewer_layout()
+    elif pathname == '/perf':
+        return perf.create_perf_layout()
     else:
         return overview.create_overview_layout()
 
@@ -886,5 +922,8 @@ def display_page(pathname):
 #     logger.debug(f"Filtered data shape: {filtered_df.shape}")
 #     return filtered_df.to_dict('records')
 
+# Per-callback latency and payload metrics on /metrics
+init_metrics(app)
+
 if __name__ == '__main__':
     app.run_server(debug=True)
\ No newline at end of file
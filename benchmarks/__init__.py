@@ -0,0 +1,11 @@
+"""
+Benchmarks for the Video Game Sales Dashboard.
+
+Usage:
+    python -m benchmarks.run                         # all functions at 1x, 10x, 100x, 1000x
+    python -m benchmarks.run --scales 1 10 --functions clean_dataset filter_data
+    python -m benchmarks.compare <old.json> <new.json>
+    python -m benchmarks.load_test                   # callback throughput and latency
+    python -m benchmarks.memory                      # peak memory per callback
+    python -m benchmarks.cold_start                  # startup time against its budget
+"""
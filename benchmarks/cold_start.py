@@ -0,0 +1,355 @@
+"""
+Cold-start benchmark: time from launching a fresh Python process to the
+first response of the dashboard, checked against a committed budget.
+
+Each run starts a new interpreter with ``-X importtime``, imports ``app``
+(which loads, cleans and indexes the dataset and builds the layout) and
+serves the first page through the Flask test client: the index page, the
+Dash layout and dependencies, and the routing callback for the page. The
+time is broken down into phases:
+
+- interpreter: process launch until the driver starts running
+- imports: module imports made by ``import app``
+- data load: reading and validating the CSV
+- cleaning: clean_dataset
+- index build: the SharedDataset codes and year index (excluding the above)
+- app module: the rest of app.py (Dash app, blueprints, layout, metrics)
+- first response: the requests for the first page, including the modules
+  they import lazily (plotly's serializers, for one)
+
+Import time is also listed per package and per module, eager and lazy.
+Imports made lazily while loading data are counted in both their import and
+their phase. The medians over several runs are compared with the budget in
+benchmarks/startup_budget.json; any phase, package or the total over its
+budget fails the run (exit status 1).
+
+Usage:
+    python -m benchmarks.cold_start [--runs 5] [--budget benchmarks/startup_budget.json]
+                                    [--update-budget] [--output benchmarks/results]
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.run import git_commit, write_results
+from utils.constants import COLD_START_CONFIG
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PHASES = ['interpreter', 'imports', 'data load', 'cleaning', 'index build', 'app module', 'first response']
+
+# Repository packages are reported per module, everything else per top-level package
+LOCAL_PACKAGES = {'api', 'components', 'pages', 'utils'}
+
+_BEGIN = 'cold-start: begin'
+_RESULT = 'COLD_START '
+
+# Runs in the fresh interpreter. It only imports the standard library before
+# the marker, so every import of the app is reported after it.
+_DRIVER = '''
+import json, sys, time
+started = time.time()
+sys.stderr.write(%(begin)r + "\\n")
+
+phases = {}
+stack = []
+
+def timed(owner, attr, phase):
+    """Add the exclusive time of calls to owner.attr to a phase."""
+    func = getattr(owner, attr)
+    def wrapper(*args, **kwargs):
+        stack.append(0.0)
+        t = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - t
+            nested = stack.pop()
+            phases[phase] = phases.get(phase, 0.0) + elapsed - nested
+            if stack:
+                stack[-1] += elapsed
+    setattr(owner, attr, wrapper)
+
+import utils.data_loading as data_loading
+import utils.shared_data as shared_data
+timed(data_loading, '_load_vgsales_data_cached', 'data load')
+timed(data_loading, 'validate_dataset', 'data load')
+timed(shared_data, 'clean_dataset', 'cleaning')
+timed(shared_data.SharedDataset, '__init__', 'index build')
+
+import app
+
+t = time.perf_counter()
+client = app.server.test_client()
+for path in ['/', '/_dash-layout', '/_dash-dependencies']:
+    response = client.get(path)
+    assert response.status_code == 200, (path, response.status_code)
+response = client.post('/_dash-update-component', json={
+    'output': 'page-content.children',
+    'outputs': {'id': 'page-content', 'property': 'children'},
+    'inputs': [{'id': 'url', 'property': 'pathname', 'value': %(page)r}],
+    'changedPropIds': ['url.pathname'],
+    'state': []
+})
+assert response.status_code == 200, ('page-content', response.status_code)
+phases['first response'] = time.perf_counter() - t
+
+print(%(result)r + json.dumps({'started': started, 'ready': time.time(), 'phases': phases}), flush=True)
+'''
+
+_IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)')
+
+def parse_importtime(stderr: str) -> Tuple[Dict[str, float], float, Dict[str, float]]:
+    """
+    Read the ``-X importtime`` report of a run.
+
+    Args:
+        stderr (str): Standard error of the run
+
+    Returns:
+        Tuple[Dict[str, float], float, Dict[str, float]]: Self time in seconds
+        per module imported after the driver started and before ``app``
+        finished, the self time of ``app`` (its module body), and self time
+        per module imported lazily while serving the first response
+    """
+    modules, late = {}, {}
+    app_self, seen_begin, app_done = 0.0, False, False
+    for line in stderr.splitlines():
+        if line == _BEGIN:
+            seen_begin = True
+            continue
+        match = _IMPORT_LINE.match(line)
+        if not (seen_begin and match):
+            continue
+        self_us, _, indent, name = match.groups()
+        if name == 'app' and not indent and not app_done:
+            app_self, app_done = int(self_us) / 1e6, True
+            continue
+        target = late if app_done else modules
+        target[name] = target.get(name, 0.0) + int(self_us) / 1e6
+    return modules, app_self, late
+
+def package_of(module: str) -> str:
+    """Group a module under its repository module or third-party package."""
+    parts = module.split('.')
+    if parts[0] in LOCAL_PACKAGES:
+        return '.'.join(parts[:2])
+    return parts[0]
+
+def cold_start_once(page: str, timeout: float) -> Dict[str, Any]:
+    """
+    Measure one cold start in a fresh interpreter.
+
+    Args:
+        page (str): Page whose first response ends the cold start
+        timeout (float): Seconds before the run is abandoned
+
+    Returns:
+        Dict[str, Any]: 'total_s', 'phases' (seconds per phase), 'lazy_imports_s'
+        (imports made during the first response), and 'packages' and 'modules'
+        (import self time in seconds, eager and lazy)
+
+    Raises:
+        RuntimeError: If the app fails to start or serve the page
+    """
+    driver = _DRIVER % {'begin': _BEGIN, 'result': _RESULT, 'page': page}
+    env = dict(os.environ, PYTHONUNBUFFERED='1')
+    launched = time.time()
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', driver], cwd=ROOT, env=env,
+                          capture_output=True, text=True, timeout=timeout)
+    lines = [line for line in proc.stdout.splitlines() if line.startswith(_RESULT)]
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(f"Cold start failed (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+
+    result = json.loads(lines[-1][len(_RESULT):])
+    modules, app_self, late = parse_importtime(proc.stderr)
+    phases = {phase: result['phases'].get(phase, 0.0) for phase in PHASES}
+    phases['interpreter'] = result['started'] - launched
+    phases['imports'] = sum(modules.values())
+    data_phases = phases['data load'] + phases['cleaning'] + phases['index build']
+    phases['app module'] = max(app_self - data_phases, 0.0)
+
+    packages = defaultdict(float)
+    for module, seconds in list(modules.items()) + list(late.items()):
+        packages[package_of(module)] += seconds
+    return {
+        'total_s': result['ready'] - launched,
+        'phases': phases,
+        'lazy_imports_s': sum(late.values()),
+        'packages': dict(packages),
+        'modules': {**late, **modules}
+    }
+
+def _median(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    keys = {key for run in runs for key in run}
+    return {key: statistics.median(run.get(key, 0.0) for run in runs) for key in sorted(keys)}
+
+def run_cold_starts(runs: int, warmup_runs: int = None, page: str = None) -> Dict[str, Any]:
+    """
+    Measure several cold starts and summarize them.
+
+    Args:
+        runs (int): Measured runs
+        warmup_runs (int, optional): Untimed runs first (bytecode compilation)
+        page (str, optional): Page whose first response ends the cold start
+
+    Returns:
+        Dict[str, Any]: 'meta', medians of 'total_s', 'phases', 'lazy_imports_s',
+        'packages' and the slowest 'modules', and the raw 'runs'
+    """
+    warmup_runs = COLD_START_CONFIG['warmup_runs'] if warmup_runs is None else warmup_runs
+    page = page or COLD_START_CONFIG['page']
+    timeout = COLD_START_CONFIG['timeout']
+    for _ in range(warmup_runs):
+        cold_start_once(page, timeout)
+
+    measured = []
+    for i in range(runs):
+        measured.append(cold_start_once(page, timeout))
+        print(f"run {i + 1}/{runs}: {measured[-1]['total_s']:.2f}s", file=sys.stderr, flush=True)
+
+    modules = _median([run['modules'] for run in measured])
+    top = sorted(modules.items(), key=lambda item: -item[1])[:COLD_START_CONFIG['top_modules']]
+    commit, dirty = git_commit()
+    import pandas as pd
+    return {
+        'meta': {
+            'commit': commit,
+            'dirty': dirty,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'machine': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'page': page,
+            'runs': runs
+        },
+        'total_s': statistics.median(run['total_s'] for run in measured),
+        'phases': _median([run['phases'] for run in measured]),
+        'lazy_imports_s': statistics.median(run['lazy_imports_s'] for run in measured),
+        'packages': _median([run['packages'] for run in measured]),
+        'modules': dict(top),
+        'runs': [{key: run[key] for key in ('total_s', 'phases', 'lazy_imports_s', 'packages')}
+                 for run in measured]
+    }
+
+def check_budget(report: Dict[str, Any], budget: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Compare a report's medians with a budget.
+
+    Args:
+        report (Dict[str, Any]): Output of run_cold_starts
+        budget (Dict[str, Any]): 'total_s', 'phases' and 'packages' limits in seconds
+            (a missing entry is not checked)
+
+    Returns:
+        List[Dict[str, Any]]: 'name', 'measured_s' and 'budget_s' per exceeded limit
+    """
+    checks = [('total', report['total_s'], budget.get('total_s'))]
+    for section in ('phases', 'packages'):
+        for name, limit in budget.get(section, {}).items():
+            checks.append((f"{section[:-1]} {name}", report[section].get(name, 0.0), limit))
+    return [{'name': name, 'measured_s': measured, 'budget_s': limit}
+            for name, measured, limit in checks
+            if limit is not None and measured > limit]
+
+def budget_from_report(report: Dict[str, Any], headroom: float = None,
+                       min_package_s: float = 0.05) -> Dict[str, Any]:
+    """
+    Derive a budget from measured medians.
+
+    Args:
+        report (Dict[str, Any]): Output of run_cold_starts
+        headroom (float, optional): Multiple of the medians allowed
+        min_package_s (float): Packages importing faster than this are not budgeted
+
+    Returns:
+        Dict[str, Any]: Budget with 'total_s', 'phases' and 'packages'
+    """
+    headroom = headroom or COLD_START_CONFIG['budget_headroom']
+    # Small phases get at least 50 ms, so scheduler noise doesn't fail them
+    limit = lambda seconds: round(max(seconds * headroom, seconds + 0.05), 2)
+    return {
+        'machine': report['meta']['machine'],
+        'commit': report['meta']['commit'],
+        'total_s': limit(report['total_s']),
+        'phases': {name: limit(seconds) for name, seconds in report['phases'].items()},
+        'packages': {name: limit(seconds) for name, seconds in sorted(report['packages'].items())
+                     if seconds >= min_package_s}
+    }
+
+def print_report(report: Dict[str, Any], budget: Dict[str, Any] = None) -> None:
+    """Print the medians of a cold-start report next to their budget."""
+    budget = budget or {}
+
+    def row(name, seconds, limit):
+        limit_text = f"{limit:>9.2f}" if limit is not None else f"{'':>9}"
+        flag = '  OVER' if limit is not None and seconds > limit else ''
+        print(f"{name:<34} {seconds:>9.3f} {limit_text}{flag}")
+
+    print(f"Cold start to first response of {report['meta']['page']} "
+          f"(median of {report['meta']['runs']} runs)\n")
+    print(f"{'Phase':<34} {'Seconds':>9} {'Budget':>9}")
+    for name in PHASES:
+        row(name, report['phases'][name], budget.get('phases', {}).get(name))
+    print(f"  (first response includes {report['lazy_imports_s']:.3f}s of lazy imports)")
+    row('total', report['total_s'], budget.get('total_s'))
+
+    print(f"\n{'Imports by package':<34} {'Seconds':>9} {'Budget':>9}")
+    for name, seconds in sorted(report['packages'].items(), key=lambda item: -item[1]):
+        limit = budget.get('packages', {}).get(name)
+        if seconds >= 0.01 or limit is not None:
+            row(name, seconds, limit)
+
+    print(f"\n{'Slowest modules (self time)':<34} {'Seconds':>9}")
+    for name, seconds in report['modules'].items():
+        print(f"{name:<34} {seconds:>9.3f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the dashboard's cold start against a budget")
+    parser.add_argument('--runs', type=int, default=COLD_START_CONFIG['runs'], help="Measured runs")
+    parser.add_argument('--page', default=COLD_START_CONFIG['page'], help="Page to serve first")
+    parser.add_argument('--budget', default=COLD_START_CONFIG['budget_file'], help="Budget JSON")
+    parser.add_argument('--update-budget', action='store_true',
+                        help="Write a budget from this run's medians instead of checking it")
+    parser.add_argument('--output', help="Directory for the JSON report")
+    args = parser.parse_args()
+
+    report = run_cold_starts(args.runs, page=args.page)
+    budget_path = Path(args.budget)
+
+    if args.update_budget:
+        budget = budget_from_report(report)
+        with open(budget_path, 'w') as f:
+            json.dump(budget, f, indent=2)
+            f.write('\n')
+        print_report(report, budget)
+        print(f"\nBudget written to {budget_path}")
+        sys.exit(0)
+
+    budget = {}
+    if budget_path.exists():
+        with open(budget_path) as f:
+            budget = json.load(f)
+    print_report(report, budget)
+    print(f"\nReport written to {write_results(report, args.output, prefix='cold_start_')}")
+
+    exceeded = check_budget(report, budget) if budget else []
+    for item in exceeded:
+        print(f"OVER BUDGET {item['name']}: {item['measured_s']:.3f}s > {item['budget_s']:.2f}s")
+    if not budget:
+        print(f"No budget at {budget_path}; run with --update-budget to create one")
+    elif budget.get('machine') != report['meta']['machine']:
+        print(f"warning: the budget was measured on {budget.get('machine')}")
+    sys.exit(1 if exceeded else 0)
@@ -0,0 +1,103 @@
+"""
+Compare two benchmark result files from ``python -m benchmarks.run``.
+
+Prints the min time of every function and scale present in both runs with
+the new/old ratio. A change is flagged only when the ratio passes the
+threshold and the runs do not overlap (the new min is above the old median,
+or the new median below the old min), so noise on a shared machine is not
+reported as a regression. Exits with status 1 when any regression is found,
+so it can gate a CI job.
+
+Usage:
+    python -m benchmarks.compare <old.json> <new.json> [--threshold 1.10]
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List
+
+from utils.constants import BENCHMARK_CONFIG
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Read a benchmark result file.
+
+    Args:
+        path (str): JSON written by benchmarks.run
+
+    Returns:
+        Dict[str, Any]: 'meta' and 'results' of the run
+    """
+    with open(path) as f:
+        return json.load(f)
+
+def compare_results(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Pair up the timings of two runs.
+
+    Args:
+        old (Dict[str, Any]): Baseline run
+        new (Dict[str, Any]): Run to compare against the baseline
+        threshold (float): Ratio at which a change counts as a regression
+            (its inverse counts as an improvement) when the runs don't overlap
+
+    Returns:
+        List[Dict[str, Any]]: 'function', 'scale', 'old_s', 'new_s', 'ratio'
+        and 'status' ('regression', 'improvement' or '') per shared timing
+    """
+    baseline = {(row['function'], row['scale']): row for row in old['results']}
+    rows = []
+    for row in new['results']:
+        before = baseline.get((row['function'], row['scale']))
+        if before is None:
+            continue
+        ratio = row['min_s'] / before['min_s'] if before['min_s'] else float('inf')
+        delta_ms = abs(row['min_s'] - before['min_s']) * 1000
+        status = ''
+        if delta_ms < BENCHMARK_CONFIG['min_delta_ms']:
+            pass
+        elif ratio >= threshold and row['min_s'] > before['median_s']:
+            status = 'regression'
+        elif ratio <= 1 / threshold and row['median_s'] < before['min_s']:
+            status = 'improvement'
+        rows.append({
+            'function': row['function'],
+            'scale': row['scale'],
+            'old_s': before['min_s'],
+            'new_s': row['min_s'],
+            'ratio': ratio,
+            'status': status
+        })
+    return rows
+
+def _describe(meta: Dict[str, Any]) -> str:
+    dirty = ' (dirty)' if meta.get('dirty') else ''
+    return (f"{meta['commit'][:10]}{dirty} {meta['timestamp']} "
+            f"python {meta['python']}, pandas {meta['pandas']}, {meta['cpu_count']} CPUs")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs")
+    parser.add_argument('old', help="Baseline results JSON")
+    parser.add_argument('new', help="Results JSON to compare")
+    parser.add_argument('--threshold', type=float, default=BENCHMARK_CONFIG['regression_threshold'],
+                        help="New/old ratio flagged as a regression")
+    args = parser.parse_args()
+
+    old, new = load_results(args.old), load_results(args.new)
+    print(f"old: {_describe(old['meta'])}")
+    print(f"new: {_describe(new['meta'])}")
+    if old['meta'].get('machine') != new['meta'].get('machine'):
+        print("warning: runs are from different machines")
+    print()
+
+    rows = compare_results(old, new, args.threshold)
+    print(f"{'Function':<34} {'Scale':>6} {'Old ms':>11} {'New ms':>11} {'Ratio':>7}")
+    for row in rows:
+        print(f"{row['function']:<34} {row['scale']:>5}x {row['old_s'] * 1000:>11.2f} "
+              f"{row['new_s'] * 1000:>11.2f} {row['ratio']:>6.2f}x  {row['status']}")
+
+    regressions = [row for row in rows if row['status'] == 'regression']
+    print(f"\n{len(rows)} timings compared, {len(regressions)} regressions, "
+          f"{sum(row['status'] == 'improvement' for row in rows)} improvements")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,41 @@
+"""
+Scaled datasets for benchmarking.
+
+Scale 1 is the real vgsales.csv; scale N is a synthetic dataset of N times
+as many rows from utils.synthetic_data, which keeps the real platform, genre,
+publisher and sales distributions (including a growing publisher long tail).
+Files are generated once and reused until the source changes.
+"""
+
+from pathlib import Path
+
+from utils.constants import BENCHMARK_CONFIG
+from utils.synthetic_data import write_synthetic_dataset
+
+def _count_rows(path: str) -> int:
+    with open(path, 'rb') as f:
+        return sum(1 for _ in f) - 1
+
+def scaled_dataset_path(scale: int,
+                        source: str = "data/vgsales.csv",
+                        data_dir: str = None) -> Path:
+    """
+    Get the CSV of a scaled dataset, generating it on first use.
+
+    Args:
+        scale (int): Size as a multiple of the source rows
+        source (str): Real dataset to scale
+        data_dir (str, optional): Where scaled files are kept
+
+    Returns:
+        Path: CSV file with ``scale`` times the source rows
+    """
+    if scale == 1:
+        return Path(source)
+
+    data_dir = Path(data_dir or BENCHMARK_CONFIG['data_dir'])
+    path = data_dir / f"vgsales_{scale}x.csv"
+    if path.exists() and path.stat().st_mtime >= Path(source).stat().st_mtime:
+        return path
+    return write_synthetic_dataset(path, scale * _count_rows(source),
+                                   seed=BENCHMARK_CONFIG['seed'], source=source)
@@ -0,0 +1,587 @@
+"""
+HTTP load test of the dashboard's callback endpoint.
+
+Works against a running server the way a browser does: the app layout and
+callback graph come from ``/_dash-layout`` and ``/_dash-dependencies``, each
+page is rendered through the routing callback, and every server-side
+callback whose inputs and outputs are on a page gets request bodies for
+``/_dash-update-component`` synthesized from its components (dropdown
+options, slider and number ranges, date ranges, table paging/sorting/
+filtering, graph hover points), seeded for repeatability. A first pass
+calls each callback once with the page's initial values and keeps the
+outputs, so stores and figures that later callbacks read as state hold
+real values. Background callbacks are polled until they finish, as the
+renderer does, so their latency includes the queueing.
+
+The payloads are then replayed from a pool of threads for a fixed time or
+number of requests, and throughput, latency percentiles and error rates
+are reported per callback. Payloads can be saved to and replayed from a
+JSON lines file ({"callback": label, "body": request body} per line), which
+also accepts bodies copied from the browser's network tab.
+
+Without --url a local server is started (gunicorn with gunicorn.conf.py, or
+the Flask development server) and stopped afterwards; nothing external is
+contacted.
+
+Usage:
+    python -m benchmarks.load_test --concurrency 8 --duration 60
+    python -m benchmarks.load_test --url http://127.0.0.1:8050 --pages /genre /platform
+    python -m benchmarks.load_test --save payloads.jsonl --requests 0
+    python -m benchmarks.load_test --payloads payloads.jsonl --output load.json
+"""
+
+import argparse
+import datetime as dt
+import http.client
+import itertools
+import json
+import logging
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+import numpy as np
+
+from benchmarks.run import git_commit
+from utils.constants import LOAD_TEST_CONFIG
+
+logger = logging.getLogger(__name__)
+
+UPDATE_PATH = '/_dash-update-component'
+
+class Client:
+    """Keep-alive JSON client for one server (one per thread)."""
+
+    def __init__(self, base_url: str, timeout: float = None):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.timeout = timeout or LOAD_TEST_CONFIG['timeout']
+        self.connection = None
+
+    def request(self, method: str, path: str, body: Any = None) -> Tuple[int, bytes]:
+        """
+        Send a request, reconnecting once if the kept-alive connection was dropped.
+
+        Returns:
+            Tuple[int, bytes]: Status code and response body
+        """
+        payload = None if body is None else json.dumps(body).encode()
+        headers = {'Content-Type': 'application/json'} if payload is not None else {}
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            try:
+                self.connection.request(method, path, body=payload, headers=headers)
+                response = self.connection.getresponse()
+                return response.status, response.read()
+            except (ConnectionError, http.client.BadStatusLine):
+                # The server closed an idle keep-alive connection
+                self.close()
+                if attempt:
+                    raise
+
+    def get_json(self, path: str) -> Any:
+        status, data = self.request('GET', path)
+        if status != 200:
+            raise RuntimeError(f"GET {path} returned {status}")
+        return json.loads(data)
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+class InProcessClient(Client):
+    """Client for a Flask app in this process (same interface as Client)."""
+
+    def __init__(self, server, timeout: float = None):
+        self.test_client = server.test_client()
+        self.timeout = timeout or LOAD_TEST_CONFIG['timeout']
+
+    def request(self, method: str, path: str, body: Any = None) -> Tuple[int, bytes]:
+        response = self.test_client.open(path, method=method, json=body)
+        return response.status_code, response.get_data()
+
+    def close(self) -> None:
+        pass
+
+def call_callback(client: Client,body: Dict[str, Any], poll_interval: float = 0.5) -> Tuple[int, bytes]:
+    """
+    Call a callback, polling background callbacks until they return.
+
+    Args:
+        client (Client): Connection to the server
+        body (Dict[str, Any]): ``/_dash-update-component`` request body
+        poll_interval (float): Seconds between polls of a background callback
+
+    Returns:
+        Tuple[int, bytes]: Final status code (200, or 204 for no update) and body
+    """
+    status, data = client.request('POST', UPDATE_PATH, body)
+    if status != 200:
+        return status, data
+    result = json.loads(data)
+    if 'cacheKey' not in result:
+        return status, data
+
+    # Background callback: the first response only names the job
+    query = urlencode({'cacheKey': result['cacheKey'], 'job': result['job']})
+    deadline = time.monotonic() + client.timeout
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        status, data = client.request('POST', f"{UPDATE_PATH}?{query}", body)
+        if status != 200 or 'response' in json.loads(data):
+            return status, data
+    return 504, b'background callback did not finish'
+
+def _split_output(output: str) -> List[Dict[str, str]]:
+    """Output ids of a callback spec, as the renderer sends them."""
+    parts = output[2:-2].split('...') if output.startswith('..') else [output]
+    return [dict(zip(('id', 'property'), part.rsplit('.', 1))) for part in parts]
+
+def _label(page: str, dep: Dict[str, Any]) -> str:
+    """Readable callback name: page, first output and how many more there are."""
+    outputs = _split_output(dep['output'])
+    first = f"{outputs[0]['id']}.{outputs[0]['property'].split('@')[0]}"
+    return f"{page} {first}" + (f" +{len(outputs) - 1}" if len(outputs) > 1 else '')
+
+def _walk(node: Any, components: Dict[str, Dict[str, Any]]) -> None:
+    """Index every component with an id in a serialized layout tree."""
+    if isinstance(node, list):
+        for child in node:
+            _walk(child, components)
+    elif isinstance(node, dict):
+        if 'props' in node and 'type' in node:
+            props = node['props']
+            if isinstance(props.get('id'), str):
+                components[props['id']] = node
+            _walk(list(props.values()), components)
+        else:
+            _walk(list(node.values()), components)
+
+def _option_values(options: Any) -> List[Any]:
+    if isinstance(options, dict):
+        return list(options)
+    return [option['value'] if isinstance(option, dict) else option for option in options or []]
+
+class PayloadBuilder:
+    """
+    Synthesizes callback request bodies for the pages of a running app.
+    """
+
+    def __init__(self, client: Client, seed: int = None):
+        self.client = client
+        self.page = None
+        self.rng = random.Random(LOAD_TEST_CONFIG['seed'] if seed is None else seed)
+        self.errors: List[str] = []  # Failed initial calls while building
+        self.shell: Dict[str, Dict[str, Any]] = {}
+        _walk(client.get_json('/_dash-layout'), self.shell)
+        self.dependencies = [
+            dep for dep in client.get_json('/_dash-dependencies')
+            if not dep.get('clientside_function')
+            and not any(out['id'] in LOAD_TEST_CONFIG['exclude_outputs'] for out in _split_output(dep['output']))
+        ]
+        self.router = next(dep for dep in self.dependencies
+                           if dep['output'] == LOAD_TEST_CONFIG['router_output'])
+
+    def _value(self, components: Dict[str, Dict[str, Any]], component_id: str, prop: str) -> Any:
+        if component_id == 'url' and prop == 'pathname':
+            return self.page
+        if f"{component_id}.{prop}" in LOAD_TEST_CONFIG['client_values']:
+            return LOAD_TEST_CONFIG['client_values'][f"{component_id}.{prop}"]
+        component = components.get(component_id)
+        return None if component is None else component['props'].get(prop)
+
+    def _body(self, dep: Dict[str, Any], components: Dict[str, Dict[str, Any]],
+              values: Dict[str, Any] = None, changed: str = None) -> Dict[str, Any]:
+        """Request body for a callback with the current (or overridden) values."""
+        values = values or {}
+
+        def entries(items):
+            return [{'id': item['id'], 'property': item['property'],
+                     'value': values.get(f"{item['id']}.{item['property']}",
+                                         self._value(components, item['id'], item['property']))}
+                    for item in items]
+
+        body = {
+            'output': dep['output'],
+            'outputs': _split_output(dep['output']) if dep['output'].startswith('..')
+            else _split_output(dep['output'])[0],
+            'inputs': entries(dep['inputs']),
+            'changedPropIds': [changed or f"{dep['inputs'][0]['id']}.{dep['inputs'][0]['property']}"]
+        }
+        if dep['state']:
+            body['state'] = entries(dep['state'])
+        return body
+
+    def _generate(self, component: Dict[str, Any], prop: str, current: Any) -> Any:
+        """A new value a user could give a component property."""
+        rng = self.rng
+        kind, props = component['type'], component['props']
+
+        if prop in ('n_clicks', 'n_intervals'):
+            return (current or 0) + rng.randint(1, 10)
+        if prop == 'value':
+            options = _option_values(props.get('options'))
+            if kind == 'RangeSlider':
+                return sorted(rng.randint(int(props['min']), int(props['max'])) for _ in range(2))
+            if kind == 'Slider':
+                return rng.randint(int(props['min']), int(props['max']))
+            if options and (props.get('multi') or kind == 'Checklist'):
+                return rng.sample(options, rng.randint(1, min(3, len(options))))
+            if options:
+                return rng.choice(options)
+            if kind == 'Input' and props.get('type') == 'number' and 'min' in props and 'max' in props:
+                return rng.randint(int(props['min']), int(props['max']))
+            if kind == 'Input' and props.get('type', 'text') == 'text':
+                return rng.choice(LOAD_TEST_CONFIG['text_values'])
+            return current
+        if kind == 'DatePickerRange' and prop in ('start_date', 'end_date'):
+            low = dt.date.fromisoformat(str(props['min_date_allowed'])[:10])
+            high = dt.date.fromisoformat(str(props['max_date_allowed'])[:10])
+            return (low + dt.timedelta(days=rng.randint(0, (high - low).days))).isoformat()
+        if kind == 'DataTable':
+            if prop == 'page_current':
+                return rng.randint(0, max(0, (props.get('page_count') or 10) - 1))
+            if prop == 'sort_by':
+                column = rng.choice(props.get('columns') or [{'id': None}])['id']
+                return rng.choice([[], [{'column_id': column, 'direction': rng.choice(['asc', 'desc'])}]])
+            if prop == 'filter_query':
+                return rng.choice(LOAD_TEST_CONFIG['filter_queries'])
+        if kind == 'Graph' and prop in ('hoverData', 'clickData'):
+            traces = [trace for trace in (props.get('figure') or {}).get('data', []) if trace.get('customdata')]
+            if traces:
+                curve = rng.randrange(len(traces))
+                point = rng.randrange(len(traces[curve]['customdata']))
+                return {'points': [{'curveNumber': curve, 'pointNumber': point,
+                                    'customdata': traces[curve]['customdata'][point]}]}
+        return current
+
+    @staticmethod
+    def _order_ranges(values: Dict[str, Any]) -> None:
+        """Keep generated start/end pairs (years, dates) in order."""
+        for key in list(values):
+            if 'start' not in key:
+                continue
+            other = key.replace('start', 'end')
+            low, high = values.get(key), values.get(other)
+            if other in values and low is not None and high is not None and type(low) == type(high) and low > high:
+                values[key], values[other] = high, low
+
+    def _apply(self, components: Dict[str, Dict[str, Any]], data: bytes) -> None:
+        """Store a callback response's outputs, as the renderer would."""
+        for component_id, props in json.loads(data).get('response', {}).items():
+            component = components.setdefault(component_id, {'type': '', 'props': {'id': component_id}})
+            for prop, value in props.items():
+                component['props'][prop.split('@')[0]] = value
+                _walk(value, components)
+
+    def build(self, pages: List[str], variants: int) -> List[Dict[str, Any]]:
+        """
+        Synthesize request bodies for every server-side callback of the pages.
+
+        Args:
+            pages (List[str]): Routes to visit
+            variants (int): Bodies per callback with randomized inputs
+
+        Returns:
+            List[Dict[str, Any]]: {'callback': label, 'body': request body} items,
+            plus 'interval' (seconds between polls) for background callbacks.
+            Initial calls that failed are listed in ``errors``.
+        """
+        payloads = []
+        for page in pages:
+            self.page = page
+            components = {key: json.loads(json.dumps(value)) for key, value in self.shell.items()}
+
+            # Navigation itself is a callback, and renders the page layout
+            router_body = self._body(self.router, components)
+            payloads.append({'callback': f"{page} (page load)", 'body': router_body})
+            status, data = call_callback(self.client, router_body)
+            if status != 200:
+                raise RuntimeError(f"Rendering {page} returned {status}")
+            self._apply(components, data)
+
+            for dep in self.dependencies:
+                if dep is self.router:
+                    continue
+                needed = [item['id'] for item in dep['inputs']]
+                needed += [out['id'] for out in _split_output(dep['output'])]
+                if not all(component_id in components or component_id == 'url' for component_id in needed):
+                    continue
+
+                item = {'callback': _label(page, dep)}
+                if dep.get('long'):
+                    item['interval'] = dep['long'].get('interval', 1000) / 1000
+
+                # Initial call with the layout's values; keep its outputs as later state
+                initial = self._body(dep, components)
+                status, data = call_callback(self.client, initial, item.get('interval', 0.5))
+                if status == 200:
+                    self._apply(components, data)
+                elif status != 204:
+                    self.errors.append(f"{item['callback']} (initial call) {status}: "
+                                       f"{data[:200].decode(errors='replace')}")
+                if not dep.get('prevent_initial_call'):
+                    payloads.append({**item, 'body': initial})
+
+                for _ in range(variants):
+                    values = {}
+                    for dependency in dep['inputs']:
+                        component_id, prop = dependency['id'], dependency['property']
+                        if component_id in components:
+                            values[f"{component_id}.{prop}"] = self._generate(
+                                components[component_id], prop, components[component_id]['props'].get(prop))
+                    self._order_ranges(values)
+                    changed = self.rng.choice(list(values)) if values else None
+                    payloads.append({**item, 'body': self._body(dep, components, values, changed)})
+        return payloads
+
+def run_load(base_url: str,
+             payloads: List[Dict[str, Any]],
+             concurrency: int,
+             duration: Optional[float] = None,
+             requests: Optional[int] = None,
+             poll_interval: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Replay payloads from concurrent clients and collect per-callback timings.
+
+    Args:
+        base_url (str): Server to load
+        payloads (List[Dict[str, Any]]): Items from PayloadBuilder.build
+        concurrency (int): Parallel clients
+        duration (float, optional): Seconds to run for
+        requests (int, optional): Total requests to send instead of a duration
+        poll_interval (float, optional): Override for background callback polling
+
+    Returns:
+        Dict[str, Any]: 'elapsed_s' and per-callback 'latencies', 'errors',
+        'no_update' counts and 'bytes'
+    """
+    order = list(payloads)
+    random.Random(LOAD_TEST_CONFIG['seed']).shuffle(order)
+    counter = itertools.count()
+    lock = threading.Lock()
+    stats = defaultdict(lambda: {'latencies': [], 'errors': 0, 'no_update': 0, 'bytes': 0, 'error_samples': []})
+    started = time.monotonic()
+    deadline = started + duration if duration else None
+
+    def worker():
+        client = Client(base_url)
+        try:
+            while True:
+                index = next(counter)
+                if (requests and index >= requests) or (deadline and time.monotonic() >= deadline):
+                    return
+                item = order[index % len(order)]
+                call_started = time.perf_counter()
+                try:
+                    status, data = call_callback(client, item['body'], poll_interval or item.get('interval', 0.5))
+                except (OSError, http.client.HTTPException) as e:
+                    client.close()
+                    status, data = 0, str(e).encode()
+                elapsed = time.perf_counter() - call_started
+                with lock:
+                    entry = stats[item['callback']]
+                    entry['latencies'].append(elapsed)
+                    entry['bytes'] += len(data)
+                    if status == 204:
+                        entry['no_update'] += 1
+                    elif status != 200:
+                        entry['errors'] += 1
+                        if len(entry['error_samples']) < 3:
+                            entry['error_samples'].append(f"{status}: {data[:200].decode(errors='replace')}")
+        finally:
+            client.close()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {'elapsed_s': time.monotonic() - started, 'callbacks': dict(stats)}
+
+def summarize(run: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Per-callback throughput, latency percentiles and error rates.
+
+    Args:
+        run (Dict[str, Any]): Output of run_load
+
+    Returns:
+        List[Dict[str, Any]]: One row per callback, slowest p90 first, then a
+        'total' row
+    """
+    elapsed = run['elapsed_s']
+    rows = []
+
+    def row(name, latencies, errors, no_update, size, samples):
+        seconds = np.asarray(latencies) * 1000
+        return {
+            'callback': name,
+            'requests': len(latencies),
+            'rps': len(latencies) / elapsed if elapsed else 0.0,
+            'errors': errors,
+            'error_rate': errors / len(latencies) if latencies else 0.0,
+            'no_update': no_update,
+            'p50_ms': float(np.percentile(seconds, 50)) if latencies else 0.0,
+            'p90_ms': float(np.percentile(seconds, 90)) if latencies else 0.0,
+            'p99_ms': float(np.percentile(seconds, 99)) if latencies else 0.0,
+            'max_ms': float(seconds.max()) if latencies else 0.0,
+            'mean_kb': size / len(latencies) / 1024 if latencies else 0.0,
+            'error_samples': samples
+        }
+
+    for name, entry in run['callbacks'].items():
+        rows.append(row(name, entry['latencies'], entry['errors'], entry['no_update'],
+                        entry['bytes'], entry['error_samples']))
+    rows.sort(key=lambda r: r['p90_ms'], reverse=True)
+
+    entries = run['callbacks'].values()
+    rows.append(row('total', [x for e in entries for x in e['latencies']], sum(e['errors'] for e in entries),
+                    sum(e['no_update'] for e in entries), sum(e['bytes'] for e in entries), []))
+    return rows
+
+def start_server(server: str, port: int) -> subprocess.Popen:
+    """
+    Start the dashboard locally and wait until it serves its layout.
+
+    Args:
+        server (str): 'gunicorn' (production setup) or 'flask' (development server)
+        port (int): Port to bind on 127.0.0.1
+
+    Returns:
+        subprocess.Popen: The server process
+    """
+    if server == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '--bind', f"127.0.0.1:{port}"]
+    else:
+        command = [sys.executable, '-c',
+                   f"from app import server; server.run(host='127.0.0.1', port={port}, threaded=True)"]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    client = Client(f"http://127.0.0.1:{port}", timeout=5)
+    deadline = time.monotonic() + LOAD_TEST_CONFIG['startup_timeout']
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{server} exited with status {process.returncode} during startup")
+        try:
+            if client.request('GET', '/_dash-layout')[0] == 200:
+                return process
+        except OSError:
+            pass
+        client.close()
+        time.sleep(0.5)
+    stop_server(process)
+    raise RuntimeError(f"{server} did not start within {LOAD_TEST_CONFIG['startup_timeout']}s")
+
+def stop_server(process: subprocess.Popen) -> None:
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+def read_payloads(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def print_report(rows: List[Dict[str, Any]], elapsed: float, concurrency: int) -> None:
+    print(f"\n{concurrency} clients for {elapsed:.1f}s\n")
+    print(f"{'Callback':<58} {'Reqs':>6} {'Req/s':>7} {'Err %':>6} {'p50 ms':>8} "
+          f"{'p90 ms':>8} {'p99 ms':>8} {'Max ms':>8} {'KB':>7}")
+    for r in rows:
+        print(f"{r['callback'][:58]:<58} {r['requests']:>6} {r['rps']:>7.1f} {r['error_rate'] * 100:>6.1f} "
+              f"{r['p50_ms']:>8.1f} {r['p90_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['max_ms']:>8.1f} {r['mean_kb']:>7.1f}")
+    for r in rows:
+        for sample in r['error_samples']:
+            print(f"  {r['callback']}: {sample}")
+
+    total = rows[-1]
+    if total['errors']:
+        print(f"\n{total['errors']} of {total['requests']} requests failed ({total['error_rate']:.1%})")
+    else:
+        print(f"\nAll {total['requests']} requests returned 200 or 204")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the dashboard's callbacks")
+    parser.add_argument('--url', help="Server to test (default: start one locally)")
+    parser.add_argument('--server', choices=['gunicorn', 'flask'], default='gunicorn',
+                        help="Local server to start when no --url is given")
+    parser.add_argument('--port', type=int, default=LOAD_TEST_CONFIG['port'])
+    parser.add_argument('--pages', nargs='+', default=LOAD_TEST_CONFIG['pages'], help="Routes to exercise")
+    parser.add_argument('--concurrency', type=int, default=LOAD_TEST_CONFIG['concurrency'])
+    parser.add_argument('--duration', type=float, default=LOAD_TEST_CONFIG['duration'],
+                        help="Seconds to run for")
+    parser.add_argument('--requests', type=int, help="Total requests instead of a duration (0: only build payloads)")
+    parser.add_argument('--variants', type=int, default=LOAD_TEST_CONFIG['variants'],
+                        help="Synthesized bodies per callback")
+    parser.add_argument('--seed', type=int, help="Seed for the synthesized inputs")
+    parser.add_argument('--poll-interval', type=float, help="Seconds between background callback polls")
+    parser.add_argument('--payloads', help="Replay bodies from this JSON lines file instead of synthesizing")
+    parser.add_argument('--save', help="Write the synthesized bodies to this JSON lines file")
+    parser.add_argument('--output', help="Write the report as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    process = None if args.url else start_server(args.server, args.port)
+    base_url = args.url or f"http://127.0.0.1:{args.port}"
+    try:
+        build_errors = []
+        if args.payloads:
+            payloads = list(read_payloads(args.payloads))
+        else:
+            builder = PayloadBuilder(Client(base_url), args.seed)
+            payloads = builder.build(args.pages, args.variants)
+            builder.client.close()
+            build_errors = builder.errors
+            for error in build_errors:
+                logger.error(error)
+        callbacks = len({item['callback'] for item in payloads})
+        logger.info(f"{len(payloads)} payloads for {callbacks} callbacks")
+        if args.save:
+            with open(args.save, 'w') as f:
+                for item in payloads:
+                    f.write(json.dumps(item) + '\n')
+        if args.requests == 0:
+            sys.exit(1 if build_errors else 0)
+
+        run = run_load(base_url, payloads, args.concurrency,
+                       duration=None if args.requests else args.duration,
+                       requests=args.requests, poll_interval=args.poll_interval)
+    finally:
+        if process is not None:
+            stop_server(process)
+
+    rows = summarize(run)
+    print_report(rows, run['elapsed_s'], args.concurrency)
+    if args.output:
+        commit, dirty = git_commit()
+        with open(args.output, 'w') as f:
+            json.dump({
+                'meta': {
+                    'commit': commit,
+                    'dirty': dirty,
+                    'timestamp': dt.datetime.now().isoformat(timespec='seconds'),
+                    'url': base_url,
+                    'server': None if args.url else args.server,
+                    'concurrency': args.concurrency,
+                    'elapsed_s': run['elapsed_s'],
+                    'pages': None if args.payloads else args.pages,
+                    'payloads': args.payloads,
+                    'build_errors': build_errors
+                },
+                'callbacks': rows
+            }, f, indent=2)
+    if build_errors:
+        print(f"{len(build_errors)} initial calls failed while building payloads")
+    sys.exit(1 if rows[-1]['errors'] or build_errors else 0)
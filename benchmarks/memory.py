@@ -0,0 +1,459 @@
+"""
+Per-page memory profile of the dashboard's callbacks, run in-process.
+
+The app is imported under tracemalloc (the startup phase, where the dataset
+is loaded and cleaned), then each page is driven through the Flask test
+client with the same seeded request bodies as the load test (see
+benchmarks.load_test.PayloadBuilder). Background callbacks run inline, and
+the background result cache and prerendered layouts point at empty
+temporary directories, so every call does its real work on every run.
+
+Each call is measured twice, and the worst call of each callback a third time:
+
+- peak RSS: the kernel's high-water mark is reset before the call (Linux
+  /proc/self/clear_refs) and read after it, without tracemalloc running
+- Python allocations: the exact tracemalloc peak, traced one frame deep
+- attribution: the worst call again with deep tracebacks (which slow calls
+  down tens of times) and a sampled snapshot near its peak, whose live
+  allocations are attributed to categories (clean_dataset, masks, pivots,
+  groupby, figure construction, other pandas or numpy work) and to the
+  innermost line of dashboard code that made them
+
+Reports are JSON in benchmarks/results (memory_*.json). Pass --baseline to
+compare against an earlier report; the exit status is 1 when any callback's
+peak grew past the regression threshold.
+
+Usage:
+    python -m benchmarks.memory [--pages / /genre] [--variants 5] [--baseline old.json]
+"""
+
+import argparse
+import contextlib
+import gc
+import inspect
+import io
+import json
+import logging
+import os
+import platform
+import re
+import sys
+import tempfile
+import threading
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import psutil
+
+from benchmarks.run import git_commit, write_results
+from utils.constants import (
+    BACKGROUND_CALLBACK_CONFIG,
+    MEMORY_PROFILE_CONFIG,
+    PRERENDER_CONFIG
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MB = 1024 * 1024
+# Wrappers every callback passes through; allocations are attributed past them
+PLUMBING = tuple(os.path.join(ROOT, path) for path in ('benchmarks', 'utils/metrics.py', 'utils/profiling.py'))
+
+def _function_range(func: Callable) -> Optional[Tuple[str, int, int]]:
+    """Source file and line span of a function, for matching traceback frames."""
+    try:
+        func = inspect.unwrap(func)
+        lines, start = inspect.getsourcelines(func)
+        return os.path.abspath(inspect.getsourcefile(func)), start, start + len(lines) - 1
+    except (TypeError, OSError):
+        return None
+
+class AllocationClassifier:
+    """
+    Attributes tracemalloc tracebacks to a category and a dashboard code line.
+
+    Categories are checked in priority order against every frame of the
+    traceback, so a mask computed while building a figure counts as figure
+    construction.
+    """
+
+    def __init__(self):
+        from pandas.core import algorithms
+        from pandas.core.ops import array_ops
+        from utils.data_processing import clean_dataset
+
+        def functions(*funcs):
+            return [span for span in map(_function_range, funcs) if span]
+
+        sep = os.sep
+        self.rules = [
+            ('clean_dataset', functions(clean_dataset), []),
+            ('figures', [], [f"{sep}plotly{sep}"]),
+            ('pivots', [], [f"pandas{sep}core{sep}reshape{sep}pivot.py",
+                            f"pandas{sep}core{sep}reshape{sep}reshape.py"]),
+            ('masks', functions(array_ops.comparison_op, array_ops.logical_op, algorithms.isin,
+                                pd.DataFrame._getitem_bool_array,
+                                getattr(pd.Series, '_get_rows_with_mask', pd.Series.__getitem__)),
+             [f"pandas{sep}core{sep}arraylike.py"]),
+            ('groupby', [], [f"pandas{sep}core{sep}groupby{sep}"]),
+            ('pandas', [], [f"{sep}pandas{sep}"]),
+            ('numpy', [], [f"{sep}numpy{sep}"])
+        ]
+        self._frames: Dict[Tuple[str, int], int] = {}
+        self._cache: Dict[Any, Tuple[str, str]] = {}
+
+    def _frame_rank(self, frame) -> int:
+        """Priority of the first category a frame belongs to (len(rules) for none)."""
+        key = (frame.filename, frame.lineno)
+        rank = self._frames.get(key)
+        if rank is None:
+            rank = next((rank for rank, (_, spans, paths) in enumerate(self.rules)
+                         if any(frame.filename == path and start <= frame.lineno <= end
+                                for path, start, end in spans)
+                         or any(part in frame.filename for part in paths)), len(self.rules))
+            self._frames[key] = rank
+        return rank
+
+    def classify(self, traceback) -> Tuple[str, str]:
+        """
+        Category and dashboard code site of one allocation.
+
+        Returns:
+            Tuple[str, str]: Category name and 'path:line' of the innermost
+            frame in the dashboard's own code (or the innermost frame)
+        """
+        cached = self._cache.get(traceback)
+        if cached is not None:
+            return cached
+
+        rank = min(self._frame_rank(frame) for frame in traceback)
+        category = self.rules[rank][0] if rank < len(self.rules) else 'other'
+        # tracemalloc tracebacks run from the oldest frame to the most recent
+        site_frame = next((frame for frame in reversed(traceback)
+                           if frame.filename.startswith(ROOT)
+                           and not frame.filename.startswith(PLUMBING)),
+                          traceback[-1])
+        site = f"{os.path.relpath(site_frame.filename, ROOT)}:{site_frame.lineno}"
+        self._cache[traceback] = (category, site)
+        return category, site
+
+    def summarize(self, snapshot: Optional[tracemalloc.Snapshot], top: int) -> Dict[str, Any]:
+        """Bytes per category and the largest sites among a snapshot's live allocations."""
+        categories, sites = defaultdict(int), defaultdict(int)
+        site_categories = defaultdict(lambda: defaultdict(int))
+        for trace in (snapshot.traces if snapshot else []):
+            category, site = self.classify(trace.traceback)
+            categories[category] += trace.size
+            sites[site] += trace.size
+            site_categories[site][category] += trace.size
+        largest = sorted(sites.items(), key=lambda item: item[1], reverse=True)[:top]
+        site_category = {site: max(site_categories[site].items(), key=lambda item: item[1])[0]
+                         for site, _ in largest}
+        return {
+            'categories_mb': {name: size / MB for name, size in
+                              sorted(categories.items(), key=lambda item: item[1], reverse=True)},
+            'top_sites': [{'site': site, 'mb': size / MB, 'category': site_category[site]}
+                          for site, size in largest]
+        }
+
+class PeakSnapshot:
+    """
+    Context manager tracing a call's allocations with a snapshot near its peak.
+
+    A sampling thread checks the traced total every ``interval`` seconds and
+    takes a snapshot each time it passes the last one by 5% (at least
+    ``min_step`` bytes). The peak itself is exact (tracemalloc tracks it);
+    the snapshot used for attribution is the largest one sampled, which
+    misses only allocations freed again within one sampling interval.
+    """
+
+    def __init__(self, min_step: int, interval: float):
+        self.min_step = min_step
+        self.interval = interval
+        self.best = 0
+        self.snapshot = None
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _check(self):
+        current = tracemalloc.get_traced_memory()[0]
+        if current >= self.best + max(self.min_step, self.best // 20):
+            self.best = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self._check()
+
+    def __enter__(self):
+        tracemalloc.clear_traces()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        if self.snapshot is None:
+            # Too quick to be sampled: attribute what the call left allocated
+            self.snapshot = tracemalloc.take_snapshot()
+        self._check()
+        self.peak = tracemalloc.get_traced_memory()[1]
+        return False
+
+def _status_kb(field: str) -> Optional[int]:
+    try:
+        with open('/proc/self/status') as f:
+            match = re.search(rf'^{field}:\s+(\d+) kB', f.read(), re.MULTILINE)
+    except OSError:
+        return None
+    return int(match.group(1)) if match else None
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's RSS high-water mark for this process (Linux only)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+def measure_rss(func: Callable[[], Any]) -> Dict[str, Optional[float]]:
+    """
+    Peak and retained RSS growth of one call, in MB.
+
+    Returns:
+        Dict[str, Optional[float]]: 'rss_peak_mb' (None where the peak
+        cannot be reset) and 'rss_retained_mb'
+    """
+    process = psutil.Process()
+    gc.collect()
+    before = process.memory_info().rss
+    resettable = _reset_peak_rss()
+    func()
+    peak_kb = _status_kb('VmHWM') if resettable else None
+    gc.collect()
+    return {
+        'rss_peak_mb': (peak_kb * 1024 - before) / MB if peak_kb is not None else None,
+        'rss_retained_mb': (process.memory_info().rss - before) / MB
+    }
+
+def import_app(classifier_top: int) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Import the app with tracemalloc on and caches pointed at empty directories.
+
+    Returns:
+        Tuple[Any, Dict[str, Any]]: The Dash app and the startup entry
+    """
+    BACKGROUND_CALLBACK_CONFIG['cache_dir'] = tempfile.mkdtemp(prefix='vgsales-memory-background-')
+    PRERENDER_CONFIG['output_dir'] = tempfile.mkdtemp(prefix='vgsales-memory-prerender-')
+
+    # Only the app's own startup is traced, not importing the libraries
+    import dash  # noqa: F401
+    import dash_bootstrap_components  # noqa: F401
+    import plotly.express  # noqa: F401
+
+    tracemalloc.start(MEMORY_PROFILE_CONFIG['frames'])
+    process = psutil.Process()
+    before = process.memory_info().rss
+    _reset_peak_rss()
+    with PeakSnapshot(MEMORY_PROFILE_CONFIG['snapshot_step'], MEMORY_PROFILE_CONFIG['sample_interval']) as tracker, \
+            contextlib.redirect_stdout(io.StringIO()):
+        from app import app
+    peak_kb = _status_kb('VmHWM')
+    classifier = AllocationClassifier()
+    startup = {
+        'callback': 'startup (import app)',
+        'page': None,
+        'calls': 1,
+        'rss_peak_mb': (peak_kb * 1024 - before) / MB if peak_kb is not None else None,
+        'rss_retained_mb': (process.memory_info().rss - before) / MB,
+        'traced_peak_mb': tracker.peak / MB,
+        'traced_peak_mean_mb': tracker.peak / MB,
+        **classifier.summarize(tracker.snapshot, classifier_top)
+    }
+    tracemalloc.stop()
+    return app, startup
+
+def _run_inline(manager) -> None:
+    """Run background callback jobs synchronously in this process."""
+    def call_job_fn(key, job_fn, args, context):
+        job_fn(key, manager._make_progress_key(key), args, context)
+        return -1
+
+    manager.call_job_fn = call_job_fn
+    manager.job_running = lambda job: False
+    manager.terminate_job = lambda job: None
+
+def profile_pages(pages: List[str], variants: int, seed: int = None) -> Dict[str, Any]:
+    """
+    Profile every callback on the given pages.
+
+    Args:
+        pages (List[str]): Routes to drive
+        variants (int): Synthesized request bodies per callback
+        seed (int, optional): Seed for the request bodies
+
+    Returns:
+        Dict[str, Any]: 'meta', 'startup', 'callbacks' (worst call per
+        callback) and 'pages' (largest peaks and retained growth per page)
+    """
+    from benchmarks.load_test import InProcessClient, PayloadBuilder, call_callback
+
+    top = MEMORY_PROFILE_CONFIG['top_sites']
+    app, startup = import_app(top)
+    _run_inline(app._background_manager)
+    classifier = AllocationClassifier()
+    client = InProcessClient(app.server)
+
+    callbacks, page_rows = [], []
+    for page in pages:
+        # The first pass over a page also warms the dataset and its indexes
+        payloads = PayloadBuilder(client, seed).build([page], variants)
+        page_rss = psutil.Process().memory_info().rss
+
+        by_callback = defaultdict(list)
+        for item in payloads:
+            by_callback[item['callback']].append(item)
+
+        for label, items in by_callback.items():
+            measurements = []
+            for item in items:
+                measurement = measure_rss(lambda: call_callback(client, item['body'], 0))
+                # One frame per allocation is enough for an exact peak and is cheap
+                tracemalloc.start(1)
+                gc.collect()
+                tracemalloc.clear_traces()
+                call_callback(client, item['body'], 0)
+                measurement.update(traced_peak=tracemalloc.get_traced_memory()[1], item=item)
+                tracemalloc.stop()
+                measurements.append(measurement)
+
+            # Deep tracebacks are costly, so only the worst call is attributed
+            worst = max(measurements, key=lambda m: m['traced_peak'])
+            tracemalloc.start(MEMORY_PROFILE_CONFIG['frames'])
+            gc.collect()
+            with PeakSnapshot(MEMORY_PROFILE_CONFIG['snapshot_step'], MEMORY_PROFILE_CONFIG['sample_interval']) as tracker:
+                call_callback(client, worst['item']['body'], 0)
+            tracemalloc.stop()
+            print(f"{label}: {len(measurements)} calls", file=sys.stderr, flush=True)
+
+            rss_peaks = [m['rss_peak_mb'] for m in measurements if m['rss_peak_mb'] is not None]
+            callbacks.append({
+                'callback': label,
+                'page': page,
+                'calls': len(measurements),
+                'rss_peak_mb': max(rss_peaks) if rss_peaks else None,
+                'rss_retained_mb': sum(m['rss_retained_mb'] for m in measurements),
+                'traced_peak_mb': worst['traced_peak'] / MB,
+                'traced_peak_mean_mb': float(np.mean([m['traced_peak'] for m in measurements])) / MB,
+                **classifier.summarize(tracker.snapshot, top)
+            })
+            del measurements, worst, tracker
+
+        gc.collect()
+        rows = [row for row in callbacks if row['page'] == page]
+        rss_peaks = [row['rss_peak_mb'] for row in rows if row['rss_peak_mb'] is not None]
+        page_rows.append({
+            'page': page,
+            'callbacks': len(rows),
+            'rss_peak_mb': max(rss_peaks) if rss_peaks else None,
+            'traced_peak_mb': max((row['traced_peak_mb'] for row in rows), default=0.0),
+            'rss_retained_mb': (psutil.Process().memory_info().rss - page_rss) / MB
+        })
+
+    commit, dirty = git_commit()
+    import plotly
+    return {
+        'meta': {
+            'commit': commit,
+            'dirty': dirty,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'plotly': plotly.__version__,
+            'machine': platform.platform(),
+            'pages': pages,
+            'variants': variants,
+            'frames': MEMORY_PROFILE_CONFIG['frames']
+        },
+        'startup': startup,
+        'callbacks': callbacks,
+        'pages': page_rows
+    }
+
+def compare_reports(old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Callbacks whose peak memory grew past the regression threshold.
+
+    Both the traced Python peak and the RSS peak are checked; a change
+    counts when it exceeds the ratio and the minimum in MB.
+
+    Returns:
+        List[Dict[str, Any]]: 'callback', 'metric', 'old_mb' and 'new_mb' per regression
+    """
+    threshold, min_mb = MEMORY_PROFILE_CONFIG['regression_threshold'], MEMORY_PROFILE_CONFIG['regression_min_mb']
+    baseline = {row['callback']: row for row in [old['startup']] + old['callbacks']}
+    regressions = []
+    for row in [new['startup']] + new['callbacks']:
+        before = baseline.get(row['callback'])
+        if before is None:
+            continue
+        for metric in ('traced_peak_mb', 'rss_peak_mb'):
+            if before[metric] is None or row[metric] is None:
+                continue
+            if row[metric] > before[metric] * threshold and row[metric] - before[metric] > min_mb:
+                regressions.append({'callback': row['callback'], 'metric': metric,
+                                    'old_mb': before[metric], 'new_mb': row[metric]})
+    return regressions
+
+def _mb(value: Optional[float]) -> str:
+    return 'n/a' if value is None else f"{value:.1f}"
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"\n{'Callback':<58} {'Calls':>5} {'RSS peak':>9} {'Py peak':>8} {'Py mean':>8}  Largest category")
+    for row in [report['startup']] + report['callbacks']:
+        category = next(iter(row['categories_mb'].items()), ('-', 0.0))
+        print(f"{row['callback'][:58]:<58} {row['calls']:>5} {_mb(row['rss_peak_mb']):>9} "
+              f"{row['traced_peak_mb']:>8.1f} {row['traced_peak_mean_mb']:>8.1f}  "
+              f"{category[0]} ({category[1]:.1f})")
+
+    print(f"\n{'Page':<12} {'Callbacks':>9} {'RSS peak':>9} {'Py peak':>8} {'Retained':>9}  (MB)")
+    for row in report['pages']:
+        print(f"{row['page']:<12} {row['callbacks']:>9} {_mb(row['rss_peak_mb']):>9} "
+              f"{row['traced_peak_mb']:>8.1f} {row['rss_retained_mb']:>9.1f}")
+
+    heaviest = sorted([report['startup']] + report['callbacks'],
+                      key=lambda row: row['traced_peak_mb'], reverse=True)[:5]
+    for row in heaviest:
+        print(f"\n{row['callback']}: " + ", ".join(f"{name} {size:.1f}" for name, size in row['categories_mb'].items()))
+        for site in row['top_sites'][:5]:
+            print(f"    {site['mb']:>7.1f} MB  {site['site']:<40} {site['category']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile the memory of each page's callbacks")
+    parser.add_argument('--pages', nargs='+', default=MEMORY_PROFILE_CONFIG['pages'], help="Routes to drive")
+    parser.add_argument('--variants', type=int, default=MEMORY_PROFILE_CONFIG['variants'],
+                        help="Synthesized request bodies per callback")
+    parser.add_argument('--seed', type=int, help="Seed for the request bodies")
+    parser.add_argument('--baseline', help="Earlier memory report to compare against")
+    parser.add_argument('--output', help="Directory for the JSON report")
+    args = parser.parse_args()
+
+    # The app's own logging would only add noise (and allocations) here
+    logging.disable(logging.WARNING)
+    report = profile_pages(args.pages, args.variants, args.seed)
+    print_report(report)
+    print(f"\nReport written to {write_results(report, args.output, prefix='memory_')}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_reports(json.load(f), report)
+        for regression in regressions:
+            print(f"REGRESSION {regression['callback']} {regression['metric']}: "
+                  f"{regression['old_mb']:.1f} -> {regression['new_mb']:.1f} MB")
+        print(f"{len(regressions)} memory regressions against {args.baseline}")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,233 @@
+"""
+Time every public function of utils/data_loading.py and utils/data_processing.py
+on datasets scaled 1x, 10x, 100x and 1000x from vgsales.csv.
+
+Results are written as JSON (one file per run, named after the git commit)
+so runs can be compared across commits with ``python -m benchmarks.compare``.
+
+Usage:
+    python -m benchmarks.run [--scales 1 10 100 1000] [--functions NAME ...]
+                             [--min-time 0.5] [--rounds 3] [--output benchmarks/results]
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.datasets import scaled_dataset_path
+from utils import data_loading, data_processing
+from utils.constants import BENCHMARK_CONFIG
+
+logger = logging.getLogger(__name__)
+
+def _benchmarks(raw: pd.DataFrame, clean: pd.DataFrame, path: Path) -> Dict[str, Callable[[], Any]]:
+    """
+    Zero-argument calls of every public function, in module order.
+
+    Functions taking the dataset get the raw frame where the app passes raw
+    data (validation, cleaning, loading) and the cleaned frame otherwise.
+    """
+    years = (int(clean['Year'].min()), int(clean['Year'].max()))
+    mid = (years[0] + years[1]) // 2
+    top_platforms = clean['Platform'].value_counts().index[:3].tolist()
+    total_sales = float(clean['Global_Sales'].sum())
+
+    def load():
+        # Measure the read itself, not the lru_cache
+        data_loading.clear_data_cache()
+        return data_loading.load_vgsales_data(str(path))
+
+    return {
+        # utils/data_loading.py
+        'validate_dataset': lambda: data_loading.validate_dataset(raw),
+        'load_vgsales_data': load,
+        'get_unique_values': lambda: data_loading.get_unique_values(clean),
+        'get_year_range': lambda: data_loading.get_year_range(clean),
+        'get_sales_summary': lambda: data_loading.get_sales_summary(clean),
+        'filter_data': lambda: data_loading.filter_data(
+            clean, year_range=(mid - 5, mid + 5), platforms=top_platforms),
+        'get_dataset_fingerprint': lambda: data_loading.get_dataset_fingerprint(str(path)),
+        # utils/data_processing.py
+        'calculate_total_sales': lambda: data_processing.calculate_total_sales(clean),
+        'get_unique_counts': lambda: data_processing.get_unique_counts(clean),
+        'clean_dataset': lambda: data_processing.clean_dataset(raw),
+        'preprocess_overview_data': lambda: data_processing.preprocess_overview_data(clean),
+        'preprocess_sales_data': lambda: data_processing.preprocess_sales_data(clean),
+        'preprocess_genre_data': lambda: data_processing.preprocess_genre_data(clean),
+        'preprocess_platform_data': lambda: data_processing.preprocess_platform_data(clean),
+        'preprocess_publisher_data': lambda: data_processing.preprocess_publisher_data(clean),
+        'calculate_market_share': lambda: data_processing.calculate_market_share(clean, 'Publisher'),
+        'analyze_time_trends': lambda: data_processing.analyze_time_trends(clean, 'Genre'),
+        'calculate_regional_distribution': lambda: data_processing.calculate_regional_distribution(clean),
+        'get_top_performers': lambda: data_processing.get_top_performers(clean, 'Name', 'Global_Sales', 10),
+        'get_yearly_trends': lambda: data_processing.get_yearly_trends(clean),
+        'get_genre_trends': lambda: data_processing.get_genre_trends(clean),
+        'get_platform_trends': lambda: data_processing.get_platform_trends(clean),
+        'format_sales': lambda: data_processing.format_sales(total_sales),
+        'get_top_games': lambda: data_processing.get_top_games(clean),
+        'get_top_publishers': lambda: data_processing.get_top_publishers(clean),
+        'get_top_genres': lambda: data_processing.get_top_genres(clean),
+        'calculate_growth_rates': lambda: data_processing.calculate_growth_rates(clean),
+        'calculate_yoy_growth': lambda: data_processing.calculate_yoy_growth(clean),
+        'analyze_publisher_performance': lambda: data_processing.analyze_publisher_performance(clean),
+        'analyze_genre_performance': lambda: data_processing.analyze_genre_performance(clean)
+    }
+
+def time_call(func: Callable[[], Any], min_time: float, max_repeats: int) -> List[float]:
+    """
+    Time repeated calls until ``min_time`` has been spent (at least one call).
+
+    Args:
+        func (Callable): Zero-argument call to time
+        min_time (float): Seconds to keep repeating for
+        max_repeats (int): Upper bound on calls
+
+    Returns:
+        List[float]: Seconds per call
+    """
+    times = []
+    gc.collect()
+    while len(times) < max_repeats and (not times or sum(times) < min_time):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return times
+
+def git_commit() -> Tuple[str, bool]:
+    """Current commit hash and whether the working tree has changes."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+    return commit, dirty
+
+def run_benchmarks(scales: List[int],
+                   functions: List[str] = None,
+                   min_time: float = None,
+                   max_repeats: int = None,
+                   rounds: int = None) -> Dict[str, Any]:
+    """
+    Run the benchmarks at each scale.
+
+    Args:
+        scales (List[int]): Dataset scale factors
+        functions (List[str], optional): Subset of function names to run
+        min_time (float, optional): Seconds to repeat each function for
+        max_repeats (int, optional): Upper bound on calls per function
+        rounds (int, optional): Passes over all functions per scale
+
+    Returns:
+        Dict[str, Any]: 'meta' (commit, versions, machine) and 'results'
+        (function, scale, rows, repeats and min/median/mean seconds)
+    """
+    min_time = BENCHMARK_CONFIG['min_time'] if min_time is None else min_time
+    max_repeats = max_repeats or BENCHMARK_CONFIG['max_repeats']
+    rounds = rounds or BENCHMARK_CONFIG['rounds']
+    commit, dirty = git_commit()
+    results = []
+
+    for scale in scales:
+        path = scaled_dataset_path(scale)
+        data_loading.clear_data_cache()
+        raw = data_loading.load_vgsales_data(str(path))
+        clean = data_processing.clean_dataset(raw)
+        benchmarks = _benchmarks(raw, clean, path)
+        unknown = set(functions or []) - set(benchmarks)
+        if unknown:
+            raise ValueError(f"Unknown functions: {sorted(unknown)}")
+
+        # Interleave rounds over all functions so a slow stretch on a shared
+        # machine is spread across functions instead of hitting one of them
+        selected = {name: func for name, func in benchmarks.items() if not functions or name in functions}
+        times = {name: [] for name in selected}
+        for _ in range(rounds):
+            for name, func in selected.items():
+                times[name] += time_call(func, min_time / rounds, max(1, max_repeats // rounds))
+
+        for name, samples in times.items():
+            results.append({
+                'function': name,
+                'scale': scale,
+                'rows': len(raw),
+                'repeats': len(samples),
+                'min_s': min(samples),
+                'median_s': statistics.median(samples),
+                'mean_s': statistics.mean(samples)
+            })
+            print(f"{name:<34} {scale:>5}x {len(raw):>12,} rows "
+                  f"{min(samples) * 1000:>11.2f} ms (min of {len(samples)})", flush=True)
+
+        del raw, clean, benchmarks
+        data_loading.clear_data_cache()
+
+    return {
+        'meta': {
+            'commit': commit,
+            'dirty': dirty,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'machine': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'cpu_count': os.cpu_count(),
+            'scales': scales,
+            'min_time': min_time,
+            'rounds': rounds
+        },
+        'results': results
+    }
+
+def write_results(report: Dict[str, Any], output_dir: str = None, prefix: str = '') -> Path:
+    """
+    Write a benchmark report as JSON named after its commit and time.
+
+    Args:
+        report (Dict[str, Any]): Report with 'meta' holding 'timestamp', 'commit' and 'dirty'
+        output_dir (str, optional): Directory for result files
+        prefix (str): File name prefix telling report kinds apart
+
+    Returns:
+        Path: The written file
+    """
+    output_dir = Path(output_dir or BENCHMARK_CONFIG['results_dir'])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    meta = report['meta']
+    stamp = datetime.fromisoformat(meta['timestamp']).strftime('%Y%m%d-%H%M%S')
+    suffix = '-dirty' if meta['dirty'] else ''
+    path = output_dir / f"{prefix}{stamp}_{meta['commit'][:10]}{suffix}.json"
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the data loading and processing functions")
+    parser.add_argument('--scales', type=int, nargs='+', default=BENCHMARK_CONFIG['scales'],
+                        help="Dataset scale factors relative to vgsales.csv")
+    parser.add_argument('--functions', nargs='+', help="Only run these functions")
+    parser.add_argument('--min-time', type=float, help="Seconds to repeat each function for")
+    parser.add_argument('--rounds', type=int, help="Passes over all functions per scale")
+    parser.add_argument('--output', help="Directory for the JSON results")
+    args = parser.parse_args()
+
+    # Keep the data layer's warnings out of the timings and the output
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    logging.getLogger('utils').setLevel(logging.ERROR)
+
+    report = run_benchmarks(args.scales, args.functions, args.min_time, rounds=args.rounds)
+    print(f"Results written to {write_results(report, args.output)}")
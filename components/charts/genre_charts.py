@@ -4,6 +4,10 @@ import plotly.graph_objects as go
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output
+from utils.charts_config import ChartConfigurator, GROUP_PLACEHOLDER
+from utils.animation import share_race
+from utils.cube import get_sales_cube
+from utils.downsampling import downsample_series
 
 def create_genre_sales_chart(df):
     """
@@ -17,22 +21,30 @@ def create_genre_sales_chart(df):
     """
     genre_sales = df.groupby('Genre')['Global_Sales'].sum().sort_values(ascending=True)
     
-    fig = go.Figure(go.Bar(
-        x=genre_sales.values,
-        y=genre_sales.index,
-        orientation='h',
-        text=genre_sales.values.round(1),
-        textposition='outside',
-        hovertemplate="<b>%{y}</b><br>Global Sales: %{x:.1f}M units<extra></extra>"
-    ))
-    
-    fig.update_layout(
-        title='Global Sales by Genre',
-        xaxis_title='Global Sales (Millions)',
-        yaxis_title=None,
-        template='plotly_white',
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    def build():
+        fig = go.Figure(go.Bar(
+            x=[],
+            y=[],
+            orientation='h',
+            text=[],
+            textposition='outside',
+            hovertemplate="<b>%{y}</b><br>Global Sales: %{x:.1f}M units<extra></extra>"
+        ))
+        
+        fig.update_layout(
+            title='Global Sales by Genre',
+            xaxis_title='Global Sales (Millions)',
+            yaxis_title=None,
+            template='plotly_white',
+            margin=dict(l=20, r=20, t=40, b=20)
+        )
+        return fig
+    
+    fig = ChartConfigurator.from_skeleton('genre_sales', build, [{
+        'x': genre_sales.values,
+        'y': genre_sales.index,
+        'text': genre_sales.values.round(1)
+    }])
     
     return dcc.Graph(figure=fig, id='genre-sales-chart')
 
@@ -47,71 +59,108 @@ def create_genre_timeline(df):
         dcc.Graph: Plotly line chart wrapped in a Dash component
     """
     timeline_data = df.groupby(['Year', 'Genre'])['Global_Sales'].sum().reset_index()
-    
-    fig = px.line(
-        timeline_data,
-        x='Year',
-        y='Global_Sales',
-        color='Genre',
-        title='Genre Popularity Trends Over Time',
-        labels={'Global_Sales': 'Global Sales (Millions)', 'Year': 'Release Year'}
-    )
-    
-    fig.update_layout(
-        template='plotly_white',
-        hovermode='x unified',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
+    timeline_data = downsample_series(timeline_data, 'Year', 'Global_Sales', group='Genre')
+    
+    def build():
+        fig = px.line(
+            pd.DataFrame({'Year': [0.0], 'Global_Sales': [0.0], 'Genre': [GROUP_PLACEHOLDER]}),
+            x='Year',
+            y='Global_Sales',
+            color='Genre',
+            title='Genre Popularity Trends Over Time',
+            labels={'Global_Sales': 'Global Sales (Millions)', 'Year': 'Release Year'}
         )
-    )
+        
+        fig.update_layout(
+            template='plotly_white',
+            hovermode='x unified',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            )
+        )
+        return fig
+    
+    traces = ChartConfigurator.grouped_line_traces('genre_timeline', build, timeline_data,
+                                                   'Year', 'Global_Sales', 'Genre')
+    fig = ChartConfigurator.from_skeleton('genre_timeline', build, traces)
     
     return dcc.Graph(figure=fig, id='genre-timeline')
 
-def create_genre_platform_distribution(df, regions):
+def create_genre_share_race(top_n=10, cumulative=False):
+    """
+    Create an animated year-by-year race of the leading genres' share of global sales
+    
+    Args:
+        top_n (int): Number of genres shown in each year
+        cumulative (bool): Share of all sales up to each year instead of within the year
+    
+    Returns:
+        dcc.Graph: Animated Plotly bar chart wrapped in a Dash component
+    """
+    return dcc.Graph(figure=share_race('Genre', top_n, cumulative), id='genre-share-race')
+
+def create_genre_platform_distribution(df, regions, year_range=None):
     """
     Create a heatmap showing genre success across different platforms
     
     Args:
         df (pd.DataFrame): The video games sales dataframe
+        year_range (Tuple[float, float], optional): Read the matrix for this
+            inclusive year range from the sales cube instead of aggregating
+            df, which must then be the full dataset filtered to those years
     
     Returns:
         dcc.Graph: Plotly heatmap wrapped in a Dash component
     """
-    # Get top 10 platforms by total sales
-    top_platforms = df.groupby('Platform')['Global_Sales'].sum().nlargest(10).index
-    
-    # Calculate average sales for each genre-platform combination
-    platform_genre = df[df['Platform'].isin(top_platforms)].pivot_table(
-        values='Global_Sales',
-        index='Genre',
-        columns='Platform',
-        aggfunc='mean'
-    ).fillna(0)
-    
-    fig = go.Figure(data=go.Heatmap(
-        z=platform_genre.values,
-        x=platform_genre.columns,
-        y=platform_genre.index,
-        colorscale='Viridis',
-        hoverongaps=False,
-        hovertemplate=(
-            "Genre: %{y}<br>"
-            "Platform: %{x}<br>"
-            "Avg Sales: %{z:.2f}M units<extra></extra>"
+    if year_range is not None:
+        cube = get_sales_cube()
+        top_platforms = cube.totals('Platform', year_range).nlargest(10).index
+        platform_genre = cube.matrix('Genre', 'Platform', year_range, aggfunc='mean',
+                                     labels={'Platform': top_platforms}).fillna(0)
+    else:
+        # Get top 10 platforms by total sales
+        top_platforms = df.groupby('Platform')['Global_Sales'].sum().nlargest(10).index
+        
+        # Calculate average sales for each genre-platform combination
+        platform_genre = df[df['Platform'].isin(top_platforms)].pivot_table(
+            values='Global_Sales',
+            index='Genre',
+            columns='Platform',
+            aggfunc='mean'
+        ).fillna(0)
+    
+    def build():
+        fig = go.Figure(data=go.Heatmap(
+            z=[],
+            x=[],
+            y=[],
+            colorscale='Viridis',
+            hoverongaps=False,
+            hovertemplate=(
+                "Genre: %{y}<br>"
+                "Platform: %{x}<br>"
+                "Avg Sales: %{z:.2f}M units<extra></extra>"
+            )
+        ))
+        
+        fig.update_layout(
+            title='Average Game Sales by Genre and Platform',
+            template='plotly_white',
+            xaxis_title=None,
+            yaxis_title=None,
+            margin=dict(l=20, r=20, t=40, b=20)
         )
-    ))
+        return fig
     
-    fig.update_layout(
-        title='Average Game Sales by Genre and Platform',
-        template='plotly_white',
-        xaxis_title=None,
-        yaxis_title=None,
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    fig = ChartConfigurator.from_skeleton('genre_platform_heatmap', build, [{
+        'z': platform_genre.values,
+        'x': platform_genre.columns,
+        'y': platform_genre.index
+    }])
     
     return dcc.Graph(figure=fig, id='genre-platform-heatmap')
 
@@ -134,7 +183,6 @@ def create_genre_regional_analysis(df):
     })
     
     # Create stacked bar chart
-    fig = go.Figure()
     regions = {
         'NA_Sales': 'North America',
         'EU_Sales': 'Europe',
@@ -142,28 +190,35 @@ def create_genre_regional_analysis(df):
         'Other_Sales': 'Other'
     }
     
-    for col, name in regions.items():
-        fig.add_trace(go.Bar(
-            name=name,
-            x=genre_regional.index,
-            y=genre_regional[col],
-            hovertemplate="%{x}<br>%{y:.1f}M units<extra></extra>"
-        ))
-    
-    fig.update_layout(
-        title='Regional Sales Distribution by Genre',
-        xaxis_title=None,
-        yaxis_title='Sales (Millions)',
-        template='plotly_white',
-        barmode='stack',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
+    def build():
+        fig = go.Figure()
+        for name in regions.values():
+            fig.add_trace(go.Bar(
+                name=name,
+                x=[],
+                y=[],
+                hovertemplate="%{x}<br>%{y:.1f}M units<extra></extra>"
+            ))
+        
+        fig.update_layout(
+            title='Regional Sales Distribution by Genre',
+            xaxis_title=None,
+            yaxis_title='Sales (Millions)',
+            template='plotly_white',
+            barmode='stack',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            )
         )
-    )
+        return fig
+    
+    fig = ChartConfigurator.from_skeleton('genre_regional_share', build, [
+        {'x': genre_regional.index, 'y': genre_regional[col]} for col in regions
+    ])
     
     return dcc.Graph(figure=fig, id='genre-regional-share')
 
@@ -180,78 +235,101 @@ def create_top_games_by_genre(df, genre):
     """
     genre_games = df[df['Genre'] == genre].nlargest(10, 'Global_Sales')
     
-    fig = px.bar(
-        genre_games,
-        x='Global_Sales',
-        y='Name',
-        orientation='h',
-        title=f'Top 10 {genre} Games',
-        labels={'Global_Sales': 'Global Sales (Millions)', 'Name': 'Game Title'}
-    )
-    
-    fig.update_traces(
-        texttemplate='%{x:.1f}M',
-        textposition='outside',
-        hovertemplate=(
-            "<b>%{y}</b><br>"
-            "Platform: %{customdata[0]}<br>"
-            "Sales: %{x:.1f}M units<extra></extra>"
-        ),
-        customdata=genre_games[['Platform']]
-    )
-    
-    fig.update_layout(
-        template='plotly_white',
-        showlegend=False,
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    def build():
+        fig = px.bar(
+            genre_games.iloc[:0],
+            x='Global_Sales',
+            y='Name',
+            orientation='h',
+            labels={'Global_Sales': 'Global Sales (Millions)', 'Name': 'Game Title'}
+        )
+        
+        fig.update_traces(
+            texttemplate='%{x:.1f}M',
+            textposition='outside',
+            hovertemplate=(
+                "<b>%{y}</b><br>"
+                "Platform: %{customdata[0]}<br>"
+                "Sales: %{x:.1f}M units<extra></extra>"
+            )
+        )
+        
+        fig.update_layout(
+            template='plotly_white',
+            showlegend=False,
+            margin=dict(l=20, r=20, t=40, b=20)
+        )
+        return fig
+    
+    fig = ChartConfigurator.from_skeleton('genre_top_games', build, [{
+        'x': genre_games['Global_Sales'].to_numpy(),
+        'y': genre_games['Name'].to_numpy(),
+        'customdata': genre_games[['Platform']].to_numpy()
+    }], {'title': {'text': f'Top 10 {genre} Games'}})
     
     return dcc.Graph(figure=fig, id=f'top-games-{genre.lower()}')
 
-def create_genre_publisher_affinity(df):
+def create_genre_publisher_affinity(df, year_range=None):
     """
     Create a heatmap showing publisher affinity for different genres
     
     Args:
         df (pd.DataFrame): The video games sales dataframe
+        year_range (Tuple[float, float], optional): Read the matrix for this
+            inclusive year range from the sales cube instead of aggregating
+            df, which must then be the full dataset filtered to those years
     
     Returns:
         dcc.Graph: Plotly heatmap wrapped in a Dash component
     """
-    # Get top 10 publishers by total sales
-    top_publishers = df.groupby('Publisher')['Global_Sales'].sum().nlargest(10).index
-    
-    # Calculate the percentage of each publisher's games in each genre
-    publisher_genre = df[df['Publisher'].isin(top_publishers)].pivot_table(
-        values='Global_Sales',
-        index='Publisher',
-        columns='Genre',
-        aggfunc='sum'
-    ).fillna(0)
+    if year_range is not None:
+        cube = get_sales_cube()
+        top_publishers = cube.totals('Publisher', year_range).nlargest(10).index
+        publisher_genre = cube.matrix('Publisher', 'Genre', year_range,
+                                      labels={'Publisher': top_publishers}).fillna(0)
+    else:
+        # Get top 10 publishers by total sales
+        top_publishers = df.groupby('Publisher')['Global_Sales'].sum().nlargest(10).index
+        
+        # Calculate the percentage of each publisher's games in each genre
+        publisher_genre = df[df['Publisher'].isin(top_publishers)].pivot_table(
+            values='Global_Sales',
+            index='Publisher',
+            columns='Genre',
+            aggfunc='sum'
+        ).fillna(0)
     
     # Convert to percentages
     publisher_genre_pct = publisher_genre.div(publisher_genre.sum(axis=1), axis=0) * 100
     
-    fig = go.Figure(data=go.Heatmap(
-        z=publisher_genre_pct.values,
-        x=publisher_genre_pct.columns,
-        y=publisher_genre_pct.index,
-        colorscale='Viridis',
-        hoverongaps=False,
-        hovertemplate=(
-            "Publisher: %{y}<br>"
-            "Genre: %{x}<br>"
-            "Percentage: %{z:.1f}%<extra></extra>"
+    def build():
+        fig = go.Figure(data=go.Heatmap(
+            z=[],
+            x=[],
+            y=[],
+            colorscale='Viridis',
+            hoverongaps=False,
+            hovertemplate=(
+                "Publisher: %{y}<br>"
+                "Genre: %{x}<br>"
+                "Percentage: %{z:.1f}%<extra></extra>"
+            )
+        ))
+        
+        fig.update_layout(
+            title='Publisher Genre Affinity (Top 10 Publishers)',
+            template='plotly_white',
+            xaxis_title=None,
+            yaxis_title=None,
+            margin=dict(l=20, r=20, t=40, b=20)
         )
-    ))
-    
-    fig.update_layout(
-        title='Publisher Genre Affinity (Top 10 Publishers)',
-        template='plotly_white',
-        xaxis_title=None,
-        yaxis_title=None,
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+        return fig
+    
+    fig = ChartConfigurator.from_skeleton('genre_publisher_heatmap', build, [{
+        'z': publisher_genre_pct.values,
+        'x': publisher_genre_pct.columns,
+        'y': publisher_genre_pct.index
+    }])
     
     return dcc.Graph(figure=fig, id='genre-publisher-heatmap')
 
@@ -4,6 +4,10 @@ import plotly.graph_objects as go
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output
+from utils.charts_config import ChartConfigurator, GROUP_PLACEHOLDER
+from utils.animation import share_race
+from utils.cube import get_sales_cube
+from utils.downsampling import downsample_series
 
 def create_platform_sales_chart(df):
     """
@@ -17,22 +21,30 @@ def create_platform_sales_chart(df):
     """
     platform_sales = df.groupby('Platform')['Global_Sales'].sum().sort_values(ascending=True)
     
-    fig = go.Figure(go.Bar(
-        x=platform_sales.values,
-        y=platform_sales.index,
-        orientation='h',
-        text=platform_sales.values.round(1),
-        textposition='outside',
-        hovertemplate="<b>%{y}</b><br>Global Sales: %{x:.1f}M units<extra></extra>"
-    ))
-    
-    fig.update_layout(
-        title='Global Sales by Platform',
-        xaxis_title='Global Sales (Millions)',
-        yaxis_title=None,
-        template='plotly_white',
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    def build():
+        fig = go.Figure(go.Bar(
+            x=[],
+            y=[],
+            orientation='h',
+            text=[],
+            textposition='outside',
+            hovertemplate="<b>%{y}</b><br>Global Sales: %{x:.1f}M units<extra></extra>"
+        ))
+        
+        fig.update_layout(
+            title='Global Sales by Platform',
+            xaxis_title='Global Sales (Millions)',
+            yaxis_title=None,
+            template='plotly_white',
+            margin=dict(l=20, r=20, t=40, b=20)
+        )
+        return fig
+    
+    fig = ChartConfigurator.from_skeleton('platform_sales', build, [{
+        'x': platform_sales.values,
+        'y': platform_sales.index,
+        'text': platform_sales.values.round(1)
+    }])
     
     return dcc.Graph(figure=fig, id='platform-sales-chart')
 
@@ -51,74 +63,113 @@ def create_platform_timeline(df):
     
     # Create yearly sales data for top platforms
     timeline_data = df[df['Platform'].isin(top_platforms)].groupby(['Year', 'Platform'])['Global_Sales'].sum().reset_index()
-    
-    fig = px.line(
-        timeline_data,
-        x='Year',
-        y='Global_Sales',
-        color='Platform',
-        title='Sales Trends by Platform Over Time',
-        labels={'Global_Sales': 'Global Sales (Millions)', 'Year': 'Release Year'}
-    )
-    
-    fig.update_layout(
-        template='plotly_white',
-        hovermode='x unified',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
+    timeline_data = downsample_series(timeline_data, 'Year', 'Global_Sales', group='Platform')
+    
+    def build():
+        fig = px.line(
+            pd.DataFrame({'Year': [0.0], 'Global_Sales': [0.0], 'Platform': [GROUP_PLACEHOLDER]}),
+            x='Year',
+            y='Global_Sales',
+            color='Platform',
+            title='Sales Trends by Platform Over Time',
+            labels={'Global_Sales': 'Global Sales (Millions)', 'Year': 'Release Year'}
+        )
+        
+        fig.update_layout(
+            template='plotly_white',
+            hovermode='x unified',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            )
         )
-    )
+        return fig
+    
+    traces = ChartConfigurator.grouped_line_traces('platform_timeline', build, timeline_data,
+                                                   'Year', 'Global_Sales', 'Platform')
+    fig = ChartConfigurator.from_skeleton('platform_timeline', build, traces)
     
     return dcc.Graph(figure=fig, id='platform-timeline')
 
-def create_platform_genre_distribution(df):
+def create_platform_share_race(top_n=10, cumulative=False):
+    """
+    Create an animated year-by-year race of the leading platforms' share of global sales
+    
+    Args:
+        top_n (int): Number of platforms shown in each year
+        cumulative (bool): Share of all sales up to each year instead of within the year
+    
+    Returns:
+        dcc.Graph: Animated Plotly bar chart wrapped in a Dash component
+    """
+    return dcc.Graph(figure=share_race('Platform', top_n, cumulative), id='platform-share-race')
+
+def create_platform_genre_distribution(df, year_range=None, platforms=None):
     """
     Create a heatmap showing genre distribution across platforms
     
     Args:
         df (pd.DataFrame): The video games sales dataframe
+        year_range (Tuple[float, float], optional): Read the matrix for this
+            inclusive year range from the sales cube instead of aggregating
+            df, which must then be the full dataset filtered to those years
+        platforms (list, optional): With year_range, the platforms df was
+            filtered to (None for all platforms)
     
     Returns:
         dcc.Graph: Plotly heatmap wrapped in a Dash component
     """
-    # Get top 15 platforms by total sales
-    top_platforms = df.groupby('Platform')['Global_Sales'].sum().nlargest(15).index
-    
-    # Calculate genre distribution for each platform
-    platform_genre = df[df['Platform'].isin(top_platforms)].pivot_table(
-        values='Global_Sales',
-        index='Platform',
-        columns='Genre',
-        aggfunc='sum'
-    ).fillna(0)
+    if year_range is not None:
+        cube = get_sales_cube()
+        top_platforms = cube.totals('Platform', year_range, labels=platforms).nlargest(15).index
+        platform_genre = cube.matrix('Platform', 'Genre', year_range,
+                                     labels={'Platform': top_platforms}).fillna(0)
+    else:
+        # Get top 15 platforms by total sales
+        top_platforms = df.groupby('Platform')['Global_Sales'].sum().nlargest(15).index
+        
+        # Calculate genre distribution for each platform
+        platform_genre = df[df['Platform'].isin(top_platforms)].pivot_table(
+            values='Global_Sales',
+            index='Platform',
+            columns='Genre',
+            aggfunc='sum'
+        ).fillna(0)
     
     # Convert to percentages
     platform_genre_pct = platform_genre.div(platform_genre.sum(axis=1), axis=0) * 100
     
-    fig = go.Figure(data=go.Heatmap(
-        z=platform_genre_pct.values,
-        x=platform_genre_pct.columns,
-        y=platform_genre_pct.index,
-        colorscale='Viridis',
-        hoverongaps=False,
-        hovertemplate=(
-            "Platform: %{y}<br>"
-            "Genre: %{x}<br>"
-            "Percentage: %{z:.1f}%<extra></extra>"
+    def build():
+        fig = go.Figure(data=go.Heatmap(
+            z=[],
+            x=[],
+            y=[],
+            colorscale='Viridis',
+            hoverongaps=False,
+            hovertemplate=(
+                "Platform: %{y}<br>"
+                "Genre: %{x}<br>"
+                "Percentage: %{z:.1f}%<extra></extra>"
+            )
+        ))
+        
+        fig.update_layout(
+            title='Genre Distribution by Platform',
+            template='plotly_white',
+            xaxis_title=None,
+            yaxis_title=None,
+            margin=dict(l=20, r=20, t=40, b=20)
         )
-    ))
+        return fig
     
-    fig.update_layout(
-        title='Genre Distribution by Platform',
-        template='plotly_white',
-        xaxis_title=None,
-        yaxis_title=None,
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    fig = ChartConfigurator.from_skeleton('platform_genre_heatmap', build, [{
+        'z': platform_genre_pct.values,
+        'x': platform_genre_pct.columns,
+        'y': platform_genre_pct.index
+    }])
     
     return dcc.Graph(figure=fig, id='platform-genre-heatmap')
 
@@ -144,7 +195,6 @@ def create_platform_regional_share(df):
     })
     
     # Create stacked bar chart
-    fig = go.Figure()
     regions = {
         'NA_Sales': 'North America',
         'EU_Sales': 'Europe',
@@ -152,28 +202,35 @@ def create_platform_regional_share(df):
         'Other_Sales': 'Other'
     }
     
-    for col, name in regions.items():
-        fig.add_trace(go.Bar(
-            name=name,
-            x=platform_regional.index,
-            y=platform_regional[col],
-            hovertemplate="%{x}<br>%{y:.1f}M units<extra></extra>"
-        ))
-    
-    fig.update_layout(
-        title='Regional Sales Distribution by Platform',
-        xaxis_title=None,
-        yaxis_title='Sales (Millions)',
-        template='plotly_white',
-        barmode='stack',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
+    def build():
+        fig = go.Figure()
+        for name in regions.values():
+            fig.add_trace(go.Bar(
+                name=name,
+                x=[],
+                y=[],
+                hovertemplate="%{x}<br>%{y:.1f}M units<extra></extra>"
+            ))
+        
+        fig.update_layout(
+            title='Regional Sales Distribution by Platform',
+            xaxis_title=None,
+            yaxis_title='Sales (Millions)',
+            template='plotly_white',
+            barmode='stack',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            )
         )
-    )
+        return fig
+    
+    fig = ChartConfigurator.from_skeleton('platform_regional_share', build, [
+        {'x': platform_regional.index, 'y': platform_regional[col]} for col in regions
+    ])
     
     return dcc.Graph(figure=fig, id='platform-regional-share')
 
@@ -190,29 +247,35 @@ def create_top_games_by_platform(df, platform):
     """
     platform_games = df[df['Platform'] == platform].nlargest(10, 'Global_Sales')
     
-    fig = px.bar(
-        platform_games,
-        x='Global_Sales',
-        y='Name',
-        orientation='h',
-        title=f'Top 10 Games on {platform}',
-        labels={'Global_Sales': 'Global Sales (Millions)', 'Name': 'Game Title'}
-    )
-    
-    fig.update_traces(
-        texttemplate='%{x:.1f}M',
-        textposition='outside',
-        hovertemplate=(
-            "<b>%{y}</b><br>"
-            "Sales: %{x:.1f}M units<extra></extra>"
+    def build():
+        fig = px.bar(
+            platform_games.iloc[:0],
+            x='Global_Sales',
+            y='Name',
+            orientation='h',
+            labels={'Global_Sales': 'Global Sales (Millions)', 'Name': 'Game Title'}
+        )
+        
+        fig.update_traces(
+            texttemplate='%{x:.1f}M',
+            textposition='outside',
+            hovertemplate=(
+                "<b>%{y}</b><br>"
+                "Sales: %{x:.1f}M units<extra></extra>"
+            )
+        )
+        
+        fig.update_layout(
+            template='plotly_white',
+            showlegend=False,
+            margin=dict(l=20, r=20, t=40, b=20)
         )
-    )
+        return fig
     
-    fig.update_layout(
-        template='plotly_white',
-        showlegend=False,
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    fig = ChartConfigurator.from_skeleton('platform_top_games', build, [{
+        'x': platform_games['Global_Sales'].to_numpy(),
+        'y': platform_games['Name'].to_numpy()
+    }], {'title': {'text': f'Top 10 Games on {platform}'}})
     
     return dcc.Graph(figure=fig, id=f'top-games-{platform}')
 
@@ -4,6 +4,10 @@ import plotly.graph_objects as go
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output
+from utils.charts_config import ChartConfigurator, GROUP_PLACEHOLDER
+from utils.animation import share_race
+from utils.cube import get_sales_cube
+from utils.downsampling import downsample_series
 
 def create_top_publishers_chart(df, n=15):
     """
@@ -19,69 +23,93 @@ def create_top_publishers_chart(df, n=15):
     publisher_sales = df.groupby('Publisher')['Global_Sales'].sum().sort_values(ascending=True)
     top_publishers = publisher_sales.tail(n)
     
-    fig = go.Figure(go.Bar(
-        x=top_publishers.values,
-        y=top_publishers.index,
-        orientation='h',
-        text=top_publishers.values.round(1),
-        textposition='outside',
-        hovertemplate="<b>%{y}</b><br>Global Sales: %{x:.1f}M units<extra></extra>"
-    ))
-    
-    fig.update_layout(
-        title=f'Top {n} Publishers by Global Sales',
-        xaxis_title='Global Sales (Millions)',
-        yaxis_title=None,
-        template='plotly_white',
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    def build():
+        fig = go.Figure(go.Bar(
+            x=[],
+            y=[],
+            orientation='h',
+            text=[],
+            textposition='outside',
+            hovertemplate="<b>%{y}</b><br>Global Sales: %{x:.1f}M units<extra></extra>"
+        ))
+        
+        fig.update_layout(
+            xaxis_title='Global Sales (Millions)',
+            yaxis_title=None,
+            template='plotly_white',
+            margin=dict(l=20, r=20, t=40, b=20)
+        )
+        return fig
+    
+    fig = ChartConfigurator.from_skeleton('top_publishers', build, [{
+        'x': top_publishers.values,
+        'y': top_publishers.index,
+        'text': top_publishers.values.round(1)
+    }], {'title': {'text': f'Top {n} Publishers by Global Sales'}})
     
     return dcc.Graph(figure=fig, id='top-publishers-chart')
 
-def create_publisher_genre_analysis(df):
+def create_publisher_genre_analysis(df, year_range=None):
     """
     Create a heatmap showing publisher specialization by genre
     
     Args:
         df (pd.DataFrame): The video games sales dataframe
+        year_range (Tuple[float, float], optional): Read the matrix for this
+            inclusive year range from the sales cube instead of aggregating
+            df, which must then be the full dataset filtered to those years
     
     Returns:
         dcc.Graph: Plotly heatmap wrapped in a Dash component
     """
-    # Get top 10 publishers by total sales
-    top_publishers = df.groupby('Publisher')['Global_Sales'].sum().nlargest(10).index
-    
-    # Calculate the percentage of sales by genre for each publisher
-    publisher_genre = df[df['Publisher'].isin(top_publishers)].pivot_table(
-        values='Global_Sales',
-        index='Publisher',
-        columns='Genre',
-        aggfunc='sum'
-    ).fillna(0)
+    if year_range is not None:
+        cube = get_sales_cube()
+        top_publishers = cube.totals('Publisher', year_range).nlargest(10).index
+        publisher_genre = cube.matrix('Publisher', 'Genre', year_range,
+                                      labels={'Publisher': top_publishers}).fillna(0)
+    else:
+        # Get top 10 publishers by total sales
+        top_publishers = df.groupby('Publisher')['Global_Sales'].sum().nlargest(10).index
+        
+        # Calculate the percentage of sales by genre for each publisher
+        publisher_genre = df[df['Publisher'].isin(top_publishers)].pivot_table(
+            values='Global_Sales',
+            index='Publisher',
+            columns='Genre',
+            aggfunc='sum'
+        ).fillna(0)
     
     # Convert to percentages
     publisher_genre_pct = publisher_genre.div(publisher_genre.sum(axis=1), axis=0) * 100
     
-    fig = go.Figure(data=go.Heatmap(
-        z=publisher_genre_pct.values,
-        x=publisher_genre_pct.columns,
-        y=publisher_genre_pct.index,
-        colorscale='Viridis',
-        hoverongaps=False,
-        hovertemplate=(
-            "Publisher: %{y}<br>"
-            "Genre: %{x}<br>"
-            "Percentage: %{z:.1f}%<extra></extra>"
+    def build():
+        fig = go.Figure(data=go.Heatmap(
+            z=[],
+            x=[],
+            y=[],
+            colorscale='Viridis',
+            hoverongaps=False,
+            hovertemplate=(
+                "Publisher: %{y}<br>"
+                "Genre: %{x}<br>"
+                "Percentage: %{z:.1f}%<extra></extra>"
+            )
+        ))
+        
+        fig.update_layout(
+            title='Publisher Genre Specialization (Top 10 Publishers)',
+            template='plotly_white',
+            xaxis_title=None,
+            yaxis_title=None,
+            margin=dict(l=20, r=20, t=40, b=20)
         )
-    ))
+        return fig
     
-    fig.update_layout(
-        title='Publisher Genre Specialization (Top 10 Publishers)',
-        template='plotly_white',
-        xaxis_title=None,
-        yaxis_title=None,
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    fig = ChartConfigurator.from_skeleton('publisher_genre_heatmap', build, [{
+        'z': publisher_genre_pct.values,
+        'x': publisher_genre_pct.columns,
+        'y': publisher_genre_pct.index
+    }])
     
     return dcc.Graph(figure=fig, id='publisher-genre-heatmap')
 
@@ -100,30 +128,50 @@ def create_publisher_timeline(df):
     
     # Create yearly sales data for top publishers
     timeline_data = df[df['Publisher'].isin(top_publishers)].groupby(['Year', 'Publisher'])['Global_Sales'].sum().reset_index()
-    
-    fig = px.line(
-        timeline_data,
-        x='Year',
-        y='Global_Sales',
-        color='Publisher',
-        title='Sales Trends of Top 5 Publishers Over Time',
-        labels={'Global_Sales': 'Global Sales (Millions)', 'Year': 'Release Year'}
-    )
-    
-    fig.update_layout(
-        template='plotly_white',
-        hovermode='x unified',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
+    timeline_data = downsample_series(timeline_data, 'Year', 'Global_Sales', group='Publisher')
+    
+    def build():
+        fig = px.line(
+            pd.DataFrame({'Year': [0.0], 'Global_Sales': [0.0], 'Publisher': [GROUP_PLACEHOLDER]}),
+            x='Year',
+            y='Global_Sales',
+            color='Publisher',
+            title='Sales Trends of Top 5 Publishers Over Time',
+            labels={'Global_Sales': 'Global Sales (Millions)', 'Year': 'Release Year'}
+        )
+        
+        fig.update_layout(
+            template='plotly_white',
+            hovermode='x unified',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            )
         )
-    )
+        return fig
+    
+    traces = ChartConfigurator.grouped_line_traces('publisher_timeline', build, timeline_data,
+                                                   'Year', 'Global_Sales', 'Publisher')
+    fig = ChartConfigurator.from_skeleton('publisher_timeline', build, traces)
     
     return dcc.Graph(figure=fig, id='publisher-timeline')
 
+def create_publisher_share_race(top_n=10, cumulative=False):
+    """
+    Create an animated year-by-year race of the leading publishers' share of global sales
+    
+    Args:
+        top_n (int): Number of publishers shown in each year
+        cumulative (bool): Share of all sales up to each year instead of within the year
+    
+    Returns:
+        dcc.Graph: Animated Plotly bar chart wrapped in a Dash component
+    """
+    return dcc.Graph(figure=share_race('Publisher', top_n, cumulative), id='publisher-share-race')
+
 def create_publisher_regional_performance(df):
     """
     Create a grouped bar chart showing regional performance of top publishers
@@ -146,7 +194,6 @@ def create_publisher_regional_performance(df):
     }).round(2)
     
     # Create grouped bar chart
-    fig = go.Figure()
     regions = {
         'NA_Sales': 'North America',
         'EU_Sales': 'Europe',
@@ -154,28 +201,35 @@ def create_publisher_regional_performance(df):
         'Other_Sales': 'Other'
     }
     
-    for col, name in regions.items():
-        fig.add_trace(go.Bar(
-            name=name,
-            x=regional_data.index,
-            y=regional_data[col],
-            hovertemplate="%{x}<br>%{y:.1f}M units<extra></extra>"
-        ))
-    
-    fig.update_layout(
-        title='Regional Performance of Top Publishers',
-        xaxis_title=None,
-        yaxis_title='Sales (Millions)',
-        template='plotly_white',
-        barmode='group',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
+    def build():
+        fig = go.Figure()
+        for name in regions.values():
+            fig.add_trace(go.Bar(
+                name=name,
+                x=[],
+                y=[],
+                hovertemplate="%{x}<br>%{y:.1f}M units<extra></extra>"
+            ))
+        
+        fig.update_layout(
+            title='Regional Performance of Top Publishers',
+            xaxis_title=None,
+            yaxis_title='Sales (Millions)',
+            template='plotly_white',
+            barmode='group',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            )
         )
-    )
+        return fig
+    
+    fig = ChartConfigurator.from_skeleton('publisher_regional_performance', build, [
+        {'x': regional_data.index, 'y': regional_data[col]} for col in regions
+    ])
     
     return dcc.Graph(figure=fig, id='publisher-regional-performance')
 
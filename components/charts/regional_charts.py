@@ -4,6 +4,8 @@ import plotly.graph_objects as go
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output
+from utils.charts_config import ChartConfigurator
+from utils.cube import get_sales_cube
 
 def create_regional_distribution_pie(df):
     """
@@ -22,22 +24,28 @@ def create_regional_distribution_pie(df):
         'Other Regions': df['Other_Sales'].sum()
     }
     
-    fig = go.Figure(data=[
-        go.Pie(
-            labels=list(regional_totals.keys()),
-            values=list(regional_totals.values()),
-            hole=0.4,
-            textinfo='label+percent',
-            hovertemplate="%{label}<br>%{value:.1f}M units<br>%{percent}<extra></extra>"
+    def build():
+        fig = go.Figure(data=[
+            go.Pie(
+                labels=list(regional_totals.keys()),
+                values=[],
+                hole=0.4,
+                textinfo='label+percent',
+                hovertemplate="%{label}<br>%{value:.1f}M units<br>%{percent}<extra></extra>"
+            )
+        ])
+        
+        fig.update_layout(
+            title='Global Sales Distribution by Region',
+            template='plotly_white',
+            showlegend=True,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
         )
-    ])
+        return fig
     
-    fig.update_layout(
-        title='Global Sales Distribution by Region',
-        template='plotly_white',
-        showlegend=True,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-    )
+    fig = ChartConfigurator.from_skeleton('regional_pie', build, [{
+        'values': list(regional_totals.values())
+    }])
     
     return dcc.Graph(figure=fig, id='regional-distribution-pie')
 
@@ -56,75 +64,98 @@ def create_top_games_by_region(df, region_col, region_name, n=10):
     """
     top_games = df.nlargest(n, region_col)[['Name', 'Platform', region_col]]
     
-    fig = px.bar(
-        top_games,
-        x=region_col,
-        y='Name',
-        orientation='h',
-        text=region_col,
-        custom_data=['Platform'],
-        title=f'Top {n} Games in {region_name}'
-    )
-    
-    fig.update_traces(
-        texttemplate='%{text:.1f}M',
-        textposition='outside',
-        hovertemplate=(
-            "<b>%{y}</b><br>"
-            "Platform: %{customdata[0]}<br>"
-            "Sales: %{x:.1f}M units<extra></extra>"
+    def build():
+        fig = px.bar(
+            top_games.iloc[:0],
+            x=region_col,
+            y='Name',
+            orientation='h',
+            text=region_col,
+            custom_data=['Platform']
+        )
+        
+        fig.update_traces(
+            texttemplate='%{text:.1f}M',
+            textposition='outside',
+            hovertemplate=(
+                "<b>%{y}</b><br>"
+                "Platform: %{customdata[0]}<br>"
+                "Sales: %{x:.1f}M units<extra></extra>"
+            )
         )
-    )
+        
+        fig.update_layout(
+            template='plotly_white',
+            xaxis_title='Sales (Millions)',
+            yaxis_title=None,
+            yaxis={'categoryorder': 'total ascending'},
+            margin=dict(l=20, r=20, t=40, b=20)
+        )
+        return fig
     
-    fig.update_layout(
-        template='plotly_white',
-        xaxis_title='Sales (Millions)',
-        yaxis_title=None,
-        yaxis={'categoryorder': 'total ascending'},
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    sales = top_games[region_col].to_numpy()
+    fig = ChartConfigurator.from_skeleton(('regional_top_games', region_col), build, [{
+        'x': sales,
+        'y': top_games['Name'].to_numpy(),
+        'text': sales,
+        'customdata': top_games[['Platform']].to_numpy()
+    }], {'title': {'text': f'Top {n} Games in {region_name}'}})
     
     return dcc.Graph(figure=fig, id=f'top-games-{region_name.lower()}')
 
-def create_regional_heatmap(df):
+def create_regional_heatmap(df, year_range=None):
     """
     Create a heatmap showing genre popularity across regions
     
     Args:
         df (pd.DataFrame): The video games sales dataframe
+        year_range (Tuple[float, float], optional): Read the matrix for this
+            inclusive year range from the sales cube instead of aggregating
+            df, which must then be the full dataset filtered to those years
     
     Returns:
         dcc.Graph: Plotly heatmap wrapped in a Dash component
     """
-    # Calculate average sales by genre for each region
-    genre_regional = df.groupby('Genre').agg({
-        'NA_Sales': 'mean',
-        'EU_Sales': 'mean',
-        'JP_Sales': 'mean',
-        'Other_Sales': 'mean'
-    }).round(2)
+    if year_range is not None:
+        genre_regional = get_sales_cube().matrix('Genre', 'Region', year_range,
+                                                 aggfunc='mean').round(2)
+    else:
+        # Calculate average sales by genre for each region
+        genre_regional = df.groupby('Genre').agg({
+            'NA_Sales': 'mean',
+            'EU_Sales': 'mean',
+            'JP_Sales': 'mean',
+            'Other_Sales': 'mean'
+        }).round(2)
     
     # Create heatmap
-    fig = go.Figure(data=go.Heatmap(
-        z=genre_regional.values,
-        x=['North America', 'Europe', 'Japan', 'Other'],
-        y=genre_regional.index,
-        colorscale='Blues',
-        hoverongaps=False,
-        hovertemplate=(
-            "Genre: %{y}<br>"
-            "Region: %{x}<br>"
-            "Avg Sales: %{z:.2f}M units<extra></extra>"
+    def build():
+        fig = go.Figure(data=go.Heatmap(
+            z=[],
+            x=['North America', 'Europe', 'Japan', 'Other'],
+            y=[],
+            colorscale='Blues',
+            hoverongaps=False,
+            hovertemplate=(
+                "Genre: %{y}<br>"
+                "Region: %{x}<br>"
+                "Avg Sales: %{z:.2f}M units<extra></extra>"
+            )
+        ))
+        
+        fig.update_layout(
+            title='Average Game Sales by Genre and Region',
+            template='plotly_white',
+            xaxis_title=None,
+            yaxis_title=None,
+            margin=dict(l=20, r=20, t=40, b=20)
         )
-    ))
-    
-    fig.update_layout(
-        title='Average Game Sales by Genre and Region',
-        template='plotly_white',
-        xaxis_title=None,
-        yaxis_title=None,
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+        return fig
+    
+    fig = ChartConfigurator.from_skeleton('regional_heatmap', build, [{
+        'z': genre_regional.values,
+        'y': genre_regional.index
+    }])
     
     return dcc.Graph(figure=fig, id='regional-genre-heatmap')
 
@@ -4,6 +4,7 @@ import plotly.graph_objects as go
 from dash import html, dcc
 from dash.dependencies import Input, Output
 import dash_bootstrap_components as dbc
+from utils.charts_config import ChartConfigurator
 
 def create_yearly_sales_chart(df):
     """
@@ -19,20 +20,27 @@ def create_yearly_sales_chart(df):
     yearly_sales = df.groupby('Year')['Global_Sales'].sum().reset_index()
     yearly_sales = yearly_sales.dropna()  # Remove any NaN years
     
-    fig = px.line(
-        yearly_sales,
-        x='Year',
-        y='Global_Sales',
-        title='Global Video Game Sales Trend by Year',
-        labels={'Year': 'Release Year', 'Global_Sales': 'Global Sales (Millions)'}
-    )
-    
-    fig.update_layout(
-        template='plotly_white',
-        xaxis_tickangle=-45,
-        margin=dict(l=20, r=20, t=40, b=20),
-        hovermode='x unified'
-    )
+    def build():
+        fig = px.line(
+            yearly_sales.iloc[:0],
+            x='Year',
+            y='Global_Sales',
+            title='Global Video Game Sales Trend by Year',
+            labels={'Year': 'Release Year', 'Global_Sales': 'Global Sales (Millions)'}
+        )
+        
+        fig.update_layout(
+            template='plotly_white',
+            xaxis_tickangle=-45,
+            margin=dict(l=20, r=20, t=40, b=20),
+            hovermode='x unified'
+        )
+        return fig
+    
+    fig = ChartConfigurator.from_skeleton('yearly_sales', build, [{
+        'x': yearly_sales['Year'].to_numpy(),
+        'y': yearly_sales['Global_Sales'].to_numpy()
+    }])
     
     return dcc.Graph(figure=fig, id='yearly-sales-trend')
 
@@ -56,8 +64,6 @@ def create_yearly_regional_sales(df):
     
     regional_sales = regional_sales.dropna()
     
-    fig = go.Figure()
-    
     # Add areas for each region
     regions = {
         'NA_Sales': 'North America',
@@ -66,32 +72,39 @@ def create_yearly_regional_sales(df):
         'Other_Sales': 'Other Regions'
     }
     
-    for column, name in regions.items():
-        fig.add_trace(
-            go.Scatter(
-                x=regional_sales['Year'],
-                y=regional_sales[column],
-                name=name,
-                stackgroup='one',
-                hovertemplate="%{y:.1f}M units<extra></extra>"
+    def build():
+        fig = go.Figure()
+        for name in regions.values():
+            fig.add_trace(
+                go.Scatter(
+                    x=[],
+                    y=[],
+                    name=name,
+                    stackgroup='one',
+                    hovertemplate="%{y:.1f}M units<extra></extra>"
+                )
+            )
+        
+        fig.update_layout(
+            title='Regional Sales Distribution by Year',
+            xaxis_title='Release Year',
+            yaxis_title='Sales (Millions)',
+            template='plotly_white',
+            hovermode='x unified',
+            showlegend=True,
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
             )
         )
+        return fig
     
-    fig.update_layout(
-        title='Regional Sales Distribution by Year',
-        xaxis_title='Release Year',
-        yaxis_title='Sales (Millions)',
-        template='plotly_white',
-        hovermode='x unified',
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        )
-    )
+    fig = ChartConfigurator.from_skeleton('yearly_regional_sales', build, [
+        {'x': regional_sales['Year'], 'y': regional_sales[column]} for column in regions
+    ])
     
     return dcc.Graph(figure=fig, id='yearly-regional-sales')
 
@@ -0,0 +1,57 @@
+"""
+Gunicorn configuration for serving the Video Game Sales Dashboard in production.
+
+The app is imported once in the master (preload_app), which loads, cleans and
+indexes the dataset and freezes the garbage collector before workers are
+forked, so workers start without loading the data and the index arrays stay
+shared between them. The DataFrame the page callbacks use is shared too
+until a worker touches its object columns, which copies those pages.
+
+Usage:
+    gunicorn                     # picks up this file from the project root
+    python -m utils.shared_data <master_pid>   # per-worker memory report
+"""
+
+import logging
+import multiprocessing
+import os
+
+from utils.shared_data import preload_dataset, process_memory, format_memory_report
+from utils.games_index import get_games_index
+from utils.cube import get_sales_cube
+
+wsgi_app = "app:server"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8050")
+workers = int(os.environ.get("GUNICORN_WORKERS", min(multiprocessing.cpu_count(), 8)))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+timeout = 120
+
+# Load the app (and the dataset) in the master before forking workers
+preload_app = True
+
+logger = logging.getLogger("gunicorn.error")
+
+def when_ready(server):
+    """Index the dataset and freeze the GC in the master, right before forking."""
+    get_games_index()
+    get_sales_cube()
+    dataset = preload_dataset()
+    mem = process_memory()
+    logger.info(
+        f"Master ready with dataset {dataset.fingerprint}: "
+        f"rss={mem['rss'] / 1024:.1f}MB"
+    )
+
+def post_worker_init(worker):
+    """Log how much of the new worker's memory is still shared with the master."""
+    mem = process_memory()
+    logger.info(
+        f"Worker {worker.pid} memory: rss={mem['rss'] / 1024:.1f}MB "
+        f"shared={mem['shared'] / 1024:.1f}MB private={mem['private'] / 1024:.1f}MB"
+    )
+
+def worker_exit(server, worker):
+    """Log the per-worker memory report of the remaining workers."""
+    pids = [pid for pid in server.WORKERS if pid != worker.pid]
+    if pids:
+        logger.info("Worker memory report:\n" + format_memory_report(pids))
@@ -0,0 +1,207 @@
+"""
+Game explorer page for the Video Game Sales Dashboard.
+
+Scatters individual games by the share of their sales in two regions. Large
+selections are drawn as hexagonal density bins instead of one marker per
+game, and a game's full record is loaded only when it is hovered.
+"""
+
+import numpy as np
+from dash import html, dcc, callback, Input, Output, State
+import plotly.graph_objects as go
+
+from utils.shared_data import get_shared_dataset
+from utils.level_of_detail import hexbin
+from utils.constants import COLORS, CHART_TEMPLATE, EXPLORER_CONFIG, REGIONS
+
+SHARE_REGIONS = ['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']
+
+def create_game_explorer_layout():
+    """Creates the layout for the game-level scatter explorer page."""
+    dataset = get_shared_dataset()
+    years = dataset.year[~np.isnan(dataset.year)]
+    min_year, max_year = int(years.min()), int(years.max())
+
+    region_options = [{'label': f"{REGIONS[col]} share", 'value': col} for col in SHARE_REGIONS]
+
+    layout = html.Div([
+        # Header
+        html.Div([
+            html.H1("Game Explorer", className="text-3xl font-bold mb-4"),
+            html.P("Regional sales mix of every game, sized by global sales", className="text-gray-600 mb-8")
+        ], className="mb-8"),
+
+        # Controls
+        html.Div([
+            html.Div([
+                html.Label("X axis", className="block text-sm font-medium mb-2"),
+                dcc.Dropdown(id='explorer-x-region', options=region_options,
+                             value='NA_Sales', clearable=False)
+            ], className="w-full md:w-1/4 pr-4 mb-4"),
+            html.Div([
+                html.Label("Y axis", className="block text-sm font-medium mb-2"),
+                dcc.Dropdown(id='explorer-y-region', options=region_options,
+                             value='JP_Sales', clearable=False)
+            ], className="w-full md:w-1/4 pr-4 mb-4"),
+            html.Div([
+                html.Label("Time Period", className="block text-sm font-medium mb-2"),
+                html.Div([
+                    dcc.Input(id='explorer-year-start', type='number', min=min_year, max=max_year,
+                              value=min_year, debounce=True, className="w-1/2 p-2 border rounded-l"),
+                    dcc.Input(id='explorer-year-end', type='number', min=min_year, max=max_year,
+                              value=max_year, debounce=True, className="w-1/2 p-2 border rounded-r")
+                ], className="flex")
+            ], className="w-full md:w-1/4 pr-4 mb-4"),
+            html.Div([
+                html.Label("Genres", className="block text-sm font-medium mb-2"),
+                dcc.Dropdown(id='explorer-genres',
+                             options=[{'label': genre, 'value': genre}
+                                      for genre in dataset.categories['Genre']],
+                             multi=True, placeholder="All genres")
+            ], className="w-full md:w-1/4 mb-4")
+        ], className="flex flex-wrap bg-white p-6 rounded-lg shadow-lg mb-8"),
+
+        # Scatter and hover detail
+        html.Div([
+            html.Div([
+                html.P(id='explorer-status', className="text-sm text-gray-600 mb-2"),
+                dcc.Graph(id='explorer-scatter', clear_on_unhover=True,
+                          config={'displayModeBar': True})
+            ], className="w-full lg:w-3/4 pr-4"),
+            html.Div([
+                html.H2("Game Details", className="text-xl font-semibold mb-4"),
+                html.Div(id='explorer-detail',
+                         children=html.P("Hover over a game to see its details",
+                                         className="text-gray-600"))
+            ], className="w-full lg:w-1/4")
+        ], className="flex flex-wrap bg-white p-6 rounded-lg shadow-lg mb-8"),
+
+        # Dataset version the plotted row ids belong to
+        dcc.Store(id='explorer-fingerprint')
+    ], className="p-8 bg-gray-100")
+
+    return layout
+
+def _selected_rows(dataset, start_year, end_year, genres):
+    """Row ids of games in the year range and genres that have any sales."""
+    start_year = start_year if start_year is not None else -np.inf
+    end_year = end_year if end_year is not None else np.inf
+    rows = dataset.rows_for_years(start_year, end_year)
+    if genres:
+        rows = rows[np.isin(dataset.codes['Genre'][rows], dataset.codes_for('Genre', genres))]
+    return rows[dataset.sales['Global_Sales'][rows] > 0]
+
+def _axis_title(region):
+    return f"{REGIONS[region]} share of global sales"
+
+@callback(
+    [Output('explorer-scatter', 'figure'),
+     Output('explorer-status', 'children'),
+     Output('explorer-fingerprint', 'data')],
+    [Input('explorer-x-region', 'value'),
+     Input('explorer-y-region', 'value'),
+     Input('explorer-year-start', 'value'),
+     Input('explorer-year-end', 'value'),
+     Input('explorer-genres', 'value')]
+)
+def update_scatter(x_region, y_region, start_year, end_year, genres):
+    """Plots every selected game, or hexagonal density bins when there are too many."""
+    dataset = get_shared_dataset()
+    rows = _selected_rows(dataset, start_year, end_year, genres)
+
+    global_sales = dataset.sales['Global_Sales'][rows]
+    x = np.clip(dataset.sales[x_region][rows] / global_sales, 0, 1)
+    y = np.clip(dataset.sales[y_region][rows] / global_sales, 0, 1)
+
+    fig = go.Figure()
+    if len(rows) <= EXPLORER_CONFIG['max_points']:
+        # Only coordinates, sizes and row ids are sent; details load on hover
+        min_size, max_size = EXPLORER_CONFIG['marker_size']
+        scale = np.sqrt(global_sales / global_sales.max()) if len(rows) else global_sales
+        fig.add_trace(go.Scattergl(
+            x=np.round(x, 3),
+            y=np.round(y, 3),
+            customdata=rows,
+            mode='markers',
+            marker=dict(
+                size=np.round(min_size + scale * (max_size - min_size), 1),
+                color=COLORS['primary'],
+                opacity=0.5,
+                line=dict(width=0)
+            ),
+            hoverinfo='none'
+        ))
+        status = f"Showing {len(rows):,} games"
+    else:
+        gridsize = EXPLORER_CONFIG['hexbin_gridsize']
+        bins = hexbin(x, y, weights=global_sales, gridsize=gridsize, extent=(0, 1, 0, 1))
+        plot_px = EXPLORER_CONFIG['plot_height'] - 120
+        fig.add_trace(go.Scattergl(
+            x=bins['x'],
+            y=bins['y'],
+            customdata=np.stack([bins['count'], bins['total']], axis=1),
+            mode='markers',
+            marker=dict(
+                symbol='hexagon',
+                size=plot_px / gridsize * 1.15,
+                color=np.log10(bins['count']),
+                colorscale='Blues',
+                colorbar=dict(title='Games',
+                              tickvals=[0, 1, 2, 3, 4],
+                              ticktext=['1', '10', '100', '1k', '10k']),
+                line=dict(width=0)
+            ),
+            hovertemplate=("%{customdata[0]:,} games<br>"
+                           "%{customdata[1]:.1f}M global sales<extra></extra>")
+        ))
+        status = f"Density view of {len(rows):,} games (hexagonal bins)"
+
+    fig.update_layout(
+        template=CHART_TEMPLATE,
+        height=EXPLORER_CONFIG['plot_height'],
+        showlegend=False,
+        xaxis=dict(title=_axis_title(x_region), range=[-0.02, 1.02], tickformat='.0%'),
+        yaxis=dict(title=_axis_title(y_region), range=[-0.02, 1.02], tickformat='.0%',
+                   scaleanchor='x', scaleratio=1),
+        uirevision=f"{x_region}-{y_region}"
+    )
+
+    return fig, status, dataset.fingerprint
+
+@callback(
+    Output('explorer-detail', 'children'),
+    Input('explorer-scatter', 'hoverData'),
+    State('explorer-fingerprint', 'data'),
+    prevent_initial_call=True
+)
+def show_game_detail(hover_data, fingerprint):
+    """Loads the full record of the hovered game by its row id."""
+    if not hover_data or not hover_data.get('points'):
+        return html.P("Hover over a game to see its details", className="text-gray-600")
+
+    point = hover_data['points'][0]
+    customdata = point.get('customdata')
+    if customdata is None or isinstance(customdata, list):
+        # Density bins carry their own summary in the hover label
+        return html.P("Zoom in or narrow the filters to inspect individual games",
+                      className="text-gray-600")
+
+    dataset = get_shared_dataset()
+    if fingerprint != dataset.fingerprint:
+        return html.P("The dataset has changed; adjust a filter to refresh the chart",
+                      className="text-gray-600")
+
+    game = dataset.game(int(customdata))
+    year = f"{int(game['Year'])}" if game['Year'] is not None else "Unknown"
+    return html.Div([
+        html.H3(game['Name'], className="text-lg font-semibold mb-2"),
+        html.P(f"{game['Platform']} · {year} · {game['Genre']}", className="text-gray-600 mb-1"),
+        html.P(game['Publisher'] or "Unknown publisher", className="text-gray-600 mb-4"),
+        html.Table([
+            html.Tbody([
+                html.Tr([html.Td(REGIONS[col], className="pr-4"),
+                         html.Td(f"{game[col]:.2f}M", className="text-right")])
+                for col in SHARE_REGIONS + ['Global_Sales']
+            ])
+        ], className="w-full text-sm")
+    ])
@@ -0,0 +1,78 @@
+"""
+Games table page for the Video Game Sales Dashboard.
+
+Serves the full ranked catalogue one page at a time: paging, sorting and
+filtering run on the server against the presorted games index.
+"""
+
+from dash import html, dash_table, callback, Input, Output
+
+from utils.games_index import TABLE_COLUMNS, FilterQueryError, get_games_index
+from utils.constants import COLORS, REGIONS, GAMES_TABLE_CONFIG
+
+def create_games_table_layout():
+    """Creates the layout for the full, server-side paged games table."""
+    columns = []
+    for col in TABLE_COLUMNS:
+        column = {'name': REGIONS.get(col, col), 'id': col}
+        if col in REGIONS:
+            column.update(type='numeric', format={'specifier': '.2f'})
+        elif col in ('Rank', 'Year'):
+            column.update(type='numeric')
+        columns.append(column)
+
+    layout = html.Div([
+        # Header
+        html.Div([
+            html.H1("All Games", className="text-3xl font-bold mb-4"),
+            html.P("Full ranked catalogue; sort by any column and filter with expressions "
+                   "such as 'Mario', '> 2005' or '>= 1'", className="text-gray-600 mb-8")
+        ], className="mb-8"),
+
+        html.Div([
+            html.P(id='games-table-status', className="text-sm text-gray-600 mb-2"),
+            dash_table.DataTable(
+                id='games-table',
+                columns=columns,
+                page_current=0,
+                page_size=GAMES_TABLE_CONFIG['page_size'],
+                page_action='custom',
+                sort_action='custom',
+                sort_mode='single',
+                sort_by=[],
+                filter_action='custom',
+                filter_query='',
+                style_table={'overflowX': 'auto'},
+                style_header={'backgroundColor': COLORS['light'], 'fontWeight': 'bold'},
+                style_cell={'fontFamily': 'Arial, sans-serif', 'fontSize': 13,
+                            'padding': '6px', 'textAlign': 'left'},
+                style_cell_conditional=[
+                    {'if': {'column_id': col}, 'textAlign': 'right'}
+                    for col in ['Rank', 'Year'] + list(REGIONS)
+                ]
+            )
+        ], className="bg-white p-6 rounded-lg shadow-lg mb-8")
+    ], className="p-8 bg-gray-100")
+
+    return layout
+
+@callback(
+    [Output('games-table', 'data'),
+     Output('games-table', 'page_count'),
+     Output('games-table-status', 'children')],
+    [Input('games-table', 'page_current'),
+     Input('games-table', 'page_size'),
+     Input('games-table', 'sort_by'),
+     Input('games-table', 'filter_query')]
+)
+def update_games_table(page_current, page_size, sort_by, filter_query):
+    """Serves one page of the games table; the full frame never leaves the server."""
+    page_size = max(1, min(page_size or GAMES_TABLE_CONFIG['page_size'], GAMES_TABLE_CONFIG['max_page_size']))
+    page_current = max(0, page_current or 0)
+    try:
+        records, total = get_games_index().query(page_current, page_size, sort_by, filter_query)
+    except FilterQueryError as e:
+        return [], 0, f"Invalid filter: {e}"
+
+    page_count = max((total + page_size - 1) // page_size, 1)
+    return records, page_count, f"{total:,} games"
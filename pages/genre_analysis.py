@@ -8,12 +8,15 @@ import dash_bootstrap_components as dbc
 from utils.data_loading import load_vgsales_data
 from utils.data_processing import preprocess_genre_data
 from components.cards.stats_card import create_stat_card
-from utils.constants import COLORS, CHART_TEMPLATE
+from utils.constants import COLORS, CHART_TEMPLATE, BACKGROUND_CALLBACK_CONFIG
+from utils.parallel_outputs import build_outputs
+from utils.prerender import serve_prerendered
 from components.charts.genre_charts import (
     create_genre_sales_chart,
     create_genre_platform_distribution,
     create_genre_regional_analysis,
     create_genre_timeline,
+    create_genre_share_race,
     create_genre_publisher_affinity,
     create_top_games_by_genre
 )
@@ -94,6 +97,14 @@ def create_genre_analysis_layout():
             ), width=4)
         ], className="mb-4"),
         
+        # Background job progress
+        html.Div(
+            dbc.Progress(id='genre-progress', value=0, striped=True, animated=True),
+            id='genre-progress-container',
+            className="mb-4",
+            style={'visibility': 'hidden'}
+        ),
+        
         # Charts Section
         dbc.Row([
             dbc.Col(dcc.Graph(id='genre-sales-chart'), width=12)
@@ -108,6 +119,11 @@ def create_genre_analysis_layout():
             dbc.Col(dcc.Graph(id='genre-timeline'), width=12)
         ], className="mb-4"),
         
+        # Year-by-year animation over the full dataset, independent of the filters
+        dbc.Row([
+            dbc.Col(create_genre_share_race(), width=12)
+        ], className="mb-4"),
+        
         dbc.Row([
             dbc.Col(dcc.Graph(id='genre-publisher-heatmap'), width=12)
         ], className="mb-4"),
@@ -128,22 +144,36 @@ def create_genre_analysis_layout():
      Output('top-games-by-genre', 'figure')],
     [Input('year-start', 'value'),
      Input('year-end', 'value'),
-     Input('region-selector', 'value')]
+     Input('region-selector', 'value')],
+    background=True,
+    interval=BACKGROUND_CALLBACK_CONFIG['interval'],
+    progress=[Output('genre-progress', 'value'),
+              Output('genre-progress', 'label')],
+    progress_default=[0, ""],
+    running=[(Output('genre-progress-container', 'style'),
+              {'visibility': 'visible'}, {'visibility': 'hidden'})],
+    cancel=[Input('url', 'pathname')]
 )
-def update_charts(start_year, end_year, regions):
+@serve_prerendered()
+def update_charts(set_progress, start_year, end_year, regions):
     """Updates all charts based on selected filters."""
+    set_progress((0, "Filtering data"))
     df = load_vgsales_data()
     df_filtered = df[(df['Year'] >= start_year) & (df['Year'] <= end_year)]
     
     # Get top genre for the filtered data
     top_genre = df_filtered.groupby('Genre')['Global_Sales'].sum().idxmax()
     
-    # Extract just the figures from the graph components
-    sales_chart = create_genre_sales_chart(df_filtered).figure
-    platform_dist = create_genre_platform_distribution(df_filtered, regions).figure
-    regional_share = create_genre_regional_analysis(df_filtered).figure
-    timeline = create_genre_timeline(df_filtered).figure
-    publisher_affinity = create_genre_publisher_affinity(df_filtered).figure
-    top_games = create_top_games_by_genre(df_filtered, top_genre).figure
-    
-    return sales_chart, platform_dist, regional_share, timeline, publisher_affinity, top_games
\ No newline at end of file
+    # Extract just the figures from the graph components, built concurrently
+    return build_outputs('genre_analysis.update_charts', {
+        'sales_chart': lambda d: create_genre_sales_chart(d).figure,
+        'platform_dist': lambda d: create_genre_platform_distribution(
+            d, regions, year_range=(start_year, end_year)).figure,
+        'regional_share': lambda d: create_genre_regional_analysis(d).figure,
+        'timeline': lambda d: create_genre_timeline(d).figure,
+        'publisher_affinity': lambda d: create_genre_publisher_affinity(
+            d, year_range=(start_year, end_year)).figure,
+        'top_games': lambda d: create_top_games_by_genre(d, top_genre).figure
+    }, df_filtered, on_complete=lambda output, done, total: set_progress(
+        (int(100 * done / total), f"Built {output.replace('_', ' ')}")
+    ))
\ No newline at end of file
@@ -2,11 +2,13 @@
 Log viewer page for the Video Game Sales Dashboard.
 """
 
-from dash import html, dcc, callback, Input, Output, State
+from dash import html, dcc, callback, ctx, no_update, Patch, Input, Output, State
 import dash_bootstrap_components as dbc
 from pathlib import Path
 import logging
-from utils.logging_setup import list_logs, read_log_file
+from utils.logging_setup import list_logs, log_segments, read_log_page, tail_log_file
+from utils.log_index import LEVELS, search_logs, format_entry
+from utils.constants import LOG_VIEWER_CONFIG
 
 def create_log_viewer_layout():
     """Create the layout for the log viewer page."""
@@ -38,11 +40,24 @@ def create_log_viewer_layout():
                     dbc.Button(
                         "Clear Display",
                         id="clear-logs-button",
-                        color="secondary"
+                        color="secondary",
+                        className="me-2"
+                    ),
+                    dbc.Button(
+                        "Older",
+                        id="log-older-button",
+                        color="light",
+                        className="me-2"
+                    ),
+                    dbc.Button(
+                        "Newer",
+                        id="log-newer-button",
+                        color="light"
                     ),
                 ], className="d-flex align-items-end h-100 mb-3")
             ], width=6),
         ]),
+        html.Small(id="log-page-position", className="text-muted d-block mb-2"),
         
         # Log display area
         dbc.Card([
@@ -66,32 +81,157 @@ def create_log_viewer_layout():
             dbc.Col([
                 dbc.Checkbox(
                     id="auto-refresh-toggle",
-                    label="Auto-refresh logs (every 10 seconds)",
+                    label=f"Follow log (every {LOG_VIEWER_CONFIG['refresh_interval'] // 1000} seconds)",
                     value=False,
                     className="mt-3"
                 ),
                 dcc.Interval(
                     id='log-refresh-interval',
-                    interval=10*1000,  # 10 seconds
+                    interval=LOG_VIEWER_CONFIG['refresh_interval'],
                     disabled=True
                 )
             ])
+        ]),
+        
+        # Read position of this client: file, byte offset, inode, stream
+        # position of the current file and the byte sizes of the text chunks
+        # currently rendered; or the page range while browsing history
+        dcc.Store(id='log-follow-state'),
+        
+        # Indexed search across all log files
+        html.H3("Search Logs", className="mt-5 mb-3"),
+        dbc.Row([
+            dbc.Col([
+                html.Label("Text:", className="mb-2"),
+                dbc.Input(id="log-search-text", type="text", debounce=True,
+                          placeholder="Words in the message, e.g. error loading")
+            ], width=4),
+            dbc.Col([
+                html.Label("From:", className="mb-2"),
+                dbc.Input(id="log-search-start", type="datetime-local")
+            ], width=3),
+            dbc.Col([
+                html.Label("To:", className="mb-2"),
+                dbc.Input(id="log-search-end", type="datetime-local")
+            ], width=3),
+            dbc.Col([
+                dbc.Button("Search", id="log-search-button", color="primary")
+            ], width=2, className="d-flex align-items-end")
+        ], className="mb-3"),
+        dbc.Checklist(
+            id="log-search-levels",
+            options=[{'label': level, 'value': level} for level in LEVELS],
+            value=[],
+            inline=True,
+            className="mb-3"
+        ),
+        html.P(id="log-search-status", className="text-muted"),
+        dbc.Card([
+            dbc.CardBody([
+                html.Pre(
+                    id="log-search-results",
+                    className="mb-0",
+                    style={
+                        'maxHeight': '600px',
+                        'overflowY': 'auto',
+                        'whiteSpace': 'pre-wrap',
+                        'fontFamily': 'monospace',
+                        'fontSize': '12px'
+                    }
+                )
+            ])
         ])
     ], className="p-4")
 
+def _format_position(start, end, size):
+    """Describe which part of a log stream is displayed."""
+    def human(n):
+        return f"{n / (1024 * 1024):.1f} MB" if n >= 1024 * 1024 else f"{n / 1024:.0f} KB"
+    return f"Showing {human(start)}–{human(end)} of {human(size)} (Refresh Logs returns to the latest entries)"
+
 @callback(
-    Output('log-content', 'children'),
+    [Output('log-content', 'children'),
+     Output('log-follow-state', 'data'),
+     Output('log-page-position', 'children')],
     [Input('log-file-selector', 'value'),
      Input('refresh-logs-button', 'n_clicks'),
      Input('log-refresh-interval', 'n_intervals')],
+    State('log-follow-state', 'data'),
     prevent_initial_call=False
 )
-def update_log_content(selected_file, n_clicks, n_intervals):
-    """Update the log content display."""
+def update_log_content(selected_file, n_clicks, n_intervals, state):
+    """Update the log content display, appending only new lines while following."""
     if not selected_file:
-        return "No log file selected"
+        return "No log file selected", None, ""
+    
+    if ctx.triggered_id == 'log-refresh-interval' and state and state.get('paged'):
+        # Browsing history; follow resumes after Refresh Logs
+        return no_update, no_update, no_update
+    
+    following = (ctx.triggered_id == 'log-refresh-interval'
+                 and state and state.get('file') == selected_file)
+    if following:
+        result = tail_log_file(selected_file, state['offset'], state['inode'])
+    else:
+        result = tail_log_file(selected_file)
+    
+    new_state = {'file': selected_file, 'offset': result['offset'], 'inode': result['inode']}
+    size = len(result['text'].encode('utf-8'))
+    if result['reset']:
+        # Position of the current file within the stream of rotated backups
+        segments = log_segments(selected_file)
+        new_state['base'] = segments[-1]['start'] if segments else 0
+        new_state['chunks'] = [size]
+        return [result['text']], new_state, ""
+    
+    if not result['text']:
+        return no_update, no_update, no_update
+    
+    # Append the new lines and drop the oldest chunks beyond the window
+    content = Patch()
+    content.append(result['text'])
+    chunks = state['chunks'] + [size]
+    while len(chunks) > 1 and sum(chunks) > LOG_VIEWER_CONFIG['window_bytes']:
+        del content[0]
+        chunks.pop(0)
+    new_state['base'] = state['base']
+    new_state['chunks'] = chunks
+    return content, new_state, no_update
+
+@callback(
+    [Output('log-content', 'children', allow_duplicate=True),
+     Output('log-follow-state', 'data', allow_duplicate=True),
+     Output('log-page-position', 'children', allow_duplicate=True)],
+    [Input('log-older-button', 'n_clicks'),
+     Input('log-newer-button', 'n_clicks')],
+    [State('log-file-selector', 'value'),
+     State('log-follow-state', 'data')],
+    prevent_initial_call=True
+)
+def page_log_content(older_clicks, newer_clicks, selected_file, state):
+    """Page through the log and its rotated backups, one page at a time."""
+    if not selected_file or not state or state.get('file') != selected_file:
+        return no_update, no_update, no_update
+    
+    if state.get('paged'):
+        start, end = state['start'], state['end']
+    else:
+        end = state['base'] + state['offset']
+        start = end - sum(state['chunks'])
+    
+    if ctx.triggered_id == 'log-older-button':
+        page = read_log_page(selected_file, start, 'backward')
+    elif state.get('paged'):
+        page = read_log_page(selected_file, end, 'forward')
+    else:
+        # Already showing the latest entries
+        return no_update, no_update, no_update
     
-    return read_log_file(selected_file)
+    if not page['text']:
+        return no_update, no_update, no_update
+    
+    new_state = {'file': selected_file, 'paged': True, 'start': page['start'], 'end': page['end']}
+    return [page['text']], new_state, _format_position(page['start'], page['end'], page['size'])
 
 @callback(
     Output('log-file-selector', 'options'),
@@ -122,10 +262,37 @@ def toggle_auto_refresh(enabled):
     return not enabled
 
 @callback(
-    Output('log-content', 'children', allow_duplicate=True),
+    [Output('log-content', 'children', allow_duplicate=True),
+     Output('log-follow-state', 'data', allow_duplicate=True)],
     Input('clear-logs-button', 'n_clicks'),
+    State('log-follow-state', 'data'),
+    prevent_initial_call=True
+)
+def clear_log_display(n_clicks, state):
+    """Clear the log display area; following continues from the current position."""
+    if not state:
+        return [], no_update
+    return [], {**state, 'chunks': []}
+
+@callback(
+    [Output('log-search-results', 'children'),
+     Output('log-search-status', 'children')],
+    [Input('log-search-button', 'n_clicks'),
+     Input('log-search-text', 'value')],
+    [State('log-search-levels', 'value'),
+     State('log-search-start', 'value'),
+     State('log-search-end', 'value')],
     prevent_initial_call=True
 )
-def clear_log_display(n_clicks):
-    """Clear the log display area."""
-    return ""
\ No newline at end of file
+def search_log_entries(n_clicks, text, levels, start, end):
+    """Search all log files through the index, newest entries first."""
+    result = search_logs(text, levels, start, end)
+    if not result['entries']:
+        return "", f"No matching entries ({result['elapsed_ms']:.1f} ms)"
+    
+    lines = [f"[{entry['file']}] {format_entry(entry)}" for entry in result['entries']]
+    shown = len(result['entries'])
+    status = f"{result['total']:,} matching entries"
+    if shown < result['total']:
+        status += f", showing the newest {shown:,}"
+    return "\n".join(lines), f"{status} ({result['elapsed_ms']:.1f} ms)"
@@ -14,6 +14,9 @@ from components.cards.summary_card import (
     create_top_games_card
 )
 from utils.constants import COLORS, CHART_TEMPLATE
+from utils.parallel_outputs import build_outputs
+from utils.prerender import serve_prerendered
+from utils.downsampling import downsample_series
 
 def create_overview_layout():
     """Creates the layout for the overview dashboard page."""
@@ -233,6 +236,7 @@ def create_stat_card(title, value, description, icon, bg_color):
     [Input('start-year-dropdown', 'value'),
      Input('end-year-dropdown', 'value')]
 )
+@serve_prerendered()
 def update_dashboard(start_year, end_year):
     """Updates all dashboard components based on selected year range."""
     df = load_vgsales_data()
@@ -250,16 +254,16 @@ def update_dashboard(start_year, end_year):
     mask = (df['Year'] >= start_year) & (df['Year'] <= end_year)
     df_filtered = df[mask]
     
-    # Generate visualizations and insights
-    sales_trend = create_sales_trend(df_filtered)
-    regional_share = create_regional_share(df_filtered)
-    genre_dist = create_genre_distribution(df_filtered)
-    platform_perf = create_platform_performance(df_filtered)
-    insights = generate_insights(df_filtered)
-    genre_summary = create_genre_summary_card(df_filtered)
-    publisher_summary = create_publisher_summary_card(df_filtered)
-    
-    return sales_trend, regional_share, genre_dist, platform_perf, insights, genre_summary, publisher_summary
+    # Generate visualizations and insights concurrently
+    return build_outputs('overview.update_dashboard', {
+        'sales_trend': create_sales_trend,
+        'regional_share': create_regional_share,
+        'genre_dist': create_genre_distribution,
+        'platform_perf': create_platform_performance,
+        'insights': generate_insights,
+        'genre_summary': create_genre_summary_card,
+        'publisher_summary': create_publisher_summary_card
+    }, df_filtered)
 
 def create_sales_trend(df):
     """Creates the sales trend visualization with improved styling."""
@@ -269,6 +273,7 @@ def create_sales_trend(df):
         'EU_Sales': 'sum',
         'JP_Sales': 'sum'
     }).reset_index()
+    yearly_sales = downsample_series(yearly_sales, 'Year', ['NA_Sales', 'EU_Sales', 'JP_Sales'])
     
     fig = px.area(yearly_sales,
                   x='Year',
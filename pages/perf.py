@@ -0,0 +1,162 @@
+"""
+Performance page for the Video Game Sales Dashboard.
+
+Summarizes the in-process callback metrics of the worker serving the page:
+recent latency percentiles, per-output build times, cache hit rates,
+dataset load times, memory and the slowest recent requests. Admins also get the retained request profiles.
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+
+from dash import html, dcc, callback, Input, Output
+import dash_bootstrap_components as dbc
+
+from utils.metrics import (
+    cache_summary,
+    collect_job_metrics,
+    latency_summary,
+    load_events,
+    output_summary,
+    recent_calls,
+    summarize_inputs
+)
+from utils.profiling import is_admin, list_profiles
+from utils.shared_data import process_memory, worker_pids
+from utils.constants import METRICS_CONFIG, PROFILING_CONFIG
+
+def create_perf_layout():
+    """Create the layout for the performance page."""
+    return html.Div([
+        html.H2("Performance", className="mb-2"),
+        html.P(id="perf-process-info", className="text-muted mb-4"),
+        html.Div(id="perf-content"),
+        dcc.Interval(
+            id='perf-refresh-interval',
+            interval=METRICS_CONFIG['refresh_interval']
+        )
+    ], className="p-4")
+
+def _table(columns, rows):
+    """Build a compact striped table from column headers and row values."""
+    return dbc.Table([
+        html.Thead(html.Tr([html.Th(col) for col in columns])),
+        html.Tbody([html.Tr([html.Td(value) for value in row]) for row in rows])
+    ], bordered=False, striped=True, hover=True, size="sm", className="mb-4")
+
+def _section(title, body):
+    return html.Div([html.H4(title, className="mb-3"), body], className="mb-4")
+
+def _memory_rows():
+    """Memory of this process, or of the gunicorn master and all its workers."""
+    pids = [os.getpid()]
+    if 'gunicorn' in sys.modules:
+        master = os.getppid()
+        pids = [master] + worker_pids(master)
+    rows = []
+    for pid in pids:
+        try:
+            mem = process_memory(pid)
+        except Exception:
+            continue
+        label = f"{pid} (this worker)" if pid == os.getpid() else str(pid)
+        rows.append([label] + [f"{mem[key] / 1024:.1f}" for key in ('rss', 'pss', 'shared', 'private')])
+    return rows
+
+def _profiles_section():
+    """Retained profiles for admins, or how to turn profiling on."""
+    if not os.environ.get(PROFILING_CONFIG['token_env']):
+        return html.P(f"Request profiling is disabled; set {PROFILING_CONFIG['token_env']} to enable it.",
+                      className="text-muted")
+    if not is_admin():
+        return html.P("Admins can profile their requests after visiting /profiling/enable?token=<admin token>.",
+                      className="text-muted")
+
+    profiles = list_profiles()
+    status = html.P([
+        f"Profiling is on for this browser (calls over {PROFILING_CONFIG['min_ms']} ms are kept, "
+        f"newest {PROFILING_CONFIG['max_profiles']}). ",
+        html.A("Turn off", href="/profiling/disable")
+    ], className="text-muted")
+    if not profiles:
+        return html.Div([status, html.P("No profiles recorded yet", className="text-muted")])
+    table = _table(
+        ["Time", "Callback", "ms", "KB", "Download"],
+        [[profile['time'].strftime('%Y-%m-%d %H:%M:%S'), profile['callback'], profile['ms'],
+          f"{profile['bytes'] / 1024:.0f}",
+          html.Span([
+              html.A("stats", href=f"/profiling/{profile['name']}?format=txt", target="_blank"),
+              " · ",
+              html.A(".prof", href=f"/profiling/{profile['name']}")
+          ])]
+         for profile in profiles]
+    )
+    return html.Div([status, table])
+
+@callback(
+    [Output('perf-content', 'children'),
+     Output('perf-process-info', 'children')],
+    Input('perf-refresh-interval', 'n_intervals')
+)
+def update_perf(n_intervals):
+    """Render the current metrics of the worker serving this request."""
+    collect_job_metrics()
+    records = list(recent_calls)
+
+    latency = latency_summary(records)
+    latency_table = _table(
+        ["Callback", "Calls", "Errors", "p50 ms", "p90 ms", "p99 ms", "Max ms", "CPU ms", "Response KB"],
+        [[row['callback'], row['calls'], row['errors'], f"{row['p50_ms']:.1f}", f"{row['p90_ms']:.1f}",
+          f"{row['p99_ms']:.1f}", f"{row['max_ms']:.1f}", f"{row['cpu_ms']:.1f}",
+          f"{row['response_bytes'] / 1024:.1f}"] for row in latency]
+    ) if latency else html.P("No callbacks served yet", className="text-muted")
+
+    outputs = output_summary()
+    output_table = _table(
+        ["Callback", "Output", "Builds", "Mean ms"],
+        [[row['callback'], row['output'], row['builds'], f"{row['mean_ms']:.1f}"] for row in outputs]
+    ) if outputs else html.P("No multi-output callbacks built yet", className="text-muted")
+
+    caches = cache_summary()
+    cache_table = _table(
+        ["Callback", "Cache", "Hits", "Misses", "Hit rate"],
+        [[row['callback'], row['cache'], row['hits'], row['misses'], f"{row['hit_rate']:.0%}"]
+         for row in caches]
+    ) if caches else html.P("No cache lookups yet", className="text-muted")
+
+    loads = list(load_events)[::-1]
+    load_table = _table(
+        ["Time", "Load", "Seconds", "Detail"],
+        [[datetime.fromtimestamp(event['timestamp']).strftime('%Y-%m-%d %H:%M:%S'),
+          event['name'], f"{event['seconds']:.3f}", event['detail']] for event in loads]
+    ) if loads else html.P("Nothing loaded in this process yet", className="text-muted")
+
+    memory_table = _table(["Process", "RSS MB", "PSS MB", "Shared MB", "Private MB"], _memory_rows())
+
+    slowest = sorted(records, key=lambda record: record.duration, reverse=True)[:METRICS_CONFIG['slowest_calls']]
+    slowest_table = _table(
+        ["Time", "Callback", "ms", "Outcome", "Response KB", "Inputs"],
+        [[datetime.fromtimestamp(record.timestamp).strftime('%H:%M:%S'), record.callback,
+          f"{record.duration * 1000:.1f}", record.outcome, f"{record.response_bytes / 1024:.1f}",
+          html.Code(summarize_inputs(record.inputs), style={'fontSize': '11px'})]
+         for record in slowest]
+    ) if slowest else html.P("No callbacks served yet", className="text-muted")
+
+    window = ""
+    if records:
+        window = f" over the last {len(records):,} calls ({(time.time() - records[0].timestamp) / 60:.0f} min)"
+    info = (f"Worker {os.getpid()}; latency percentiles{window}. "
+            f"Cumulative histograms since this worker started are on {METRICS_CONFIG['path']}.")
+
+    content = [
+        _section("Callback latency", latency_table),
+        _section("Slowest recent requests", slowest_table),
+        _section("Output build times", output_table),
+        _section("Cache hit rates", cache_table),
+        _section("Dataset and index loads", load_table),
+        _section("Memory", memory_table),
+        _section("Request profiles", _profiles_section())
+    ]
+    return content, info
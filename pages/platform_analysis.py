@@ -282,6 +282,7 @@ import plotly.graph_objects as go
 from components.charts.platform_charts import (
     create_platform_sales_chart,
     create_platform_timeline,
+    create_platform_share_race,
     create_platform_genre_distribution,
     create_platform_regional_share,
     create_top_games_by_platform,
@@ -290,6 +291,7 @@ from components.charts.platform_charts import (
 from utils.data_loading import load_vgsales_data
 from utils.data_processing import preprocess_platform_data
 from utils.constants import COLORS, CHART_TEMPLATE
+from utils.prerender import serve_prerendered
 
 def create_modern_year_range(df):
     min_year = int(df['Year'].min())
@@ -388,6 +390,12 @@ def create_platform_analysis_layout():
                 html.Div(id='platform-timeline')
             ], className="bg-white rounded-xl shadow-sm p-4 border border-gray-100 mb-4"),
 
+            html.Div([
+                html.H3("Platform Share by Year", 
+                        className="text-lg font-medium text-gray-900 mb-2"),
+                create_platform_share_race()
+            ], className="bg-white rounded-xl shadow-sm p-4 border border-gray-100 mb-4"),
+
             html.Div([
                 html.Div([
                     html.H3("Genre Distribution", 
@@ -414,6 +422,7 @@ def create_platform_analysis_layout():
     [Input('year-start', 'value'),
      Input('year-end', 'value')]
 )
+@serve_prerendered()
 def update_selected_years(start_year, end_year):
     if start_year and end_year:
         return f"{start_year} - {end_year}"
@@ -423,12 +432,14 @@ def update_selected_years(start_year, end_year):
     Output('year-end', 'options'),
     [Input('year-start', 'value')]
 )
+@serve_prerendered()
 def update_end_year_options(start_year):
     df = load_vgsales_data()
     max_year = int(df['Year'].max())
     if start_year:
+        # The genre page shares this id and its dropdown holds float years
         return [{'label': str(year), 'value': year} 
-                for year in range(start_year, max_year + 1)]
+                for year in range(int(start_year), max_year + 1)]
     return []
 
 @callback(
@@ -440,6 +451,7 @@ def update_end_year_options(start_year):
      Input('year-end', 'value'),
      Input('platform-selector', 'value')]
 )
+@serve_prerendered()
 def update_charts(start_year, end_year, selected_platforms):
     df = load_vgsales_data()
     
@@ -452,7 +464,8 @@ def update_charts(start_year, end_year, selected_platforms):
     return [
         create_platform_sales_chart(filtered_df),
         create_platform_timeline(filtered_df),
-        create_platform_genre_distribution(filtered_df),
+        create_platform_genre_distribution(filtered_df, year_range=(start_year, end_year),
+                                           platforms=selected_platforms or None),
         create_platform_regional_share(filtered_df)
     ]
 
@@ -462,6 +475,7 @@ def update_charts(start_year, end_year, selected_platforms):
      Input('year-start', 'value'),
      Input('year-end', 'value')]
 )
+@serve_prerendered()
 def update_top_games(selected_platforms, start_year, end_year):
     if not selected_platforms:
         return html.Div("Select platforms to view their top games", 
@@ -308,14 +308,18 @@
 #     )
 
 import pandas as pd
-from dash import html, dcc, callback, Input, Output
+from dash import html, dcc, callback, Input, Output, State
 import plotly.express as px
 import plotly.graph_objects as go
+import dash_bootstrap_components as dbc
 from utils.data_loading import load_vgsales_data
 from utils.data_processing import preprocess_publisher_data
 from components.cards.stats_card import create_stat_card
-from components.charts.publisher_charts import create_publisher_timeline
-from utils.constants import COLORS, CHART_TEMPLATE
+from components.charts.publisher_charts import create_publisher_timeline, create_publisher_share_race
+from utils.constants import COLORS, CHART_TEMPLATE, BACKGROUND_CALLBACK_CONFIG
+from utils.level_of_detail import choose_top_n, top_n_with_other
+from utils.prerender import serve_prerendered
+from utils.downsampling import downsample_series
 
 def create_publisher_analysis_layout():
     df = load_vgsales_data()
@@ -384,6 +388,14 @@ def create_publisher_analysis_layout():
             )
         ], className="grid grid-cols-1 md:grid-cols-3 gap-6 mb-8"),
         
+        # Background job progress
+        html.Div(
+            dbc.Progress(id='publisher-progress', value=0, striped=True, animated=True),
+            id='publisher-progress-container',
+            className="mb-4",
+            style={'visibility': 'hidden'}
+        ),
+        
         # Charts Section
         html.Div([
             # Market Share
@@ -398,6 +410,12 @@ def create_publisher_analysis_layout():
                 dcc.Graph(id='publisher-timeline')
             ], className="bg-white p-6 rounded-lg shadow-lg mb-8"),
             
+            # Year-by-year share race
+            html.Div([
+                html.H2("Market Share by Year", className="text-xl font-semibold mb-4"),
+                create_publisher_share_race()
+            ], className="bg-white p-6 rounded-lg shadow-lg mb-8"),
+            
             # Genre Focus
             html.Div([
                 html.H2("Genre Distribution", className="text-xl font-semibold mb-4"),
@@ -421,9 +439,20 @@ def create_publisher_analysis_layout():
      Output('publisher-regional-performance', 'figure')],
     [Input('year-start', 'value'),
      Input('year-end', 'value'),
-     Input('publisher-selector', 'value')]
+     Input('publisher-selector', 'value')],
+    State('viewport-store', 'data'),
+    background=True,
+    interval=BACKGROUND_CALLBACK_CONFIG['interval'],
+    progress=[Output('publisher-progress', 'value'),
+              Output('publisher-progress', 'label')],
+    progress_default=[0, ""],
+    running=[(Output('publisher-progress-container', 'style'),
+              {'visibility': 'visible'}, {'visibility': 'hidden'})],
+    cancel=[Input('url', 'pathname')]
 )
-def update_charts(start_year, end_year, publishers):
+@serve_prerendered(ignore=[3])
+def update_charts(set_progress, start_year, end_year, publishers, viewport):
+    set_progress((0, "Filtering data"))
     df = load_vgsales_data()
     
     # Filter data
@@ -432,13 +461,20 @@ def update_charts(start_year, end_year, publishers):
         mask &= df['Publisher'].isin(publishers)
     df_filtered = df[mask]
     
+    # Aggregate once per publisher; every chart reduces this to top N + Other
+    regions = ['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']
+    publisher_totals = df_filtered.groupby('Publisher', as_index=False)[regions + ['Global_Sales']].sum()
+    
     # Market Share Chart
-    publisher_sales = df_filtered.groupby('Publisher')['Global_Sales'].sum().sort_values(ascending=True)
+    set_progress((10, "Market share"))
+    publisher_sales = top_n_with_other(
+        publisher_totals, 'Publisher', n=choose_top_n('bar', viewport)
+    ).iloc[::-1]
     market_share_fig = go.Figure(go.Bar(
-        x=publisher_sales.values,
-        y=publisher_sales.index,
+        x=publisher_sales['Global_Sales'],
+        y=publisher_sales['Publisher'],
         orientation='h',
-        text=publisher_sales.values.round(1),
+        text=publisher_sales['Global_Sales'].round(1),
         textposition='outside',
         marker_color=COLORS['primary']
     ))
@@ -451,7 +487,12 @@ def update_charts(start_year, end_year, publishers):
     )
     
     # Timeline Chart
+    set_progress((30, "Timeline"))
     timeline_data = df_filtered.groupby(['Year', 'Publisher'])['Global_Sales'].sum().reset_index()
+    timeline_data = top_n_with_other(
+        timeline_data, 'Publisher', n=choose_top_n('line', viewport), keys=['Year']
+    )
+    timeline_data = downsample_series(timeline_data, 'Year', 'Global_Sales', group='Publisher')
     timeline_fig = px.line(
         timeline_data,
         x='Year',
@@ -462,7 +503,11 @@ def update_charts(start_year, end_year, publishers):
     timeline_fig.update_layout(template=CHART_TEMPLATE)
     
     # Genre Focus Chart
+    set_progress((50, "Genre distribution"))
     genre_data = df_filtered.groupby(['Publisher', 'Genre'])['Global_Sales'].sum().reset_index()
+    genre_data = top_n_with_other(
+        genre_data, 'Publisher', n=choose_top_n('treemap', viewport), keys=['Genre']
+    )
     genre_fig = px.treemap(
         genre_data,
         path=['Publisher', 'Genre'],
@@ -472,8 +517,10 @@ def update_charts(start_year, end_year, publishers):
     genre_fig.update_layout(template=CHART_TEMPLATE)
     
     # Regional Performance Chart
-    regions = ['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']
-    regional_data = df_filtered.groupby('Publisher')[regions].sum()
+    set_progress((80, "Regional performance"))
+    regional_data = top_n_with_other(
+        publisher_totals, 'Publisher', n=choose_top_n('grouped_bar', viewport)
+    ).set_index('Publisher')
     
     regional_fig = go.Figure()
     for region in regions:
@@ -319,6 +319,8 @@ from utils.data_processing import preprocess_sales_data
 from components.cards.stats_card import create_stat_card
 from components.charts.regional_charts import create_regional_distribution_pie
 from utils.constants import COLORS, CHART_TEMPLATE
+from utils.prerender import serve_prerendered
+from utils.downsampling import downsample_series
 
 # Modern theme constants
 THEME = {
@@ -509,6 +511,7 @@ def create_sales_analysis_layout():
      Output('date-range', 'end_date')],
     Input('date-range-preset', 'value')
 )
+@serve_prerendered()
 def update_date_range(preset):
     """Updates date range based on preset selection."""
     end_date = datetime.now()
@@ -525,6 +528,7 @@ def update_date_range(preset):
      Input('date-range', 'end_date'),
      Input('sales-threshold', 'value')]
 )
+@serve_prerendered()
 def update_sales_trends(start_date, end_date, threshold):
     """Updates the sales trends visualization."""
     df = load_vgsales_data()
@@ -542,6 +546,9 @@ def update_sales_trends(start_date, end_date, threshold):
         'JP_Sales': 'sum',
         'Other_Sales': 'sum'
     }).reset_index()
+    yearly_sales = downsample_series(
+        yearly_sales, 'Year', ['Global_Sales', 'NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']
+    )
     
     fig = px.line(yearly_sales,
                   x='Year',
@@ -568,6 +575,7 @@ def update_sales_trends(start_date, end_date, threshold):
      Input('date-range', 'end_date'),
      Input('sales-threshold', 'value')]
 )
+@serve_prerendered()
 def update_regional_distribution(start_date, end_date, threshold):
     """Updates the regional distribution visualization."""
     df = load_vgsales_data()
@@ -610,6 +618,7 @@ def update_regional_distribution(start_date, end_date, threshold):
      Input('date-range', 'end_date'),
      Input('sales-threshold', 'value')]
 )
+@serve_prerendered()
 def update_genre_sales(start_date, end_date, threshold):
     """Updates the genre sales visualization."""
     df = load_vgsales_data()
@@ -646,6 +655,7 @@ def update_genre_sales(start_date, end_date, threshold):
      Input('date-range', 'end_date'),
      Input('sales-threshold', 'value')]
 )
+@serve_prerendered()
 def update_platform_sales(start_date, end_date, threshold):
     """Updates the platform sales visualization."""
     df = load_vgsales_data()
@@ -681,6 +691,7 @@ def update_platform_sales(start_date, end_date, threshold):
      Input('date-range', 'end_date'),
      Input('sales-threshold', 'value')]
 )
+@serve_prerendered()
 def update_top_games_visualization(start_date, end_date, threshold):
     df = load_vgsales_data()
     
@@ -0,0 +1,173 @@
+"""
+Year-by-year "race" animations of platform, genre and publisher share.
+
+Every frame of an animation comes from one per-year aggregation, the sales
+cube's years x categories matrix. Shares, optional running totals and each
+year's leading categories are computed for all years at once with array
+operations instead of one groupby per frame. Frames only carry what changes
+between years (bar lengths, labels and colors); bar positions, styling and
+layout live once in the base figure. Frame sets are cached per dataset
+version, so after the first build an animated chart costs no more than a
+static one.
+"""
+
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from config import ANIMATION_SETTINGS, CHART_COLORS
+from utils.charts_config import ChartConfigurator
+from utils.cube import get_sales_cube
+from utils.metrics import record_cache
+
+# (column, top_n, cumulative) -> figure JSON for the dataset version in _fingerprint
+_frame_sets: Dict[Hashable, Dict[str, Any]] = {}
+_fingerprint: Optional[str] = None
+
+def _animate_args(frame_duration: int, transition_duration: int) -> Dict[str, Any]:
+    """Plotly.animate options for the play button and slider steps."""
+    return {
+        'mode': 'immediate',
+        'fromcurrent': True,
+        'frame': {**ANIMATION_SETTINGS['frame'], 'duration': frame_duration, 'redraw': False},
+        'transition': {**ANIMATION_SETTINGS['transition'], 'duration': transition_duration}
+    }
+
+def _build_share_race(sales: pd.DataFrame, top_n: int, cumulative: bool) -> Dict[str, Any]:
+    """
+    Build the figure JSON of a share race from a years x categories matrix.
+
+    Args:
+        sales (pd.DataFrame): Sales per year (rows) and category (columns)
+        top_n (int): Number of bars per frame
+        cumulative (bool): Use running totals instead of per-year sales
+
+    Returns:
+        Dict[str, Any]: Figure JSON with one frame per year that has sales
+    """
+    column = sales.columns.name
+    values = sales.to_numpy()
+    if cumulative:
+        values = np.cumsum(values, axis=0)
+    totals = values.sum(axis=1)
+    has_sales = totals > 0
+    years = sales.index.to_numpy()[has_sales]
+    shares = values[has_sales] / totals[has_sales, None] * 100
+
+    # Leading categories of every year at once; ties keep label order
+    top_n = min(top_n, shares.shape[1])
+    order = np.argsort(-shares, axis=1, kind='stable')[:, :top_n]
+    top_shares = np.round(np.take_along_axis(shares, order, axis=1), 2)
+    labels = np.where(top_shares > 0, sales.columns.to_numpy(dtype=object)[order], '')
+    palette = np.asarray(CHART_COLORS['palette'], dtype=object)
+    colors = palette[order % len(palette)]
+
+    frames = [{
+        'name': str(int(year)),
+        'data': [{
+            'type': 'bar',
+            'x': top_shares[i].tolist(),
+            'text': labels[i].tolist(),
+            'marker': {'color': colors[i].tolist()}
+        }]
+    } for i, year in enumerate(years)]
+
+    def build():
+        fig = go.Figure(go.Bar(
+            x=[],
+            y=[],
+            orientation='h',
+            text=[],
+            textposition='auto',
+            texttemplate='%{text}',
+            hovertemplate=(
+                f"{column}: %{{text}}<br>"
+                "Share: %{x:.1f}%<extra></extra>"
+            )
+        ))
+
+        fig.update_layout(
+            template='plotly_white',
+            showlegend=False,
+            xaxis_title='Share of Global Sales (%)',
+            yaxis=dict(autorange='reversed', showticklabels=False),
+            margin=dict(l=20, r=20, t=40, b=20)
+        )
+        return fig
+
+    title = f"{column} Share of {'Cumulative ' if cumulative else ''}Global Sales by Year"
+    if not frames:
+        return ChartConfigurator.from_skeleton(
+            ('share_race', column), build, [{}], {'title': {'text': title}}
+        ).to_plotly_json()
+
+    frame_duration = ANIMATION_SETTINGS['frame']['duration']
+    transition_duration = ANIMATION_SETTINGS['transition']['duration']
+    figure = ChartConfigurator.from_skeleton(('share_race', column), build, [
+        {'y': list(range(top_n)), **frames[0]['data'][0]}
+    ], {
+        'title': {'text': title},
+        'xaxis': {'range': [0, float(top_shares.max()) * 1.05]},
+        'margin': {'b': 80},
+        'updatemenus': [{
+            'type': 'buttons',
+            'showactive': False,
+            'x': 0,
+            'y': -0.15,
+            'xanchor': 'left',
+            'yanchor': 'top',
+            'direction': 'left',
+            'buttons': [
+                {'label': 'Play', 'method': 'animate',
+                 'args': [None, _animate_args(frame_duration, transition_duration)]},
+                {'label': 'Pause', 'method': 'animate',
+                 'args': [[None], _animate_args(0, 0)]}
+            ]
+        }],
+        'sliders': [{
+            'active': 0,
+            'x': 0.15,
+            'len': 0.85,
+            'y': -0.1,
+            'currentvalue': {'prefix': 'Year: '},
+            'steps': [{
+                'label': frame['name'],
+                'method': 'animate',
+                'args': [[frame['name']], _animate_args(0, transition_duration)]
+            } for frame in frames]
+        }]
+    }).to_plotly_json()
+    figure['frames'] = frames
+    return figure
+
+def share_race(column: str, top_n: int = 10, cumulative: bool = False) -> Dict[str, Any]:
+    """
+    Get a year-by-year race chart of each category's share of global sales.
+
+    Args:
+        column (str): 'Platform', 'Genre' or 'Publisher'
+        top_n (int): Number of bars per frame
+        cumulative (bool): Share of all sales up to each year instead of the
+            share within the year
+
+    Returns:
+        Dict[str, Any]: Plotly figure JSON with one frame per year, a play
+        button and a year slider. It is shared between callers and must not
+        be modified.
+    """
+    global _fingerprint
+
+    cube = get_sales_cube()
+    if cube.dataset.fingerprint != _fingerprint:
+        _frame_sets.clear()
+        _fingerprint = cube.dataset.fingerprint
+
+    key = (column, top_n, cumulative)
+    figure = _frame_sets.get(key)
+    record_cache('animation frames', figure is not None)
+    if figure is None:
+        figure = _build_share_race(cube.by_year(column), top_n, cumulative)
+        _frame_sets[key] = figure
+    return figure
@@ -0,0 +1,92 @@
+"""
+Background callback execution for the video game sales dashboard.
+Heavy page callbacks run in worker processes managed by a disk-backed
+job manager so web workers stay free to serve light requests.
+"""
+
+import functools
+import logging
+from pathlib import Path
+
+import diskcache
+import psutil
+from dash import DiskcacheManager
+
+from utils.constants import BACKGROUND_CALLBACK_CONFIG
+from utils.data_loading import get_dataset_fingerprint
+from utils.metrics import callback_name, instrument_job, job_request, run_job, set_job_store
+
+logger = logging.getLogger(__name__)
+
+class BackgroundManager(DiskcacheManager):
+    """
+    DiskcacheManager that tolerates jobs exiting while they are inspected
+    and records callback metrics inside the jobs.
+
+    Dash checks and terminates finished jobs by pid. A job can exit between
+    ``psutil.pid_exists`` and ``psutil.Process``, which raises
+    ``NoSuchProcess`` inside the polling request and fails it with a 500.
+    An exited job is simply not running and needs no termination.
+
+    Callbacks run in the job process, so they are instrumented there and
+    report back through the manager's cache (see ``utils.metrics``).
+    """
+
+    def __init__(self, cache=None, cache_by=None, expire=None):
+        super().__init__(cache, cache_by, expire)
+        set_job_store(self.handle)
+
+    def make_job_fn(self, fn, progress, key=None):
+        name = callback_name(fn)
+        job_fn = super().make_job_fn(instrument_job(fn, name, self.handle), progress, key)
+        job_fn.callback_name = name
+        return job_fn
+
+    def call_job_fn(self, key, job_fn, args, context):
+        target = functools.partial(run_job, job_fn, job_request(job_fn.callback_name))
+        return super().call_job_fn(key, target, args, context)
+
+    def terminate_job(self, job):
+        try:
+            super().terminate_job(job)
+        except psutil.NoSuchProcess:
+            pass
+
+    def job_running(self, job):
+        try:
+            return super().job_running(job)
+        except psutil.NoSuchProcess:
+            return False
+
+def create_background_manager(cache_dir: str = None) -> DiskcacheManager:
+    """
+    Create the background callback manager used by the Dash app.
+
+    Results are cached on disk keyed by the callback inputs and the dataset
+    fingerprint, so repeated filter combinations are served without re-running
+    the callback and a new dataset invalidates every cached result.
+
+    Parameters:
+    -----------
+    cache_dir : str, optional
+        Directory for the job/result cache (defaults to the configured one)
+
+    Returns:
+    --------
+    DiskcacheManager
+        Manager to pass as ``background_callback_manager`` to ``dash.Dash``
+    """
+    cache_dir = cache_dir or BACKGROUND_CALLBACK_CONFIG['cache_dir']
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+
+    cache = diskcache.Cache(
+        cache_dir,
+        size_limit=BACKGROUND_CALLBACK_CONFIG['size_limit']
+    )
+    logger.info(f"Background callbacks use disk cache at {cache_dir}")
+
+    return BackgroundManager(
+        cache,
+        cache_by=[get_dataset_fingerprint],
+        expire=BACKGROUND_CALLBACK_CONFIG['expire']
+    )
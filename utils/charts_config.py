@@ -1,20 +1,154 @@
 """
 Chart configuration utilities for the video game sales dashboard.
 Provides consistent styling and configuration for all visualizations.
+
+Figures are built from skeletons: the first figure of a chart type and style
+is built and validated by plotly as usual, and its JSON (resolved template,
+layout, axis styling and trace attributes) is kept. Later figures of that
+type copy the skeleton and only inject their data arrays, skipping plotly's
+validation and template resolution, which otherwise dominate building a
+figure.
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Callable, Hashable, List, Optional, Union
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
 
 from .constants import COLOR_SCHEMES, CHART_CONFIG, REGIONS
+from .metrics import record_cache
+
+# Chart type and style -> plotly JSON of a figure built once
+_skeletons: Dict[Hashable, Dict[str, Any]] = {}
+
+# Stands in for a group's value in skeletons of charts with one trace per group
+GROUP_PLACEHOLDER = '\x00group\x00'
+
+def _merge(base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of base with updates applied, merging nested dicts instead of replacing them."""
+    merged = dict(base)
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def _px_colorway() -> List[str]:
+    """Colors plotly.express assigns to groups by default, in order."""
+    template = px.defaults.template or pio.templates.default
+    if isinstance(template, str):
+        template = pio.templates[template]
+    return list(template.layout.colorway or px.colors.qualitative.D3)
 
 class ChartConfigurator:
     """
     Utility class for managing chart configurations and styling.
     """
+
+    @staticmethod
+    def figure_skeleton(key: Hashable, build: Callable[[], go.Figure]) -> Dict[str, Any]:
+        """
+        Get the skeleton of a chart type and style, building it on first use.
+
+        Args:
+            key (Hashable): Chart type and style. Keep data-dependent values
+                such as titles out of it (pass them as overrides instead) so the
+                number of skeletons stays bounded
+            build (Callable[[], go.Figure]): Builds the figure with placeholder
+                data; called once per key
+
+        Returns:
+            Dict[str, Any]: Plotly JSON ('data' and 'layout') shared by every
+            figure of the key, which must not be modified
+        """
+        skeleton = _skeletons.get(key)
+        record_cache('figure skeleton', skeleton is not None)
+        if skeleton is None:
+            skeleton = build().to_plotly_json()
+            _skeletons[key] = skeleton
+        return skeleton
+
+    @staticmethod
+    def from_skeleton(
+        key: Hashable,
+        build: Callable[[], go.Figure],
+        traces: List[Dict[str, Any]],
+        layout: Optional[Dict[str, Any]] = None
+    ) -> go.Figure:
+        """
+        Create a figure from a skeleton with new data.
+
+        Trace i is the skeleton's trace i (or its last trace, for charts with a
+        varying number of traces) updated with ``traces[i]``. Overrides must
+        set every data array of a trace (x, y, z, text, customdata, ...), or
+        the skeleton's placeholder data shows through. Nested dicts are merged,
+        so ``{'line': {'color': c}}`` keeps the skeleton's line width.
+
+        The figure is not validated by plotly, so overrides are not checked and
+        must already be in plotly's form (e.g. a resolved colorscale, not a name).
+
+        Args:
+            key (Hashable): Chart type and style (see figure_skeleton)
+            build (Callable[[], go.Figure]): Builds the skeleton on first use
+            traces (List[Dict[str, Any]]): Data and per-call attributes per trace
+            layout (Dict[str, Any], optional): Per-call layout attributes (e.g. the title)
+
+        Returns:
+            go.Figure: Figure equal to the one ``build`` would make for this data
+        """
+        skeleton = ChartConfigurator.figure_skeleton(key, build)
+        templates = skeleton['data']
+        data = [_merge(templates[min(i, len(templates) - 1)], trace) for i, trace in enumerate(traces)]
+        return go.Figure(
+            {'data': data, 'layout': _merge(skeleton['layout'], layout or {})},
+            _validate=False
+        )
+
+    @staticmethod
+    def grouped_line_traces(
+        key: Hashable,
+        build: Callable[[], go.Figure],
+        data: pd.DataFrame,
+        x: str,
+        y: str,
+        color: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Trace overrides for a plotly.express line chart with one trace per color group.
+
+        The skeleton is built with a single group named GROUP_PLACEHOLDER; each
+        group of ``data`` gets that trace with its own rows, name, legend group
+        and hovertemplate, and the color plotly.express would give it (groups
+        in order of first appearance, cycling through the template colorway).
+
+        Args:
+            key (Hashable): Chart type and style (see figure_skeleton)
+            build (Callable[[], go.Figure]): Builds the skeleton on first use
+            data (pd.DataFrame): Rows to plot
+            x (str): Column for the x axis
+            y (str): Column for the y axis
+            color (str): Column whose values split the traces
+
+        Returns:
+            List[Dict[str, Any]]: Overrides for from_skeleton, one per group
+        """
+        template = ChartConfigurator.figure_skeleton(key, build)['data'][0]
+        colorway = _px_colorway()
+        traces = []
+        for i, (group, rows) in enumerate(data.groupby(color, sort=False)):
+            name = str(group)
+            traces.append({
+                'x': rows[x].to_numpy(),
+                'y': rows[y].to_numpy(),
+                'name': name,
+                'legendgroup': name,
+                'hovertemplate': template['hovertemplate'].replace(GROUP_PLACEHOLDER, name),
+                'line': {'color': colorway[i % len(colorway)]}
+            })
+        return traces
     
     @staticmethod
     def get_base_layout(
@@ -123,30 +257,39 @@ class ChartConfigurator:
         Returns:
             go.Figure: Configured bar chart
         """
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            x=data[x] if orientation == 'v' else data[y],
-            y=data[y] if orientation == 'v' else data[x],
-            orientation=orientation,
-            marker_color=COLOR_SCHEMES['primary']['main'],
-            hovertemplate='%{y:.2f}M units<extra></extra>' if orientation == 'v' 
-                         else '%{x:.2f}M units<extra></extra>'
-        ))
-        
-        fig.update_layout(
-            **ChartConfigurator.get_base_layout(title, size)
-        )
-        
         x_title = x.replace('_', ' ').title()
         y_title = 'Sales (Millions)' if y == 'Global_Sales' else y.replace('_', ' ').title()
         
         if orientation == 'h':
             x_title, y_title = y_title, x_title
-            
-        fig = ChartConfigurator.style_axes(fig, x_title, y_title)
         
-        return fig
+        def build():
+            fig = go.Figure()
+            
+            fig.add_trace(go.Bar(
+                x=[],
+                y=[],
+                orientation=orientation,
+                marker_color=COLOR_SCHEMES['primary']['main'],
+                hovertemplate='%{y:.2f}M units<extra></extra>' if orientation == 'v' 
+                             else '%{x:.2f}M units<extra></extra>'
+            ))
+            
+            fig.update_layout(
+                **ChartConfigurator.get_base_layout(title, size)
+            )
+            
+            return ChartConfigurator.style_axes(fig, x_title, y_title)
+        
+        return ChartConfigurator.from_skeleton(
+            ('sales_bar', size, orientation, x_title, y_title),
+            build,
+            [{
+                'x': data[x] if orientation == 'v' else data[y],
+                'y': data[y] if orientation == 'v' else data[x]
+            }],
+            {'title': {'text': title}}
+        )
 
     @staticmethod
     def create_time_series(
@@ -169,13 +312,12 @@ class ChartConfigurator:
         Returns:
             go.Figure: Configured time series chart
         """
-        fig = go.Figure()
-        
         if isinstance(value_columns, str):
             value_columns = [value_columns]
         
         # Ensure data is not empty
         if data.empty:
+            fig = go.Figure()
             fig.add_annotation(
                 text="No data available",
                 xref="paper",
@@ -186,32 +328,47 @@ class ChartConfigurator:
             )
             return fig
             
+        def build():
+            fig = go.Figure()
+            
+            fig.add_trace(go.Scatter(
+                x=[],
+                y=[],
+                mode='lines+markers',
+                line={'width': 2},
+                marker={'size': 6},
+                hovertemplate='%{y:.2f}M units<extra></extra>'
+            ))
+            
+            fig.update_layout(
+                **ChartConfigurator.get_base_layout(title, size)
+            )
+            
+            return ChartConfigurator.style_axes(
+                fig,
+                x_title=time_column,
+                y_title='Sales (Millions)'
+            )
+        
+        traces = []
         for col in value_columns:
             if col in data.columns:  # Only add trace if column exists
                 color = (COLOR_SCHEMES['regions'].get(col, COLOR_SCHEMES['primary']['main']) 
                         if col in REGIONS else COLOR_SCHEMES['primary']['main'])
                 
-                fig.add_trace(go.Scatter(
-                    x=data[time_column],
-                    y=data[col],
-                    name=REGIONS.get(col, col.replace('_', ' ')),
-                    mode='lines+markers',
-                    line={'color': color, 'width': 2},
-                    marker={'size': 6},
-                    hovertemplate='%{y:.2f}M units<extra></extra>'
-                ))
-        
-        fig.update_layout(
-            **ChartConfigurator.get_base_layout(title, size)
+                traces.append({
+                    'x': data[time_column],
+                    'y': data[col],
+                    'name': REGIONS.get(col, col.replace('_', ' ')),
+                    'line': {'color': color}
+                })
+        
+        return ChartConfigurator.from_skeleton(
+            ('time_series', size, time_column),
+            build,
+            traces,
+            {'title': {'text': title}}
         )
-        
-        fig = ChartConfigurator.style_axes(
-            fig,
-            x_title=time_column,
-            y_title='Sales (Millions)'
-        )
-        
-        return fig
 
     @staticmethod
     def create_pie_chart(
@@ -234,25 +391,31 @@ class ChartConfigurator:
         Returns:
             go.Figure: Configured pie chart
         """
-        fig = go.Figure(data=[go.Pie(
-            labels=data[names],
-            values=data[values],
-            hole=0.4,
-            textinfo='label+percent',
-            hovertemplate='%{label}<br>%{value:.2f}M units<br>%{percent}<extra></extra>'
-        )])
-        
-        fig.update_layout(
-            **ChartConfigurator.get_base_layout(title, size)
-        )
-        
-        fig.update_traces(
-            marker=dict(
-                colors=px.colors.qualitative.Set3[:len(data)]
+        def build():
+            fig = go.Figure(data=[go.Pie(
+                labels=[],
+                values=[],
+                hole=0.4,
+                textinfo='label+percent',
+                hovertemplate='%{label}<br>%{value:.2f}M units<br>%{percent}<extra></extra>'
+            )])
+            
+            fig.update_layout(
+                **ChartConfigurator.get_base_layout(title, size)
             )
-        )
+            
+            return fig
         
-        return fig
+        return ChartConfigurator.from_skeleton(
+            ('pie', size),
+            build,
+            [{
+                'labels': data[names],
+                'values': data[values],
+                'marker': {'colors': px.colors.qualitative.Set3[:len(data)]}
+            }],
+            {'title': {'text': title}}
+        )
 
     @staticmethod
     def create_heatmap(
@@ -276,26 +439,34 @@ class ChartConfigurator:
         if colorscale is None:
             colorscale = COLOR_SCHEMES['heatmap']['correlation']
             
-        fig = go.Figure(data=go.Heatmap(
-            z=data.values,
-            x=data.columns,
-            y=data.index,
-            colorscale=colorscale,
-            hoverongaps=False,
-            hovertemplate='%{y}<br>%{x}<br>Value: %{z:.2f}<extra></extra>'
-        ))
-        
-        layout = ChartConfigurator.get_base_layout(title, size)
-        layout.update({
-            'xaxis': {
-                'side': 'bottom',
-                'tickangle': 45
-            }
-        })
-        
-        fig.update_layout(**layout)
+        def build():
+            fig = go.Figure(data=go.Heatmap(
+                z=[],
+                x=[],
+                y=[],
+                colorscale=colorscale,
+                hoverongaps=False,
+                hovertemplate='%{y}<br>%{x}<br>Value: %{z:.2f}<extra></extra>'
+            ))
+            
+            layout = ChartConfigurator.get_base_layout(title, size)
+            layout.update({
+                'xaxis': {
+                    'side': 'bottom',
+                    'tickangle': 45
+                }
+            })
+            
+            fig.update_layout(**layout)
+            
+            return fig
         
-        return fig
+        return ChartConfigurator.from_skeleton(
+            ('heatmap', size, repr(colorscale)),
+            build,
+            [{'z': data.values, 'x': data.columns, 'y': data.index}],
+            {'title': {'text': title}}
+        )
 
     @staticmethod
     def create_regional_comparison(
@@ -316,29 +487,37 @@ class ChartConfigurator:
         Returns:
             go.Figure: Configured comparison chart
         """
-        fig = go.Figure()
+        regions = ['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']
         
-        for region in ['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']:
-            fig.add_trace(go.Bar(
-                name=REGIONS[region],
-                x=data[category],
-                y=data[region],
-                marker_color=COLOR_SCHEMES['regions'][region],
-                hovertemplate='%{x}<br>%{y:.2f}M units<extra></extra>'
-            ))
-        
-        fig.update_layout(
-            barmode='group',
-            **ChartConfigurator.get_base_layout(title, size)
-        )
+        def build():
+            fig = go.Figure()
+            
+            for region in regions:
+                fig.add_trace(go.Bar(
+                    name=REGIONS[region],
+                    x=[],
+                    y=[],
+                    marker_color=COLOR_SCHEMES['regions'][region],
+                    hovertemplate='%{x}<br>%{y:.2f}M units<extra></extra>'
+                ))
+            
+            fig.update_layout(
+                barmode='group',
+                **ChartConfigurator.get_base_layout(title, size)
+            )
+            
+            return ChartConfigurator.style_axes(
+                fig,
+                x_title=category.replace('_', ' '),
+                y_title='Sales (Millions)'
+            )
         
-        fig = ChartConfigurator.style_axes(
-            fig,
-            x_title=category.replace('_', ' '),
-            y_title='Sales (Millions)'
+        return ChartConfigurator.from_skeleton(
+            ('regional_comparison', size, category),
+            build,
+            [{'x': data[category], 'y': data[region]} for region in regions],
+            {'title': {'text': title}}
         )
-        
-        return fig
 
     @staticmethod
     def apply_dark_theme(fig: go.Figure) -> go.Figure:
@@ -151,6 +151,179 @@ CACHE_CONFIG = {
     'max_entries': 100
 }
 
+# Background callback settings
+BACKGROUND_CALLBACK_CONFIG = {
+    'cache_dir': 'cache/background',  # diskcache directory for jobs and results
+    'expire': 3600,                   # Seconds an unused cached result is kept
+    'size_limit': 2 ** 30,            # 1GB cap for the on-disk result cache
+    'interval': 500                   # Progress polling interval (ms)
+}
+
+# Level-of-detail settings for high-cardinality charts
+LOD_CONFIG = {
+    'other_label': 'Other',
+    'default_viewport': {'width': 1280, 'height': 800},
+    # Screen space a single category needs to stay readable
+    'pixels_per_item': {
+        'bar': 25,             # Horizontal bar height (px)
+        'grouped_bar': 90,     # Width of one group of regional bars (px)
+        'line': 40,            # Vertical space per legend entry (px)
+        'treemap': 150 * 100   # Area of one top-level tile (px^2)
+    },
+    'min_items': 5,
+    'max_items': {
+        'bar': 40,
+        'grouped_bar': 20,
+        'line': 12,
+        'treemap': 50
+    }
+}
+
+# Parallel output construction for multi-output callbacks
+PARALLEL_BUILD_CONFIG = {
+    'max_workers': 4,   # Threads shared by all callbacks in a process
+    'timeout': 60       # Seconds to wait for all outputs of one callback call
+}
+
+# Downsampling of dense timelines
+DOWNSAMPLING_CONFIG = {
+    'max_points': 500,   # Target points per trace (about one per pixel column)
+    'method': 'lttb'     # 'lttb' keeps the visual shape, 'minmax' every bucket extreme
+}
+
+# Game-level scatter explorer
+EXPLORER_CONFIG = {
+    'max_points': 50000,   # Above this many games the scatter switches to hexbins
+    'hexbin_gridsize': 60, # Hexagons across the x axis in density mode
+    'plot_height': 650,    # Fixed plot height (px) so hexagon markers tile
+    'marker_size': (3, 24) # Marker size range (px), scaled by sqrt(Global_Sales)
+}
+
+# Server-side paged games table
+GAMES_TABLE_CONFIG = {
+    'page_size': 25,
+    'max_page_size': 500  # Upper bound on rows a client can request per page
+}
+
+# Static pre-rendering of pages for their default filter states
+PRERENDER_CONFIG = {
+    'output_dir': 'prerendered'   # Artifacts are written to <output_dir>/<dataset fingerprint>/
+}
+
+# Batch report generation
+REPORT_CONFIG = {
+    'output_dir': 'reports',  # One sub-directory per preset
+    'image_scale': 2          # Resolution multiplier for PNG export
+}
+
+# Log file rotation
+LOGGING_CONFIG = {
+    'max_bytes': 10 * 1024 * 1024,  # Rotate the current log file at this size
+    'backup_count': 5,              # Rotated backups kept per log (name.log.1 ... name.log.5)
+    'compress_backups': True,       # Gzip rotated backups (name.log.N.gz)
+    'root_level': 'INFO',           # Level for module loggers; 'vgsales_dashboard' logs DEBUG
+    'json_format': False            # Emit console output as JSON lines (files stay text)
+}
+
+# Log viewer follow mode and paging
+LOG_VIEWER_CONFIG = {
+    'window_bytes': 256 * 1024,  # Most log text kept in the browser (and read per refresh)
+    'refresh_interval': 10 * 1000,  # Follow mode polling interval (ms)
+    'page_bytes': 64 * 1024      # Bytes read per page when browsing older/newer history
+}
+
+# Log search index
+LOG_INDEX_CONFIG = {
+    'db_path': 'cache/log_index.sqlite',  # Rebuilt from the log files if deleted
+    'max_results': 500                    # Upper bound on entries returned per search
+}
+
+# Callback instrumentation
+METRICS_CONFIG = {
+    'path': '/metrics',
+    'seconds_buckets': [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10],
+    'bytes_buckets': [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216],
+    'recent_calls': 2000,  # Calls kept for the performance page percentiles
+    'load_events': 50,     # Dataset/index (re)builds kept for the performance page
+    'slowest_calls': 15,   # Rows in the performance page's slowest requests table
+    'job_report_expire': 3600,  # Seconds an uncollected background job report is kept
+    'refresh_interval': 5 * 1000  # Performance page refresh (ms)
+}
+
+# On-demand request profiling (admin only)
+PROFILING_CONFIG = {
+    'token_env': 'VGSALES_ADMIN_TOKEN',  # Profiling is disabled unless this variable is set
+    'cookie': 'vgsales_profile',
+    'output_dir': 'profiles',
+    'max_profiles': 50,   # Newest profiles kept; older ones are deleted
+    'min_ms': 20,         # Faster calls are not worth keeping
+    'exclude_callbacks': ['pages.perf.update_perf']  # Polling callbacks that would crowd out the rest
+}
+
+# Synthetic datasets (python -m utils.synthetic_data)
+SYNTHETIC_DATA_CONFIG = {
+    'seed': 42,
+    'chunk_rows': 500_000,           # Rows generated and written at a time
+    'sales_noise': 0.3,              # Lognormal sigma applied to copied sales figures
+    'publisher_tail_exponent': 1.5   # Zipf exponent of the publishers not in the real data
+}
+
+# Data layer benchmarks (python -m benchmarks.run)
+BENCHMARK_CONFIG = {
+    'scales': [1, 10, 100, 1000],        # Dataset sizes as multiples of vgsales.csv
+    'data_dir': 'benchmarks/data',       # Generated scaled datasets
+    'results_dir': 'benchmarks/results',
+    'seed': 42,
+    'min_time': 0.5,      # Seconds each function is repeated for
+    'max_repeats': 50,
+    'rounds': 3,          # Interleaved passes over all functions per scale
+    'regression_threshold': 1.10,  # compare flags functions at least this much slower...
+    'min_delta_ms': 0.5            # ...and by at least this much
+}
+
+# Callback load test (python -m benchmarks.load_test)
+LOAD_TEST_CONFIG = {
+    'pages': ['/', '/sales', '/genre', '/platform', '/publisher', '/explorer', '/games', '/logs', '/perf'],
+    'concurrency': 8,
+    'duration': 30,        # Seconds per run
+    'variants': 20,        # Synthesized request bodies per callback
+    'seed': 42,
+    'port': 8051,          # Port of the locally started server
+    'startup_timeout': 180,
+    'timeout': 120,        # Seconds per request, including background callback polling
+    'router_output': 'page-content.children',
+    'exclude_outputs': ['url'],  # Dash's own background-callback cancellation hooks
+    'client_values': {     # Props set in the browser by clientside callbacks
+        'viewport-store.data': {'width': 1440, 'height': 900}
+    },
+    'text_values': ['error', 'warning', 'loaded', 'dataset', 'callback', 'cache'],
+    'filter_queries': ['', '{Genre} = Action', '{Platform} = PS2', '{Year} >= 2005',
+                       '{Global_Sales} > 1', '{Name} contains Mario']
+}
+
+# Per-page memory profile (python -m benchmarks.memory)
+MEMORY_PROFILE_CONFIG = {
+    'pages': ['/', '/sales', '/genre', '/platform', '/publisher', '/logs'],
+    'variants': 5,              # Synthesized request bodies per callback
+    'frames': 32,               # Traceback depth for attribution (reaches from numpy into pages/)
+    'snapshot_step': 1024 * 1024,  # Minimum growth before the near-peak snapshot is retaken
+    'sample_interval': 0.002,      # Seconds between checks for a new peak to snapshot
+    'top_sites': 10,
+    'regression_threshold': 1.10,  # --baseline flags peaks at least this much larger...
+    'regression_min_mb': 2.0       # ...and by at least this much
+}
+
+# Cold-start benchmark settings (python -m benchmarks.cold_start)
+COLD_START_CONFIG = {
+    'runs': 5,                  # Fresh processes measured (the median is checked)
+    'warmup_runs': 1,           # Untimed runs that compile bytecode first
+    'page': '/',                # Page whose first response ends the cold start
+    'budget_file': 'benchmarks/startup_budget.json',
+    'budget_headroom': 1.5,     # --update-budget allows this multiple of the measured medians
+    'top_modules': 15,
+    'timeout': 300
+}
+
 # Error messages
 ERROR_MESSAGES = {
     'data_loading': 'Error loading data: {}',
@@ -0,0 +1,232 @@
+"""
+Per-year sales cube over the shared dataset for the heatmaps.
+
+Every heatmap is a matrix of one categorical dimension against another (or
+against the sales regions), aggregated over a year range. The cube
+aggregates the dataset once per version into per-year cells for each
+dimension and each pair of dimensions, holding the sales sums and row count
+of the cell. A query adds up the cells of the requested years into dense
+sum/count matrices, so its cost depends on the number of categories and
+years, not on the number of rows.
+
+Only combinations that occur are stored, ordered by year so a year range is
+a contiguous slice of the cells; fully dense per-year matrices would grow
+with years x publishers x genres on the synthetic scales.
+"""
+
+import itertools
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.metrics import record_load
+from utils.shared_data import CATEGORY_COLUMNS, SALES_COLUMNS, SharedDataset, get_shared_dataset
+
+logger = logging.getLogger(__name__)
+
+REGION_COLUMNS = ['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']
+
+class SalesCube:
+    """
+    Per-year sum/count aggregates of the shared dataset.
+
+    Attributes:
+        dataset (SharedDataset): Dataset the cube was built for
+        years (np.ndarray): Known release years, ascending. Rows without a
+            year are kept in an extra slot after the last year, which only
+            unfiltered queries include.
+        n_cells (int): Number of stored cells over all dimensions and pairs
+    """
+
+    def __init__(self, dataset: SharedDataset):
+        self.dataset = dataset
+        known = ~np.isnan(dataset.year)
+        self.years = np.unique(dataset.year[known])
+        slots = np.where(known, np.searchsorted(self.years, dataset.year), len(self.years))
+
+        self._cells: Dict[Tuple[str, ...], Dict[str, np.ndarray]] = {}
+        for column in CATEGORY_COLUMNS:
+            self._cells[(column,)] = self._aggregate(slots, (column,), SALES_COLUMNS)
+        for pair in itertools.combinations(CATEGORY_COLUMNS, 2):
+            self._cells[pair] = self._aggregate(slots, pair, ['Global_Sales'])
+        self.n_cells = sum(len(cells['flat']) for cells in self._cells.values())
+
+    def _aggregate(self, slots: np.ndarray, dims: Tuple[str, ...],
+                   value_columns: List[str]) -> Dict[str, np.ndarray]:
+        """Sum rows into (year slot, category codes) cells, sorted by slot."""
+        shape = [len(self.dataset.categories[dim]) for dim in dims]
+        size = int(np.prod(shape))
+        valid = np.ones(len(slots), dtype=bool)
+        flat = np.zeros(len(slots), dtype=np.int64)
+        for dim, length in zip(dims, shape):
+            codes = self.dataset.codes[dim]
+            # Missing categories are dropped, as groupby and pivot_table do
+            valid &= codes >= 0
+            flat = flat * length + codes
+
+        keys, inverse = np.unique(slots[valid] * size + flat[valid], return_inverse=True)
+        cells = {
+            'flat': keys % size,
+            'bounds': np.searchsorted(keys // size, np.arange(len(self.years) + 2)),
+            'count': np.bincount(inverse).astype(np.float64)
+        }
+        for column in value_columns:
+            cells[column] = np.bincount(inverse, weights=self.dataset.sales[column][valid])
+        return cells
+
+    def _dense(self, dims: Tuple[str, ...], year_range: Optional[Tuple[float, float]],
+               value_columns: List[str]) -> Dict[str, np.ndarray]:
+        """Add up the cells of a year range into dense arrays over the dimensions."""
+        cells = self._cells[dims]
+        if year_range is None:
+            lo, hi = 0, len(self.years) + 1
+        else:
+            lo = np.searchsorted(self.years, year_range[0], side='left')
+            hi = np.searchsorted(self.years, year_range[1], side='right')
+        start, end = cells['bounds'][lo], max(cells['bounds'][hi], cells['bounds'][lo])
+        flat = cells['flat'][start:end]
+
+        shape = [len(self.dataset.categories[dim]) for dim in dims]
+        size = int(np.prod(shape))
+        return {
+            column: np.bincount(flat, weights=cells[column][start:end], minlength=size).reshape(shape)
+            for column in ['count'] + value_columns
+        }
+
+    def _label_mask(self, column: str, labels: Optional[Iterable[str]]) -> np.ndarray:
+        """Boolean mask over a dimension's categories, all True without labels."""
+        mask = np.ones(len(self.dataset.categories[column]), dtype=bool)
+        if labels is not None:
+            mask[:] = False
+            mask[self.dataset.codes_for(column, labels)] = True
+        return mask
+
+    def totals(self, column: str, year_range: Optional[Tuple[float, float]] = None,
+               value: str = 'Global_Sales', labels: Optional[Iterable[str]] = None) -> pd.Series:
+        """
+        Total sales per category, like ``df.groupby(column)[value].sum()``.
+
+        Args:
+            column (str): Categorical column to group by
+            year_range (Tuple[float, float], optional): Inclusive year range;
+                None includes every row, also those without a year
+            value (str): Sales column to sum
+            labels (Iterable[str], optional): Only include these categories
+
+        Returns:
+            pd.Series: Sum per category with rows in the selection, in label order
+        """
+        dense = self._dense((column,), year_range, [value])
+        keep = (dense['count'] > 0) & self._label_mask(column, labels)
+        index = pd.Index(self.dataset.categories[column][keep], name=column)
+        return pd.Series(dense[value][keep], index=index, name=value)
+
+    def by_year(self, column: str, value: str = 'Global_Sales') -> pd.DataFrame:
+        """
+        Sales per known year and category.
+
+        Args:
+            column (str): Categorical column
+            value (str): Sales column to sum
+
+        Returns:
+            pd.DataFrame: Years x categories (every category, zero where a
+            category has no sales in a year)
+        """
+        cells = self._cells[(column,)]
+        n_years, size = len(self.years), len(self.dataset.categories[column])
+        end = cells['bounds'][n_years]
+        slots = np.repeat(np.arange(n_years), np.diff(cells['bounds'][:n_years + 1]))
+        values = np.bincount(slots * size + cells['flat'][:end], weights=cells[value][:end],
+                             minlength=n_years * size).reshape(n_years, size)
+        return pd.DataFrame(values, index=pd.Index(self.years, name='Year'),
+                            columns=pd.Index(self.dataset.categories[column], name=column))
+
+    def matrix(self, rows: str, columns: str, year_range: Optional[Tuple[float, float]] = None,
+               aggfunc: str = 'sum',
+               labels: Optional[Dict[str, Iterable[str]]] = None) -> pd.DataFrame:
+        """
+        Aggregate sales into a rows x columns matrix.
+
+        With a categorical ``columns`` this matches ``pivot_table`` of
+        Global_Sales: only categories with rows in the selection are
+        included, in label order, and empty cells are NaN. With
+        ``columns='Region'`` it matches grouping ``rows`` and aggregating
+        each regional sales column.
+
+        Args:
+            rows (str): Categorical column for the matrix rows
+            columns (str): Categorical column for the matrix columns, or 'Region'
+            year_range (Tuple[float, float], optional): Inclusive year range;
+                None includes every row, also those without a year
+            aggfunc (str): 'sum' or 'mean'
+            labels (Dict[str, Iterable[str]], optional): Categories to
+                restrict each dimension to, like filtering with ``isin`` first
+
+        Returns:
+            pd.DataFrame: The aggregated matrix
+
+        Raises:
+            ValueError: For an unknown aggfunc or pair of dimensions
+        """
+        if aggfunc not in ('sum', 'mean'):
+            raise ValueError(f"Unsupported aggfunc: {aggfunc}")
+        labels = labels or {}
+
+        if columns == 'Region':
+            dense = self._dense((rows,), year_range, REGION_COLUMNS)
+            keep = (dense['count'] > 0) & self._label_mask(rows, labels.get(rows))
+            values = np.column_stack([dense[column][keep] for column in REGION_COLUMNS])
+            if aggfunc == 'mean':
+                values = values / dense['count'][keep][:, None]
+            return pd.DataFrame(values, columns=REGION_COLUMNS,
+                                index=pd.Index(self.dataset.categories[rows][keep], name=rows))
+
+        if (rows, columns) in self._cells:
+            dense = self._dense((rows, columns), year_range, ['Global_Sales'])
+        elif (columns, rows) in self._cells:
+            dense = {key: value.T for key, value in
+                     self._dense((columns, rows), year_range, ['Global_Sales']).items()}
+        else:
+            raise ValueError(f"No cube for {rows} x {columns}")
+
+        row_codes = np.flatnonzero(self._label_mask(rows, labels.get(rows)))
+        column_codes = np.flatnonzero(self._label_mask(columns, labels.get(columns)))
+        counts = dense['count'][np.ix_(row_codes, column_codes)]
+        sums = dense['Global_Sales'][np.ix_(row_codes, column_codes)]
+        keep_rows, keep_columns = counts.sum(axis=1) > 0, counts.sum(axis=0) > 0
+        counts = counts[np.ix_(keep_rows, keep_columns)]
+        sums = sums[np.ix_(keep_rows, keep_columns)]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            values = sums / counts if aggfunc == 'mean' else sums
+        values = np.where(counts > 0, values, np.nan)
+        return pd.DataFrame(
+            values,
+            index=pd.Index(self.dataset.categories[rows][row_codes[keep_rows]], name=rows),
+            columns=pd.Index(self.dataset.categories[columns][column_codes[keep_columns]],
+                             name=columns)
+        )
+
+_cube: Optional[SalesCube] = None
+
+def get_sales_cube() -> SalesCube:
+    """
+    Get the sales cube for the current dataset version.
+
+    Returns:
+        SalesCube: Cube built over the shared dataset
+    """
+    global _cube
+
+    dataset = get_shared_dataset()
+    if _cube is None or _cube.dataset is not dataset:
+        started = time.perf_counter()
+        _cube = SalesCube(dataset)
+        record_load('sales cube', time.perf_counter() - started,
+                    f"{dataset.fingerprint}, {_cube.n_cells} cells")
+        logger.info(f"Built sales cube with {_cube.n_cells} cells for dataset {dataset.fingerprint}")
+    return _cube
@@ -9,12 +9,9 @@ from typing import Tuple, Dict, Optional
 import logging
 from pathlib import Path
 from functools import lru_cache
+import hashlib
+import os
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class DataLoadingError(Exception):
@@ -184,25 +181,30 @@ if __name__ == "__main__":
         logger.error(f"Failed to load data: {str(e)}")
 
 @lru_cache(maxsize=1)
-def _load_vgsales_data_cached(file_path: str = "data/vgsales.csv") -> pd.DataFrame:
+def _load_vgsales_data_cached(file_path: str, fingerprint: str) -> pd.DataFrame:
     """
     Internal cached function to load the video game sales dataset.
+    
+    The fingerprint is part of the cache key, so replacing the file loads the
+    new version instead of returning the cached frame of the old one.
     """
+    if file_path.endswith('.parquet'):
+        return pd.read_parquet(file_path)
     return pd.read_csv(file_path)
 
 def load_vgsales_data(file_path: str = "data/vgsales.csv") -> pd.DataFrame:
     """
-    Load the video game sales dataset from CSV.
+    Load the video game sales dataset from CSV (or Parquet, e.g. a synthetic dataset).
     
     Args:
-        file_path (str): Path to the CSV file
+        file_path (str): Path to the CSV or .parquet file
         
     Returns:
         pd.DataFrame: Loaded and validated DataFrame
     """
     try:
-        # Use cached data loading
-        df = _load_vgsales_data_cached(file_path)
+        # Use cached data loading for the current version of the file
+        df = _load_vgsales_data_cached(file_path, get_dataset_fingerprint(file_path))
         validate_dataset(df)
         logger.info(f"Successfully loaded dataset with {len(df)} records")
         return df
@@ -214,4 +216,24 @@ def load_vgsales_data(file_path: str = "data/vgsales.csv") -> pd.DataFrame:
 def clear_data_cache():
     """Clear the data loading cache."""
     _load_vgsales_data_cached.cache_clear()
-    logger.info("Data cache cleared")
\ No newline at end of file
+    logger.info("Data cache cleared")
+
+def get_dataset_fingerprint(file_path: str = "data/vgsales.csv") -> str:
+    """
+    Get a cheap fingerprint identifying the current version of the dataset.
+    
+    The fingerprint is derived from the file's path, size and modification
+    time, so it changes whenever the CSV is replaced without having to read it.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        
+    Returns:
+        str: Hex digest identifying the dataset version
+    """
+    try:
+        stat = os.stat(file_path)
+        key = f"{Path(file_path).resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+    except OSError:
+        key = f"{file_path}:missing"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
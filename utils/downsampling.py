@@ -0,0 +1,168 @@
+"""
+Time-series downsampling for the video game sales dashboard.
+Reduces dense timelines to a target number of points per trace while
+keeping their visual shape, so payload and render time stay flat as the
+time granularity gets finer (yearly -> monthly -> weekly).
+"""
+
+from typing import Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.constants import DOWNSAMPLING_CONFIG
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with the largest-triangle-three-buckets algorithm.
+
+    The first and last points are always kept. The remaining points are split
+    into ``n_out - 2`` buckets and from each bucket the point forming the
+    largest triangle with the previously selected point and the average of
+    the next bucket is kept, which preserves peaks and troughs.
+
+    Parameters:
+    -----------
+    x : numpy.ndarray
+        Sorted x values (numeric)
+    y : numpy.ndarray
+        y values
+    n_out : int
+        Number of points to keep
+
+    Returns:
+    --------
+    numpy.ndarray
+        Positions of the selected points in ascending order
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    # Average of every bucket (the last "bucket" is the last point), so the
+    # loop only has to evaluate triangle areas
+    sizes = np.diff(np.append(edges, n))
+    avg_x = np.add.reduceat(x, edges) / sizes
+    avg_y = np.add.reduceat(y, edges) / sizes
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - avg_x[i + 1]) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (avg_y[i + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select the minimum and maximum point of each bucket.
+
+    Cheaper than LTTB and guarantees every local extreme at bucket
+    resolution is kept, at the cost of a less even spacing.
+
+    Parameters:
+    -----------
+    x : numpy.ndarray
+        Sorted x values (numeric)
+    y : numpy.ndarray
+        y values
+    n_out : int
+        Approximate number of points to keep
+
+    Returns:
+    --------
+    numpy.ndarray
+        Positions of the selected points in ascending order
+    """
+    n = len(x)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+
+    n_buckets = (n_out - 2) // 2
+    edges = np.linspace(1, n - 1, n_buckets + 1).astype(np.int64)
+    selected = [0, n - 1]
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        bucket = y[lo:hi]
+        selected.append(lo + int(np.argmin(bucket)))
+        selected.append(lo + int(np.argmax(bucket)))
+
+    return np.unique(selected)
+
+DOWNSAMPLERS: Dict[str, Callable[[np.ndarray, np.ndarray, int], np.ndarray]] = {
+    'lttb': lttb_indices,
+    'minmax': minmax_indices
+}
+
+def _numeric(values: pd.Series) -> np.ndarray:
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(np.float64)
+    return values.to_numpy(dtype=np.float64)
+
+def downsample_series(data: pd.DataFrame,
+                      x: str,
+                      y: Union[str, List[str]],
+                      group: Optional[str] = None,
+                      max_points: Optional[int] = None,
+                      method: Optional[str] = None) -> pd.DataFrame:
+    """
+    Downsample a long or wide time-series frame to a target point count per trace.
+
+    Each trace (one per ``group`` value in long format) with more than
+    ``max_points`` points is reduced independently. In wide format (several
+    ``y`` columns sharing one x axis) the rows selected for any column are
+    kept for all of them, so the traces stay aligned, e.g. for stacked areas.
+
+    Parameters:
+    -----------
+    data : pandas.DataFrame
+        Time-series data
+    x : str
+        Time column (numeric or datetime)
+    y : str or List[str]
+        Value column(s)
+    group : str, optional
+        Column identifying the trace of each row (long format)
+    max_points : int, optional
+        Target number of points per trace
+    method : str, optional
+        'lttb' or 'minmax'
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Selected rows, ordered by trace and time
+    """
+    max_points = max_points or DOWNSAMPLING_CONFIG['max_points']
+    select = DOWNSAMPLERS[method or DOWNSAMPLING_CONFIG['method']]
+    y_columns = [y] if isinstance(y, str) else list(y)
+
+    longest = len(data) if group is None or data.empty else data[group].value_counts().max()
+    if longest <= max_points:
+        return data
+
+    data = data.sort_values(x, kind='stable')
+    if group is None:
+        positions = {None: np.arange(len(data))}
+    else:
+        positions = data.groupby(group, sort=False).indices
+
+    xs = _numeric(data[x])
+    ys = {col: data[col].to_numpy(dtype=np.float64) for col in y_columns}
+
+    kept = []
+    for rows in positions.values():
+        if len(rows) <= max_points:
+            kept.append(rows)
+            continue
+        trace_keep = np.unique(np.concatenate([
+            rows[select(xs[rows], ys[col][rows], max_points)] for col in y_columns
+        ]))
+        kept.append(trace_keep)
+
+    return data.iloc[np.concatenate(kept)]
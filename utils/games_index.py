@@ -0,0 +1,256 @@
+"""
+Server-side paging, sorting and filtering of the full games catalogue.
+
+Sort orders are precomputed once per dataset version, so an unfiltered page
+is a slice of a presorted index. Filters are evaluated against the shared
+column arrays (category filters use per-category row lists) and applied to
+the presorted order with a single boolean lookup, so only the rows of the
+requested page are ever materialized.
+"""
+
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.metrics import record_load
+from utils.shared_data import CATEGORY_COLUMNS, SALES_COLUMNS, SharedDataset, get_shared_dataset
+
+logger = logging.getLogger(__name__)
+
+TABLE_COLUMNS = ['Rank', 'Name', 'Platform', 'Year', 'Genre', 'Publisher'] + SALES_COLUMNS
+SORTABLE_COLUMNS = ['Rank', 'Name', 'Year'] + CATEGORY_COLUMNS + SALES_COLUMNS
+NUMERIC_COLUMNS = ['Rank', 'Year'] + SALES_COLUMNS
+
+# Operators produced by the DataTable filter UI, symbol form -> word form
+FILTER_OPERATORS = {
+    '>=': 'ge', '<=': 'le', '<': 'lt', '>': 'gt', '!=': 'ne', '=': 'eq',
+    'ge': 'ge', 'le': 'le', 'lt': 'lt', 'gt': 'gt', 'ne': 'ne', 'eq': 'eq',
+    'contains': 'contains', 'datestartswith': 'datestartswith'
+}
+
+# One "{column} operator value" condition; the operator is read right after
+# the column and quoted values may contain operators and '&&'
+_CONDITION = re.compile(r"""
+    \s*\{(?P<column>[^}]*)\}\s*
+    (?P<operator>>=|<=|!=|<|>|=|(?:ge|le|lt|gt|ne|eq|contains|datestartswith)(?=\s))\s*
+    (?P<value>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|`(?:\\.|[^`\\])*`|(?:[^\s&]|&(?!&))+)\s*
+    (?:&&|$)
+""", re.VERBOSE)
+
+NUMERIC_OPERATORS = {
+    'ge': np.greater_equal, 'le': np.less_equal, 'lt': np.less,
+    'gt': np.greater, 'ne': np.not_equal, 'eq': np.equal
+}
+
+class FilterQueryError(ValueError):
+    """Raised for filter expressions the games table cannot evaluate."""
+    pass
+
+def parse_filter_query(filter_query: Optional[str]) -> List[Tuple[str, str, Any]]:
+    """
+    Parse a DataTable ``filter_query`` into (column, operator, value) triples.
+
+    Args:
+        filter_query (str, optional): Expression such as
+            '{Name} contains "Mario" && {Year} ge 2000'
+
+    Returns:
+        List[Tuple[str, str, Any]]: One condition per ``&&``-separated part,
+        with operators normalized to their word form (ge, le, lt, gt, ne,
+        eq, contains, datestartswith) and values kept as text (unquoted);
+        filter_mask converts them for numeric columns
+
+    Raises:
+        FilterQueryError: If a part is not a supported
+            ``{column} operator value`` condition
+    """
+    conditions = []
+    query = (filter_query or '').strip()
+    position = 0
+    while position < len(query):
+        match = _CONDITION.match(query, position)
+        if match is None:
+            raise FilterQueryError(f"Unsupported filter expression: {query[position:].strip()}")
+        value = match.group('value')
+        if value[:1] in ("'", '"', '`'):
+            value = value[1:-1].replace('\\' + value[0], value[0])
+        conditions.append((match.group('column'), FILTER_OPERATORS[match.group('operator')], value))
+        position = match.end()
+    return conditions
+
+class GamesIndex:
+    """
+    Presorted indexes over the shared dataset for the games table.
+
+    Attributes:
+        dataset (SharedDataset): Dataset the index was built for
+        orders (Dict[str, np.ndarray]): Ascending row order per sortable
+            column (ties broken by Rank, missing values last)
+        missing (Dict[str, int]): Number of trailing missing values per order
+    """
+
+    def __init__(self, dataset: SharedDataset):
+        self.dataset = dataset
+        frame = dataset.frame
+        self.rank = frame['Rank'].to_numpy(dtype=np.int64)
+        self.names = frame['Name'].astype(str).to_numpy(dtype=object)
+        self._names_lower = pd.Series(self.names).str.lower()
+
+        self.orders: Dict[str, np.ndarray] = {}
+        self.missing: Dict[str, int] = {}
+        for column in SORTABLE_COLUMNS:
+            keys = self._sort_keys(column)
+            order = np.lexsort((self.rank, keys))
+            # Missing values (NaN years, unknown publishers) always sort last
+            missing = np.isnan(keys[order]) if keys.dtype.kind == 'f' else keys[order] < 0
+            self.orders[column] = np.concatenate([order[~missing], order[missing]])
+            self.missing[column] = int(missing.sum())
+
+        # Row lists per category code: category filters gather instead of scan
+        self._category_rows: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for column in CATEGORY_COLUMNS:
+            codes = dataset.codes[column]
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(-1, len(dataset.categories[column]) + 1))
+            self._category_rows[column] = (order, bounds)
+
+    def _sort_keys(self, column: str) -> np.ndarray:
+        if column in CATEGORY_COLUMNS:
+            return self.dataset.codes[column]
+        if column == 'Name':
+            return pd.factorize(self.names, sort=True)[0]
+        if column == 'Rank':
+            return self.rank
+        if column == 'Year':
+            return self.dataset.year
+        return self.dataset.sales[column]
+
+    def _values(self, column: str) -> np.ndarray:
+        if column == 'Rank':
+            return self.rank.astype(np.float64)
+        if column == 'Year':
+            return self.dataset.year
+        return self.dataset.sales[column]
+
+    def _category_mask(self, column: str, labels: List[str]) -> np.ndarray:
+        order, bounds = self._category_rows[column]
+        mask = np.zeros(len(self.dataset), dtype=bool)
+        for code in self.dataset.codes_for(column, labels):
+            mask[order[bounds[code + 1]:bounds[code + 2]]] = True
+        return mask
+
+    def filter_mask(self, conditions: List[Tuple[str, str, Any]]) -> Optional[np.ndarray]:
+        """
+        Evaluate parsed filter conditions.
+
+        Args:
+            conditions (List[Tuple[str, str, Any]]): Output of parse_filter_query
+
+        Returns:
+            Optional[np.ndarray]: Boolean row mask, or None when nothing is filtered
+
+        Raises:
+            FilterQueryError: If a condition uses an unknown column or operator,
+                or a numeric column gets a value that is not a number
+        """
+        mask = None
+        for column, operator, value in conditions:
+            if column not in TABLE_COLUMNS:
+                raise FilterQueryError(f"Unknown column '{column}'")
+
+            if column in NUMERIC_COLUMNS:
+                if operator in ('contains', 'datestartswith'):
+                    operator = 'eq'
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    raise FilterQueryError(f"{column} needs a number, got '{value}'")
+                with np.errstate(invalid='ignore'):
+                    condition = NUMERIC_OPERATORS[operator](self._values(column), value)
+            elif column in CATEGORY_COLUMNS and operator in ('eq', 'ne'):
+                condition = self._category_mask(column, [str(value)])
+                if operator == 'ne':
+                    condition = ~condition
+            elif operator in ('contains', 'eq', 'datestartswith'):
+                # Match against the distinct labels, then expand to rows
+                text = str(value).lower()
+                if column == 'Name':
+                    labels, codes = self._names_lower, None
+                else:
+                    labels = pd.Series(self.dataset.categories[column]).astype(str).str.lower()
+                    codes = self.dataset.codes[column]
+                if operator == 'eq':
+                    matched = (labels == text).to_numpy()
+                elif operator == 'datestartswith':
+                    matched = labels.str.startswith(text).to_numpy()
+                else:
+                    matched = labels.str.contains(text, regex=False).to_numpy()
+                condition = matched if codes is None else np.isin(codes, np.flatnonzero(matched))
+            else:
+                raise FilterQueryError(f"Operator '{operator}' is not supported for {column}")
+
+            mask = condition if mask is None else mask & condition
+        return mask
+
+    def query(self,
+              page_current: int = 0,
+              page_size: int = 25,
+              sort_by: Optional[List[Dict[str, str]]] = None,
+              filter_query: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get one page of the games table.
+
+        Args:
+            page_current (int): Zero-based page number
+            page_size (int): Rows per page
+            sort_by (List[Dict[str, str]], optional): DataTable sort spec
+                ([{'column_id': ..., 'direction': 'asc'|'desc'}]); defaults to Rank
+            filter_query (str, optional): DataTable filter expression
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: Page records and total matching rows
+        """
+        column, direction = 'Rank', 'asc'
+        if sort_by:
+            column = sort_by[0]['column_id']
+            direction = sort_by[0].get('direction', 'asc')
+        if column not in self.orders:
+            raise FilterQueryError(f"Column '{column}' is not sortable")
+
+        order = self.orders[column]
+        if direction == 'desc':
+            present = len(order) - self.missing[column]
+            order = np.concatenate([order[:present][::-1], order[present:]])
+
+        mask = self.filter_mask(parse_filter_query(filter_query))
+        if mask is not None:
+            order = order[mask[order]]
+
+        start = page_current * page_size
+        rows = order[start:start + page_size]
+        page = self.dataset.frame.iloc[rows][TABLE_COLUMNS]
+        records = page.astype(object).where(page.notna(), None).to_dict('records')
+        return records, len(order)
+
+_index: Optional[GamesIndex] = None
+
+def get_games_index() -> GamesIndex:
+    """
+    Get the games table index for the current dataset version.
+
+    Returns:
+        GamesIndex: Index built over the shared dataset
+    """
+    global _index
+
+    dataset = get_shared_dataset()
+    if _index is None or _index.dataset is not dataset:
+        started = time.perf_counter()
+        _index = GamesIndex(dataset)
+        record_load('games index', time.perf_counter() - started, dataset.fingerprint)
+        logger.info(f"Built games table index for dataset {dataset.fingerprint}")
+    return _index
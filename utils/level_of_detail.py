@@ -0,0 +1,176 @@
+"""
+Level-of-detail utilities for the video game sales dashboard.
+Reduces high-cardinality dimensions to "top N plus Other", and dense point
+clouds to hexagonal bins, so chart payload and rendering time stay bounded
+regardless of how many categories or games exist.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.constants import LOD_CONFIG, SALES_COLUMNS
+
+def choose_top_n(chart_type: str, viewport: Optional[Dict] = None) -> int:
+    """
+    Choose how many categories a chart can show legibly in the viewport.
+
+    Parameters:
+    -----------
+    chart_type : str
+        One of 'bar', 'grouped_bar', 'line' or 'treemap'
+    viewport : dict, optional
+        Browser viewport as {'width': int, 'height': int}
+
+    Returns:
+    --------
+    int
+        Number of categories to show before collapsing the rest into "Other"
+    """
+    viewport = viewport or LOD_CONFIG['default_viewport']
+    width = viewport.get('width') or LOD_CONFIG['default_viewport']['width']
+    height = viewport.get('height') or LOD_CONFIG['default_viewport']['height']
+    per_item = LOD_CONFIG['pixels_per_item'][chart_type]
+
+    if chart_type == 'grouped_bar':
+        n = width // per_item
+    elif chart_type == 'treemap':
+        n = (width * height) // per_item
+    else:
+        n = height // per_item
+
+    return int(min(max(n, LOD_CONFIG['min_items']), LOD_CONFIG['max_items'][chart_type]))
+
+def top_n_with_other(data: pd.DataFrame,
+                     dimension: str,
+                     metric: str = 'Global_Sales',
+                     n: int = 10,
+                     keys: Optional[List[str]] = None,
+                     other_label: Optional[str] = None,
+                     value_columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Keep the top N values of a dimension and collapse the rest into "Other".
+
+    Works in a single pass over a pre-aggregated frame: dimension totals are
+    accumulated with ``np.bincount`` over the factorized dimension and the top
+    N are picked with ``np.argpartition``, so the cost depends on the number
+    of aggregated rows rather than the number of games.
+
+    Parameters:
+    -----------
+    data : pandas.DataFrame
+        Pre-aggregated data with one row per dimension value (and per key)
+    dimension : str
+        Column to reduce (e.g. 'Publisher')
+    metric : str
+        Column used to rank dimension values
+    n : int
+        Number of dimension values to keep
+    keys : List[str], optional
+        Additional grouping columns preserved in the "Other" bucket
+        (e.g. ['Year'] for a timeline or ['Genre'] for a treemap)
+    other_label : str, optional
+        Label for the collapsed bucket
+    value_columns : List[str], optional
+        Columns summed into the "Other" bucket; defaults to the sales
+        columns present in ``data`` (plus ``metric``). Any other column is
+        left empty in the "Other" rows rather than summed (e.g. Rank).
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Kept rows ordered by dimension total (descending) followed by the
+        "Other" rows
+    """
+    keys = keys or []
+    other_label = other_label or LOD_CONFIG['other_label']
+    if value_columns is None:
+        value_columns = [col for col in SALES_COLUMNS if col in data.columns]
+        if metric not in value_columns:
+            value_columns.append(metric)
+
+    codes, uniques = pd.factorize(data[dimension], use_na_sentinel=False)
+    totals = np.bincount(codes, weights=data[metric].to_numpy(dtype=float),
+                         minlength=len(uniques))
+    if len(uniques) <= n:
+        # Nothing to collapse, but keep the promised ranking
+        return data.iloc[np.argsort(-totals[codes], kind='stable')]
+
+    top = np.argpartition(-totals, n - 1)[:n]
+    rank = np.full(len(uniques), n, dtype=int)
+    rank[top[np.argsort(-totals[top], kind='stable')]] = np.arange(n)
+
+    row_rank = rank[codes]
+    kept_mask = row_rank < n
+    kept = data[kept_mask].iloc[np.argsort(row_rank[kept_mask], kind='stable')]
+
+    rest = data[~kept_mask]
+    if keys:
+        other = rest.groupby(keys, as_index=False)[value_columns].sum()
+    else:
+        other = rest[value_columns].sum().to_frame().T
+    other[dimension] = other_label
+
+    return pd.concat([kept, other], ignore_index=True)[list(data.columns)]
+
+def hexbin(x: np.ndarray,
+           y: np.ndarray,
+           weights: Optional[np.ndarray] = None,
+           gridsize: int = 50,
+           extent: Optional[Tuple[float, float, float, float]] = None) -> pd.DataFrame:
+    """
+    Aggregate points into a hexagonal grid.
+
+    Uses the two offset rectangular lattices of a pointy-top hex grid and
+    assigns each point to the nearer lattice centre, so the cost is a few
+    vectorized passes over the points regardless of how many bins are used.
+
+    Parameters:
+    -----------
+    x, y : numpy.ndarray
+        Point coordinates
+    weights : numpy.ndarray, optional
+        Value summed per bin (e.g. Global_Sales)
+    gridsize : int
+        Number of hexagons across the x extent
+    extent : tuple, optional
+        (xmin, xmax, ymin, ymax); defaults to the data bounds
+
+    Returns:
+    --------
+    pandas.DataFrame
+        One row per non-empty bin with 'x', 'y' (bin centre), 'count' and 'total'
+    """
+    if extent is None:
+        extent = (x.min(), x.max(), y.min(), y.max()) if len(x) else (0.0, 1.0, 0.0, 1.0)
+    xmin, xmax, ymin, ymax = extent
+    sx = (xmax - xmin) / gridsize or 1.0
+    sy = sx * np.sqrt(3)
+
+    xs = (x - xmin) / sx
+    ys = (y - ymin) / sy
+    ix1, iy1 = np.round(xs), np.round(ys)
+    ix2, iy2 = np.floor(xs), np.floor(ys)
+    d1 = (xs - ix1) ** 2 + 3.0 * (ys - iy1) ** 2
+    d2 = (xs - ix2 - 0.5) ** 2 + 3.0 * (ys - iy2 - 0.5) ** 2
+    use_first = d1 <= d2
+
+    # Bin centres in half-cell units (the second lattice is offset by half a
+    # cell), flattened to one index so bins are summed with a single bincount
+    kx = np.where(use_first, 2 * ix1, 2 * ix2 + 1).astype(np.int64)
+    ky = np.where(use_first, 2 * iy1, 2 * iy2 + 1).astype(np.int64)
+    kx_min, ky_min = kx.min(initial=0), ky.min(initial=0)
+    width = int(kx.max(initial=0) - kx_min) + 1
+    flat = (ky - ky_min) * width + (kx - kx_min)
+
+    counts = np.bincount(flat)
+    totals = np.bincount(flat, weights=weights) if weights is not None else counts.astype(float)
+    occupied = np.flatnonzero(counts)
+
+    return pd.DataFrame({
+        'x': xmin + (occupied % width + kx_min) / 2 * sx,
+        'y': ymin + (occupied // width + ky_min) / 2 * sy,
+        'count': counts[occupied],
+        'total': totals[occupied]
+    })
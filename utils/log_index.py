@@ -0,0 +1,347 @@
+"""
+On-disk search index for the dashboard logs.
+
+Parses the ``setup_logging`` file format incrementally into a SQLite
+database: entries are indexed by timestamp and by (level, timestamp), and
+message text goes into an FTS5 token index. Files are tracked by inode, so a
+rotated file (renamed by RotatingFileHandler) keeps its entries and only the
+bytes appended since the last update are parsed. Compressed backups are read
+with streaming decompression.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.logging_setup import LOG_SEGMENT_PATTERN, open_log_segment, segment_size
+from utils.constants import LOG_INDEX_CONFIG
+
+logger = logging.getLogger(__name__)
+
+LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+
+# '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+ENTRY_PATTERN = re.compile(
+    r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - (\S+) - '
+    r'(DEBUG|INFO|WARNING|ERROR|CRITICAL) - (\S+:\d+) - (.*)$'
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    inode INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    indexed_bytes INTEGER NOT NULL,
+    last_entry INTEGER
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    ts TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    logger TEXT NOT NULL,
+    location TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_ts ON entries (ts);
+CREATE INDEX IF NOT EXISTS entries_level_ts ON entries (level, ts);
+CREATE INDEX IF NOT EXISTS entries_inode ON entries (inode);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    message, content='entries', content_rowid='id'
+);
+"""
+
+READ_CHUNK_BYTES = 1024 * 1024
+
+_update_lock = threading.Lock()
+
+def _connect(db_path: Optional[str] = None) -> sqlite3.Connection:
+    """Open the index database, creating the schema on first use."""
+    db_path = Path(db_path or LOG_INDEX_CONFIG['db_path'])
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    try:
+        conn.executescript(FTS_SCHEMA)
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5; text search falls back to LIKE
+        pass
+    return conn
+
+def _has_fts(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'entries_fts'"
+    ).fetchone() is not None
+
+def _index_file(conn: sqlite3.Connection, path: Path, inode: int, size: int,
+                known: Optional[tuple], fts: bool) -> int:
+    """
+    Parse the unindexed tail of one log segment into the index.
+
+    Parameters:
+    -----------
+    conn : sqlite3.Connection
+        Open index database (inside a transaction)
+    path : Path
+        Log file or rotated backup to index
+    inode : int
+        Inode of the file
+    size : int
+        Current (uncompressed) size of the file
+    known : tuple, optional
+        (indexed_bytes, last_entry) stored for this inode, if any
+    fts : bool
+        Whether the token index is available
+
+    Returns:
+    --------
+    int
+        Number of new entries
+    """
+    indexed_bytes, last_entry = known if known else (0, None)
+    if size < indexed_bytes:
+        # Truncated in place: drop what was indexed and start over
+        _drop_inode(conn, inode, fts)
+        indexed_bytes, last_entry = 0, None
+
+    offset = indexed_bytes
+    new_entries = 0
+    continuation = []
+
+    def flush_continuation():
+        if continuation and last_entry is not None:
+            extra = "\n" + "\n".join(continuation)
+            if fts:
+                old = conn.execute("SELECT message FROM entries WHERE id = ?", (last_entry,)).fetchone()[0]
+                conn.execute("INSERT INTO entries_fts (entries_fts, rowid, message) VALUES ('delete', ?, ?)",
+                             (last_entry, old))
+            conn.execute("UPDATE entries SET message = message || ? WHERE id = ?", (extra, last_entry))
+            if fts:
+                conn.execute("INSERT INTO entries_fts (rowid, message) "
+                             "SELECT id, message FROM entries WHERE id = ?", (last_entry,))
+        continuation.clear()
+
+    with open_log_segment(path) as f:
+        f.seek(indexed_bytes)
+        remaining = size - indexed_bytes
+        pending = b""
+        while remaining > 0:
+            chunk = f.read(min(remaining, READ_CHUNK_BYTES))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            pending += chunk
+            # Only complete lines; a partially written line is picked up next time
+            complete = pending.rfind(b'\n') + 1
+            for raw_line in pending[:complete].splitlines(keepends=True):
+                line = raw_line.decode('utf-8', errors='replace').rstrip('\r\n')
+                match = ENTRY_PATTERN.match(line)
+                if match:
+                    flush_continuation()
+                    ts, name, level, location, message = match.groups()
+                    cursor = conn.execute(
+                        "INSERT INTO entries (inode, offset, ts, level, logger, location, message) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (inode, offset, ts, LEVELS.index(level), name, location, message)
+                    )
+                    last_entry = cursor.lastrowid
+                    if fts:
+                        conn.execute("INSERT INTO entries_fts (rowid, message) VALUES (?, ?)",
+                                     (last_entry, message))
+                    new_entries += 1
+                elif line:
+                    # Traceback or other multi-line message continuation
+                    continuation.append(line)
+                offset += len(raw_line)
+            pending = pending[complete:]
+    flush_continuation()
+
+    conn.execute(
+        "INSERT INTO files (inode, name, indexed_bytes, last_entry) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (inode) DO UPDATE SET name = excluded.name, "
+        "indexed_bytes = excluded.indexed_bytes, last_entry = excluded.last_entry",
+        (inode, path.name, offset, last_entry)
+    )
+    return new_entries
+
+def _drop_inode(conn: sqlite3.Connection, inode: int, fts: bool) -> None:
+    """Remove a file and its entries from the index."""
+    if fts:
+        conn.execute(
+            "INSERT INTO entries_fts (entries_fts, rowid, message) "
+            "SELECT 'delete', id, message FROM entries WHERE inode = ?", (inode,)
+        )
+    conn.execute("DELETE FROM entries WHERE inode = ?", (inode,))
+    conn.execute("DELETE FROM files WHERE inode = ?", (inode,))
+
+def update_index(log_dir: str = "logs", db_path: Optional[str] = None) -> int:
+    """
+    Bring the index up to date with the log directory.
+
+    Only bytes appended since the previous update are parsed, so the cost is
+    proportional to new log volume. Files that disappeared are dropped.
+
+    Parameters:
+    -----------
+    log_dir : str
+        Directory where log files are stored
+    db_path : str, optional
+        Index database path
+
+    Returns:
+    --------
+    int
+        Number of new entries indexed
+    """
+    log_path = Path(log_dir)
+    files = {}
+    if log_path.exists():
+        for path in log_path.glob("*.log*"):
+            if path.is_file() and LOG_SEGMENT_PATTERN.match(path.name):
+                files[path.stat().st_ino] = path
+
+    with _update_lock, closing(_connect(db_path)) as conn:
+        fts = _has_fts(conn)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            known = {row[0]: (row[1], row[2], row[3])
+                     for row in conn.execute("SELECT inode, indexed_bytes, last_entry, name FROM files")}
+
+            for inode in set(known) - set(files):
+                _drop_inode(conn, inode, fts)
+
+            new_entries = 0
+            for inode, path in files.items():
+                previous = known.get(inode)
+                conn.execute("SAVEPOINT segment")
+                try:
+                    size = segment_size(path)
+                    if not (previous and previous[0] == size and previous[2] == path.name):
+                        new_entries += _index_file(conn, path, inode, size,
+                                                   previous[:2] if previous else None, fts)
+                except (OSError, EOFError) as e:
+                    # Rotated away or still being compressed; retried on the next update
+                    conn.execute("ROLLBACK TO segment")
+                    logger.debug(f"Skipped indexing {path.name}: {e}")
+                conn.execute("RELEASE segment")
+
+    if new_entries:
+        logger.debug(f"Indexed {new_entries} new log entries")
+    return new_entries
+
+def _fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching all of its tokens."""
+    tokens = re.findall(r'\w+', text)
+    return " ".join(f'"{token}"' for token in tokens)
+
+def search_logs(text: Optional[str] = None,
+                levels: Optional[List[str]] = None,
+                start: Optional[str] = None,
+                end: Optional[str] = None,
+                limit: Optional[int] = None,
+                log_dir: str = "logs",
+                db_path: Optional[str] = None,
+                refresh: bool = True) -> Dict:
+    """
+    Search log entries across all retained and rotated log files.
+
+    Parameters:
+    -----------
+    text : str, optional
+        Words that must all appear in the message
+    levels : List[str], optional
+        Levels to include (e.g. ['ERROR', 'CRITICAL'])
+    start, end : str, optional
+        Inclusive time range as 'YYYY-MM-DD[ HH:MM[:SS]]'
+    limit : int, optional
+        Maximum number of entries to return (newest first)
+    log_dir : str
+        Directory where log files are stored
+    db_path : str, optional
+        Index database path
+    refresh : bool
+        Index new log lines before querying
+
+    Returns:
+    --------
+    dict
+        'entries' (list of dicts with file, offset, timestamp, level, logger,
+        location and message), 'total' matches and 'elapsed_ms'
+    """
+    if refresh:
+        update_index(log_dir, db_path)
+
+    started = time.perf_counter()
+    limit = min(limit or LOG_INDEX_CONFIG['max_results'], LOG_INDEX_CONFIG['max_results'])
+    conditions, params = [], []
+
+    if levels:
+        level_ids = [LEVELS.index(level) for level in levels if level in LEVELS]
+        conditions.append(f"e.level IN ({', '.join('?' * len(level_ids))})")
+        params.extend(level_ids)
+    if start:
+        conditions.append("e.ts >= ?")
+        params.append(start.replace('T', ' '))
+    if end:
+        # Make a date or minute bound inclusive of everything inside it
+        conditions.append("e.ts <= ?")
+        params.append(end.replace('T', ' ') + '\uffff')
+
+    with closing(_connect(db_path)) as conn:
+        source = "entries e"
+        if text and text.strip():
+            if _has_fts(conn) and _fts_query(text):
+                # A membership test lets the planner still drive the scan from the
+                # (level, ts) indexes when they are more selective than the text
+                conditions.append("e.id IN (SELECT rowid FROM entries_fts WHERE entries_fts MATCH ?)")
+                params.append(_fts_query(text))
+            else:
+                conditions.append("e.message LIKE ?")
+                params.append(f"%{text.strip()}%")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        total = conn.execute(f"SELECT COUNT(*) FROM {source} {where}", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT f.name, e.offset, e.ts, e.level, e.logger, e.location, e.message "
+            f"FROM {source} JOIN files f ON f.inode = e.inode {where} "
+            f"ORDER BY e.ts DESC, e.id DESC LIMIT ?",
+            params + [limit]
+        ).fetchall()
+
+    entries = [{
+        'file': name, 'offset': offset, 'timestamp': ts, 'level': LEVELS[level],
+        'logger': logger_name, 'location': location, 'message': message
+    } for name, offset, ts, level, logger_name, location, message in rows]
+
+    return {
+        'entries': entries,
+        'total': total,
+        'elapsed_ms': (time.perf_counter() - started) * 1000
+    }
+
+def format_entry(entry: Dict) -> str:
+    """
+    Format an indexed entry back into the log file line format.
+
+    Parameters:
+    -----------
+    entry : dict
+        Entry as returned by search_logs
+
+    Returns:
+    --------
+    str
+        Log line (plus continuation lines)
+    """
+    return (f"{entry['timestamp']} - {entry['logger']} - {entry['level']} - "
+            f"{entry['location']} - {entry['message']}")
@@ -1,51 +1,145 @@
 """
 Logging configuration for the Video Game Sales Dashboard.
-This module sets up logging to both file and console.
+This module sets up logging to both file and console through a background
+queue listener, and reads the resulting log files for the log viewer.
 """
 
+import atexit
+import gzip
+import json
 import logging
+import re
+import shutil
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 from datetime import datetime
+from queue import SimpleQueue
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
-def setup_logging(log_dir: str = "logs") -> logging.Logger:
+from utils.constants import LOGGING_CONFIG, LOG_VIEWER_CONFIG
+
+# A log file and its RotatingFileHandler backups: name.log, name.log.N[.gz]
+LOG_SEGMENT_PATTERN = re.compile(r'^(?P<stream>.+\.log)(?:\.(?P<backup>\d+)(?P<gz>\.gz)?)?$')
+
+def _gzip_namer(name: str) -> str:
+    """Name rotated backups with a .gz suffix."""
+    return name + ".gz"
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """Compress the file being rotated out into its backup name."""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line for log collectors."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'location': f"{record.filename}:{record.lineno}",
+            'thread': record.threadName,
+            'message': record.getMessage()
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+# Active pipeline: (queue handler, listener, log directory)
+_pipeline: Optional[Tuple[QueueHandler, QueueListener, str]] = None
+
+def _restart_listener_after_fork() -> None:
+    """Give a forked child (gunicorn worker) its own queue and listener thread."""
+    if _pipeline is None:
+        return
+    queue_handler, listener, _ = _pipeline
+    queue_handler.queue = listener.queue = SimpleQueue()
+    listener._thread = None
+    listener.start()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+def shutdown_logging() -> None:
+    """Flush queued records to the handlers and stop the listener thread."""
+    global _pipeline
+    
+    if _pipeline is None:
+        return
+    queue_handler, listener, _ = _pipeline
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    logging.getLogger().removeHandler(queue_handler)
+    _pipeline = None
+
+def setup_logging(log_dir: str = "logs", json_format: Optional[bool] = None) -> logging.Logger:
     """
-    Set up logging configuration to write logs to both file and console.
+    Set up logging to write logs to both file and console without blocking callers.
+    
+    Records are put on an in-memory queue by a QueueHandler on the root
+    logger; a single background QueueListener thread formats them and does
+    the file and console I/O. Calling this again is a no-op, so handlers are
+    never duplicated.
     
     Parameters:
     -----------
     log_dir : str
         Directory where log files will be stored
+    json_format : bool, optional
+        Write console output as JSON lines; defaults to
+        LOGGING_CONFIG['json_format']. The log files keep the text format
+        the log viewer and search index parse.
         
     Returns:
     --------
     logging.Logger
         Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    Path(log_dir).mkdir(exist_ok=True)
+    global _pipeline
     
     # Create logger
     logger = logging.getLogger('vgsales_dashboard')
     logger.setLevel(logging.DEBUG)
     
+    if _pipeline is not None:
+        if _pipeline[2] != log_dir:
+            logger.warning(f"Logging already writes to {_pipeline[2]}; ignoring log_dir={log_dir}")
+        return logger
+    
+    # Create logs directory if it doesn't exist
+    Path(log_dir).mkdir(exist_ok=True)
+    
+    if json_format is None:
+        json_format = LOGGING_CONFIG['json_format']
+    
     # Create formatters
     file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
     )
-    console_formatter = logging.Formatter(
-        '%(levelname)s - %(message)s'
-    )
+    if json_format:
+        console_formatter = JsonFormatter()
+    else:
+        console_formatter = logging.Formatter(
+            '%(levelname)s - %(message)s'
+        )
     
     # Create and configure file handler with rotation
     log_file = f"{datetime.now().strftime('%Y%m%d')}_vgsales.log"
     file_handler = RotatingFileHandler(
         os.path.join(log_dir, log_file),
-        maxBytes=10485760,  # 10MB
-        backupCount=5
+        maxBytes=LOGGING_CONFIG['max_bytes'],
+        backupCount=LOGGING_CONFIG['backup_count']
     )
+    if LOGGING_CONFIG['compress_backups']:
+        file_handler.namer = _gzip_namer
+        file_handler.rotator = _gzip_rotator
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(file_formatter)
     
@@ -54,15 +148,29 @@ def setup_logging(log_dir: str = "logs") -> logging.Logger:
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Only the listener thread touches the handlers; loggers just enqueue.
+    # The root logger carries the queue handler so module loggers
+    # (logging.getLogger(__name__)) reach the same file and console.
+    queue_handler = QueueHandler(SimpleQueue())
+    listener = QueueListener(queue_handler.queue, file_handler, console_handler,
+                             respect_handler_level=True)
+    
+    root = logging.getLogger()
+    root.setLevel(LOGGING_CONFIG['root_level'])
+    root.addHandler(queue_handler)
+    
+    _pipeline = (queue_handler, listener, log_dir)
+    listener.start()
+    atexit.register(shutdown_logging)
     
     return logger
 
 def list_logs(log_dir: str = "logs") -> list:
     """
-    List all available log files.
+    List all available logs.
+    
+    A log and its rotated backups (``.log.1`` ... ``.log.N``, optionally
+    gzip-compressed) are listed once, under the name of the current file.
     
     Parameters:
     -----------
@@ -72,16 +180,194 @@ def list_logs(log_dir: str = "logs") -> list:
     Returns:
     --------
     list
-        List of log file names
+        List of log names
     """
     log_path = Path(log_dir)
     if not log_path.exists():
         return []
     
-    return sorted(
-        [f.name for f in log_path.glob("*.log")],
-        reverse=True
-    )
+    streams = set()
+    for f in log_path.glob("*.log*"):
+        match = LOG_SEGMENT_PATTERN.match(f.name)
+        if match:
+            streams.add(match.group('stream'))
+    return sorted(streams, reverse=True)
+
+def _log_file_path(name: str, log_dir: str) -> Optional[Path]:
+    """
+    Resolve a client-supplied log name to a log file directly inside log_dir.
+
+    Returns None for names that point elsewhere (``..``, absolute paths,
+    subdirectories, symlinks out of log_dir) or are not log files.
+    """
+    directory = Path(log_dir).resolve()
+    path = (directory / name).resolve()
+    if path.parent != directory or not LOG_SEGMENT_PATTERN.match(path.name):
+        return None
+    return path
+
+def open_log_segment(path: Path) -> BinaryIO:
+    """
+    Open a log segment for binary reading, decompressing .gz backups on the fly.
+    
+    Parameters:
+    -----------
+    path : Path
+        Log file or rotated backup
+        
+    Returns:
+    --------
+    BinaryIO
+        Seekable binary file object; seeking in a compressed segment
+        decompresses up to the target in bounded memory
+    """
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+def segment_size(path: Path) -> int:
+    """
+    Uncompressed size of a log segment in bytes.
+    
+    For .gz backups this is read from the gzip trailer (exact for segments
+    below 4GB, which rotation guarantees).
+    
+    Parameters:
+    -----------
+    path : Path
+        Log file or rotated backup
+        
+    Returns:
+    --------
+    int
+        Size in bytes
+    """
+    if path.suffix != '.gz':
+        return path.stat().st_size
+    with open(path, 'rb') as f:
+        f.seek(-4, os.SEEK_END)
+        return int.from_bytes(f.read(4), 'little')
+
+def log_segments(name: str, log_dir: str = "logs") -> List[Dict]:
+    """
+    List the segments of a log stream from oldest to newest.
+    
+    Parameters:
+    -----------
+    name : str
+        Log name as returned by list_logs
+    log_dir : str
+        Directory where log files are stored
+        
+    Returns:
+    --------
+    List[dict]
+        'path', 'start' (offset of the segment in the stream) and 'size'
+        (uncompressed bytes) of each segment, the current file last; empty
+        for names outside log_dir
+    """
+    current = _log_file_path(name, log_dir)
+    if current is None:
+        return []
+    log_path, name = current.parent, current.name
+    backups = []
+    for f in log_path.glob("*.log*"):
+        match = LOG_SEGMENT_PATTERN.match(f.name)
+        if match and match.group('stream') == name and match.group('backup'):
+            backups.append((int(match.group('backup')), f))
+    paths = [f for _, f in sorted(backups, reverse=True)]
+    if (log_path / name).exists():
+        paths.append(log_path / name)
+    
+    segments, start = [], 0
+    for path in paths:
+        size = segment_size(path)
+        segments.append({'path': path, 'start': start, 'size': size})
+        start += size
+    return segments
+
+def _read_stream_range(segments: List[Dict], start: int, end: int) -> bytes:
+    """Read bytes [start, end) of a log stream across its segments."""
+    parts = []
+    for segment in segments:
+        seg_start, seg_end = segment['start'], segment['start'] + segment['size']
+        if seg_end <= start or seg_start >= end:
+            continue
+        with open_log_segment(segment['path']) as f:
+            f.seek(max(start - seg_start, 0))
+            parts.append(f.read(min(end, seg_end) - max(start, seg_start)))
+    return b"".join(parts)
+
+def read_log_page(name: str,
+                  offset: Optional[int] = None,
+                  direction: str = "backward",
+                  log_dir: str = "logs",
+                  page_bytes: Optional[int] = None) -> Dict:
+    """
+    Read one page of complete lines from a log stream (a log and its backups).
+    
+    Offsets are positions in the concatenation of all segments, oldest first.
+    Only the requested range is read; compressed backups are decompressed
+    as a stream, so memory use is bounded by the page size.
+    
+    Parameters:
+    -----------
+    name : str
+        Log name as returned by list_logs
+    offset : int, optional
+        Stream position to read from; defaults to the start of the stream
+        when reading forward and to its end when reading backward
+    direction : str
+        'forward' to read the page starting at ``offset``, 'backward' to
+        read the page ending at ``offset``
+    log_dir : str
+        Directory where log files are stored
+    page_bytes : int, optional
+        Maximum number of bytes to return
+        
+    Returns:
+    --------
+    dict
+        'text', 'start' and 'end' (stream positions of the page) and 'size'
+        (current length of the stream)
+    """
+    page_bytes = page_bytes or LOG_VIEWER_CONFIG['page_bytes']
+    for attempt in range(2):
+        segments = log_segments(name, log_dir)
+        size = segments[-1]['start'] + segments[-1]['size'] if segments else 0
+        if offset is None:
+            position = size if direction == 'backward' else 0
+        else:
+            position = min(max(offset, 0), size)
+        
+        if direction == 'backward':
+            start, end = max(position - page_bytes, 0), position
+        else:
+            start, end = position, min(position + page_bytes, size)
+        try:
+            data = _read_stream_range(segments, start, end)
+            break
+        except FileNotFoundError:
+            # A rotation renamed the segments while reading; list them again
+            if attempt:
+                raise
+    
+    if direction == 'backward':
+        # Drop the partial first line unless the page starts the stream
+        if start > 0 and b'\n' in data:
+            skipped = data.find(b'\n') + 1
+            data, start = data[skipped:], start + skipped
+    elif end < size and b'\n' in data:
+        # Leave the partial last line for the next page
+        data = data[:data.rfind(b'\n') + 1]
+    end = start + len(data)
+    
+    return {
+        'text': data.decode('utf-8', errors='replace'),
+        'start': start,
+        'end': end,
+        'size': size
+    }
 
 def read_log_file(filename: str, log_dir: str = "logs") -> str:
     """
@@ -90,7 +376,7 @@ def read_log_file(filename: str, log_dir: str = "logs") -> str:
     Parameters:
     -----------
     filename : str
-        Name of the log file to read
+        Name of a log file in log_dir; other paths are reported as not found
     log_dir : str
         Directory where log files are stored
         
@@ -99,8 +385,8 @@ def read_log_file(filename: str, log_dir: str = "logs") -> str:
     str
         Contents of the log file
     """
-    log_path = Path(log_dir) / filename
-    if not log_path.exists():
+    log_path = _log_file_path(filename, log_dir)
+    if log_path is None or not log_path.exists():
         return f"Log file {filename} not found"
     
     try:
@@ -109,6 +395,76 @@ def read_log_file(filename: str, log_dir: str = "logs") -> str:
     except Exception as e:
         return f"Error reading log file: {str(e)}"
 
+def tail_log_file(filename: str,
+                  offset: Optional[int] = None,
+                  inode: Optional[int] = None,
+                  log_dir: str = "logs",
+                  window_bytes: Optional[int] = None) -> Dict:
+    """
+    Read only the complete lines appended to a log file since ``offset``.
+
+    Without an offset (first load), or when the file was rotated or truncated
+    (its inode changed or it shrank below the offset), the last
+    ``window_bytes`` of the file are returned instead and ``reset`` is set,
+    telling the caller to replace rather than append. The same happens when
+    more than a window of new data arrived, so a read never exceeds the window.
+
+    Parameters:
+    -----------
+    filename : str
+        Name of a log file in log_dir; other paths are reported as not found
+    offset : int, optional
+        Byte offset up to which the caller has already read
+    inode : int, optional
+        Inode of the file the offset refers to
+    log_dir : str
+        Directory where log files are stored
+    window_bytes : int, optional
+        Maximum number of bytes to return
+
+    Returns:
+    --------
+    dict
+        'text' (new lines), 'start' (file position of the text), 'offset'
+        and 'inode' to pass to the next call, and 'reset' (True when 'text'
+        replaces what was read before)
+    """
+    window_bytes = window_bytes or LOG_VIEWER_CONFIG['window_bytes']
+    log_path = _log_file_path(filename, log_dir)
+    try:
+        if log_path is None:
+            raise FileNotFoundError(filename)
+        stat = os.stat(log_path)
+    except OSError:
+        return {'text': f"Log file {filename} not found", 'start': 0, 'offset': 0, 'inode': None, 'reset': True}
+
+    reset = offset is None or inode != stat.st_ino or stat.st_size < offset
+    start = max(stat.st_size - window_bytes, 0) if reset else offset
+    if stat.st_size - start > window_bytes:
+        start, reset = stat.st_size - window_bytes, True
+
+    try:
+        with open(log_path, 'rb') as f:
+            f.seek(start)
+            data = f.read(stat.st_size - start)
+    except OSError as e:
+        return {'text': f"Error reading log file: {str(e)}", 'start': 0, 'offset': 0, 'inode': None, 'reset': True}
+
+    # Start on a line boundary when jumping into the middle of the file
+    if reset and start > 0:
+        skipped = data.find(b'\n') + 1
+        data, start = data[skipped:], start + skipped
+
+    # Leave a partially written last line for the next read
+    complete = data.rfind(b'\n') + 1
+    return {
+        'text': data[:complete].decode('utf-8', errors='replace'),
+        'start': start,
+        'offset': start + complete,
+        'inode': stat.st_ino,
+        'reset': reset
+    }
+
 def clear_old_logs(log_dir: str = "logs", keep_days: int = 30) -> None:
     """
     Clear log files older than specified days.
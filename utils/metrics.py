@@ -0,0 +1,606 @@
+"""
+In-process instrumentation of Dash callbacks with a Prometheus text endpoint.
+
+Every callback in the app's callback map is wrapped once: each call records
+wall time, CPU time (of the serving thread), request and response payload
+bytes and its outcome into per-callback histograms and counters, and appends
+a record to a fixed-size ring buffer of recent calls that the performance
+page summarizes. Caches used inside a callback report hits and misses
+through ``record_cache``, multi-output callbacks report the build time of
+each output through ``record_output``; dataset and index builds report
+through ``record_load``.
+
+Background callbacks run in a separate job process, where the web worker
+only sees the dispatch and the polling; the wrapper's entries for them are
+labelled "(dispatch)". The job itself is instrumented by ``instrument_job``
+and sends its timings, cache lookups and output build times back through
+the job manager's diskcache, where ``collect_job_metrics`` picks them up.
+
+Metrics are kept per process; under gunicorn each worker exposes its own
+series on ``/metrics`` (job reports are merged by the worker collecting them).
+"""
+
+import bisect
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+import flask
+import numpy as np
+from dash.exceptions import PreventUpdate
+from flask import Blueprint, Response
+
+from utils.constants import METRICS_CONFIG
+from utils.profiling import profile_call, should_profile
+
+logger = logging.getLogger(__name__)
+
+metrics_bp = Blueprint('metrics', __name__)
+
+# Name of the callback running in the current request context
+_current_callback: contextvars.ContextVar = contextvars.ContextVar('current_callback', default=None)
+
+# Registry of the background job running in this process, if any
+_job_metrics: contextvars.ContextVar = contextvars.ContextVar('job_metrics', default=None)
+
+# Details of the web request that started the background job (see job_request)
+_job_request: contextvars.ContextVar = contextvars.ContextVar('job_request', default=None)
+
+# Key prefix of job metric reports in the background job store
+JOB_REPORT_PREFIX = 'callback-metrics'
+_job_store = None
+
+class Histogram:
+    """
+    Cumulative-bucket histogram in the Prometheus exposition model.
+
+    Attributes:
+        buckets (List[float]): Upper bounds of the buckets (``+Inf`` implied)
+        counts (List[int]): Observations per bucket (non-cumulative)
+        total (float): Sum of all observations
+        count (int): Number of observations
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def merge(self, other: 'Histogram') -> None:
+        """Add the observations of a histogram with the same buckets."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.count += other.count
+
+class CallbackMetrics:
+    """
+    Thread-safe registry of per-callback histograms and counters.
+
+    Attributes:
+        series (Dict[str, Dict[str, Histogram]]): Callback name -> metric -> histogram
+        outcomes (Dict[Tuple[str, str], int]): (callback, outcome) -> calls
+        cache (Dict[Tuple[str, str, str], int]): (callback, cache, result) -> lookups
+        outputs (Dict[Tuple[str, str], Histogram]): (callback, output) -> build times
+    """
+
+    HISTOGRAMS = {
+        'duration_seconds': ('seconds_buckets', "Wall time of the callback"),
+        'cpu_seconds': ('seconds_buckets', "CPU time of the serving thread (of the job process "
+                                           "for background callbacks) during the callback"),
+        'request_bytes': ('bytes_buckets', "Size of the callback request body (inputs and state)"),
+        'response_bytes': ('bytes_buckets', "Size of the serialized callback response")
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.series: Dict[str, Dict[str, Histogram]] = {}
+        self.outcomes: Dict[Tuple[str, str], int] = {}
+        self.cache: Dict[Tuple[str, str, str], int] = {}
+        self.outputs: Dict[Tuple[str, str], Histogram] = {}
+
+    def observe(self, callback: str, outcome: str, values: Dict[str, float]) -> None:
+        """
+        Record one callback call.
+
+        Args:
+            callback (str): Callback name
+            outcome (str): 'ok', 'no_update' or 'error'
+            values (Dict[str, float]): Observation per histogram name
+        """
+        with self._lock:
+            histograms = self._series(callback)
+            for name, value in values.items():
+                histograms[name].observe(value)
+            key = (callback, outcome)
+            self.outcomes[key] = self.outcomes.get(key, 0) + 1
+
+    def _series(self, callback: str) -> Dict[str, Histogram]:
+        histograms = self.series.get(callback)
+        if histograms is None:
+            histograms = self.series[callback] = {
+                name: Histogram(METRICS_CONFIG[buckets])
+                for name, (buckets, _) in self.HISTOGRAMS.items()
+            }
+        return histograms
+
+    def _output(self, callback: str, output: str) -> Histogram:
+        histogram = self.outputs.get((callback, output))
+        if histogram is None:
+            histogram = self.outputs[(callback, output)] = Histogram(METRICS_CONFIG['seconds_buckets'])
+        return histogram
+
+    def record_cache(self, callback: str, cache: str, hit: bool) -> None:
+        with self._lock:
+            key = (callback, cache, 'hit' if hit else 'miss')
+            self.cache[key] = self.cache.get(key, 0) + 1
+
+    def observe_output(self, callback: str, output: str, seconds: float) -> None:
+        with self._lock:
+            self._output(callback, output).observe(seconds)
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Picklable copy of all series, for sending to another process.
+
+        Returns:
+            Dict[str, Any]: 'series', 'outcomes', 'cache' and 'outputs'
+        """
+        with self._lock:
+            return {'series': dict(self.series), 'outcomes': dict(self.outcomes),
+                    'cache': dict(self.cache), 'outputs': dict(self.outputs)}
+
+    def merge(self, state: Dict[str, Any]) -> None:
+        """
+        Add the series of another registry.
+
+        Args:
+            state (Dict[str, Any]): Result of ``state()`` of the other registry
+        """
+        with self._lock:
+            for callback, histograms in state['series'].items():
+                series = self._series(callback)
+                for name, histogram in histograms.items():
+                    series[name].merge(histogram)
+            for key, n in state['outcomes'].items():
+                self.outcomes[key] = self.outcomes.get(key, 0) + n
+            for key, n in state['cache'].items():
+                self.cache[key] = self.cache.get(key, 0) + n
+            for (callback, output), histogram in state['outputs'].items():
+                self._output(callback, output).merge(histogram)
+
+    def render(self) -> str:
+        """
+        Render all series in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text
+        """
+        lines = []
+        with self._lock:
+            for name, (_, help_text) in self.HISTOGRAMS.items():
+                metric = f"dash_callback_{name}"
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} histogram")
+                for callback in sorted(self.series):
+                    histogram = self.series[callback][name]
+                    # Background jobs only observe wall and CPU time
+                    if histogram.count:
+                        lines.extend(_histogram_lines(metric, f'callback="{_escape(callback)}"',
+                                                      histogram))
+
+            lines.append("# HELP dash_callback_calls_total Callback calls by outcome")
+            lines.append("# TYPE dash_callback_calls_total counter")
+            for (callback, outcome), n in sorted(self.outcomes.items()):
+                lines.append(f'dash_callback_calls_total{{callback="{_escape(callback)}",'
+                             f'outcome="{outcome}"}} {n}')
+
+            lines.append("# HELP dash_callback_cache_total Cache lookups made by callbacks")
+            lines.append("# TYPE dash_callback_cache_total counter")
+            for (callback, cache, result), n in sorted(self.cache.items()):
+                lines.append(f'dash_callback_cache_total{{callback="{_escape(callback)}",'
+                             f'cache="{cache}",result="{result}"}} {n}')
+
+            metric = "dash_callback_output_seconds"
+            lines.append(f"# HELP {metric} Build time of each output of multi-output callbacks")
+            lines.append(f"# TYPE {metric} histogram")
+            for (callback, output), histogram in sorted(self.outputs.items()):
+                lines.extend(_histogram_lines(
+                    metric, f'callback="{_escape(callback)}",output="{_escape(output)}"', histogram
+                ))
+        return "\n".join(lines) + "\n"
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _histogram_lines(metric: str, label: str, histogram: Histogram) -> List[str]:
+    """Exposition lines (cumulative buckets, sum and count) of one labelled histogram."""
+    lines = []
+    cumulative = 0
+    for bound, n in zip(histogram.buckets, histogram.counts):
+        cumulative += n
+        lines.append(f'{metric}_bucket{{{label},le="{bound:g}"}} {cumulative}')
+    lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {histogram.count}')
+    lines.append(f"{metric}_sum{{{label}}} {histogram.total:.6f}")
+    lines.append(f"{metric}_count{{{label}}} {histogram.count}")
+    return lines
+
+class CallRecord(NamedTuple):
+    """One callback call as kept in the recent-calls ring buffer."""
+    timestamp: float
+    callback: str
+    duration: float
+    cpu: float
+    request_bytes: int
+    response_bytes: int
+    outcome: str
+    inputs: Any  # Parsed inputs and state of the request (not copied)
+
+metrics = CallbackMetrics()
+
+# Bounded history for the performance page; appends are atomic
+recent_calls: deque = deque(maxlen=METRICS_CONFIG['recent_calls'])
+load_events: deque = deque(maxlen=METRICS_CONFIG['load_events'])
+
+def _registry() -> CallbackMetrics:
+    """Registry of the running background job, or of this process."""
+    registry = _job_metrics.get()
+    return metrics if registry is None else registry
+
+def record_cache(cache: str, hit: bool) -> None:
+    """
+    Count a cache lookup against the callback currently being served.
+
+    Lookups outside a callback (e.g. in scripts) are ignored.
+
+    Args:
+        cache (str): Cache name (e.g. 'prerender')
+        hit (bool): Whether the lookup was served from the cache
+    """
+    callback = _current_callback.get()
+    if callback is not None:
+        _registry().record_cache(callback, cache, hit)
+
+def record_output(output: str, seconds: float) -> None:
+    """
+    Record how long building one output of the callback being served took.
+
+    Args:
+        output (str): Output name (e.g. 'timeline')
+        seconds (float): Build time
+    """
+    callback = _current_callback.get()
+    if callback is not None:
+        _registry().observe_output(callback, output, seconds)
+
+def record_load(name: str, seconds: float, detail: str = "") -> None:
+    """
+    Record how long loading or rebuilding a shared structure took.
+
+    Args:
+        name (str): What was loaded (e.g. 'dataset', 'games index')
+        seconds (float): Build time
+        detail (str): Extra context such as the dataset fingerprint
+    """
+    load_events.append({'timestamp': time.time(), 'name': name,
+                        'seconds': seconds, 'detail': detail})
+
+def summarize_inputs(inputs: Any, max_chars: int = 120) -> str:
+    """
+    Render the inputs and state of a recorded call compactly.
+
+    Args:
+        inputs (Any): CallRecord.inputs
+        max_chars (int): Maximum length per value
+
+    Returns:
+        str: 'id.property=value' pairs separated by commas
+    """
+    def flatten(items):
+        # Inputs and state lists, with pattern-matching inputs nested once more
+        for item in items or []:
+            if isinstance(item, (list, tuple)):
+                yield from flatten(item)
+            elif isinstance(item, dict):
+                yield item
+
+    parts = []
+    for entry in flatten(inputs):
+        component_id = entry.get('id')
+        if isinstance(component_id, dict):
+            component_id = json.dumps(component_id, sort_keys=True)
+        value = json.dumps(entry.get('value'), default=str)
+        if len(value) > max_chars:
+            value = value[:max_chars - 1] + "…"
+        parts.append(f"{component_id}.{entry.get('property')}={value}")
+    return ", ".join(parts)
+
+def latency_summary(records: List[CallRecord] = None) -> List[Dict]:
+    """
+    Latency percentiles per callback over the recent-calls buffer.
+
+    Args:
+        records (List[CallRecord], optional): Calls to summarize (defaults
+            to the ring buffer)
+
+    Returns:
+        List[Dict]: Per callback: calls, errors, p50/p90/p99 and max wall
+        time (ms), mean CPU time (ms) and mean response size (bytes),
+        slowest p99 first
+    """
+    records = list(recent_calls) if records is None else records
+    by_callback: Dict[str, List[CallRecord]] = {}
+    for record in records:
+        by_callback.setdefault(record.callback, []).append(record)
+
+    rows = []
+    for name, calls in by_callback.items():
+        durations = np.array([call.duration for call in calls]) * 1000
+        p50, p90, p99 = np.percentile(durations, [50, 90, 99])
+        rows.append({
+            'callback': name,
+            'calls': len(calls),
+            'errors': sum(call.outcome == 'error' for call in calls),
+            'p50_ms': p50, 'p90_ms': p90, 'p99_ms': p99,
+            'max_ms': durations.max(),
+            'cpu_ms': np.mean([call.cpu for call in calls]) * 1000,
+            'response_bytes': np.mean([call.response_bytes for call in calls])
+        })
+    return sorted(rows, key=lambda row: row['p99_ms'], reverse=True)
+
+def cache_summary() -> List[Dict]:
+    """
+    Hit rates of the caches used by callbacks since the process started.
+
+    Returns:
+        List[Dict]: Per callback and cache: hits, misses and hit_rate
+    """
+    with metrics._lock:
+        counts = dict(metrics.cache)
+    pairs = sorted({(callback, cache) for callback, cache, _ in counts})
+    rows = []
+    for callback, cache in pairs:
+        hits = counts.get((callback, cache, 'hit'), 0)
+        misses = counts.get((callback, cache, 'miss'), 0)
+        rows.append({'callback': callback, 'cache': cache, 'hits': hits, 'misses': misses,
+                     'hit_rate': hits / (hits + misses) if hits + misses else 0.0})
+    return rows
+
+def output_summary() -> List[Dict]:
+    """
+    Build times of the outputs of multi-output callbacks since the process started.
+
+    Returns:
+        List[Dict]: Per callback and output: builds and mean build time (ms),
+        slowest mean first
+    """
+    with metrics._lock:
+        rows = [{'callback': callback, 'output': output, 'builds': histogram.count,
+                 'mean_ms': histogram.total / histogram.count * 1000}
+                for (callback, output), histogram in metrics.outputs.items() if histogram.count]
+    return sorted(rows, key=lambda row: row['mean_ms'], reverse=True)
+
+def callback_name(func: Callable) -> str:
+    """Qualified name of the function behind a callback map entry."""
+    func = inspect.unwrap(func)
+    return f"{func.__module__}.{func.__qualname__}"
+
+def _request_inputs() -> Tuple[int, Any]:
+    """Request body size and (inputs, state) of the Dash callback request being served."""
+    if not flask.has_request_context():
+        return 0, None
+    # Already parsed (and cached by Flask) when Dash dispatched the call
+    body = flask.request.get_json(silent=True) or {}
+    return flask.request.content_length or 0, (body.get('inputs'), body.get('state'))
+
+def _instrument(func: Callable, name: str, background: bool = False) -> Callable:
+    """Wrap a callback map entry (Dash's add_context) to record its metrics."""
+    label = f"{name} (dispatch)" if background else name
+
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        token = _current_callback.set(label)
+        outcome, response = 'error', None
+        started_wall, started_cpu = time.perf_counter(), time.thread_time()
+        try:
+            # Background callbacks are profiled in their job (see job_request)
+            if not background and should_profile(name):
+                response = profile_call(name, func, *args, **kwargs)
+            else:
+                response = func(*args, **kwargs)
+            outcome = 'ok'
+            return response
+        except PreventUpdate:
+            outcome = 'no_update'
+            raise
+        finally:
+            duration = time.perf_counter() - started_wall
+            cpu = time.thread_time() - started_cpu
+            request_bytes, inputs = _request_inputs()
+            response_bytes = len(response) if isinstance(response, (str, bytes)) else 0
+            _current_callback.reset(token)
+            metrics.observe(label, outcome, {
+                'duration_seconds': duration,
+                'cpu_seconds': cpu,
+                'request_bytes': request_bytes,
+                'response_bytes': response_bytes
+            })
+            recent_calls.append(CallRecord(time.time(), label, duration, cpu, request_bytes,
+                                           response_bytes, outcome, inputs))
+            if background:
+                # A poll that returns the result comes after the job's report
+                collect_job_metrics()
+
+    timed.instrumented = True
+    return timed
+
+def instrument_callbacks(callback_map: Dict) -> int:
+    """
+    Wrap every not yet instrumented callback of a callback map.
+
+    Args:
+        callback_map (Dict): ``app.callback_map`` (or Dash's global map)
+
+    Returns:
+        int: Number of callbacks newly wrapped
+    """
+    wrapped = 0
+    for spec in callback_map.values():
+        func = spec.get('callback')
+        if func is None or getattr(func, 'instrumented', False):
+            continue
+        spec['callback'] = _instrument(func, callback_name(func), background=spec.get('long') is not None)
+        wrapped += 1
+    return wrapped
+
+def set_job_store(store) -> None:
+    """
+    Set the store background jobs report their metrics through.
+
+    Args:
+        store (diskcache.Cache): Cache of the background callback manager
+    """
+    global _job_store
+    _job_store = store
+
+def job_request(name: str) -> Dict[str, Any]:
+    """
+    Capture what a background job needs from the web request starting it.
+
+    The profiling decision depends on the request (admin cookie, header or
+    query parameter), which the job process does not have.
+
+    Args:
+        name (str): Callback name
+
+    Returns:
+        Dict[str, Any]: 'profile' (whether to profile the job), 'request_bytes'
+        and 'inputs' of the request, for run_job
+    """
+    request_bytes, inputs = _request_inputs()
+    return {'profile': should_profile(name), 'request_bytes': request_bytes, 'inputs': inputs}
+
+def run_job(job_fn: Callable, request: Dict[str, Any], *args) -> None:
+    """
+    Run Dash's job function in the job process on behalf of a web request.
+
+    Args:
+        job_fn (Callable): Job function made by the background callback manager
+        request (Dict[str, Any]): Result of ``job_request`` in the web process
+        *args: Passed to the job function
+    """
+    # Dash runs the callback in a copy of this context
+    _job_request.set(request)
+    job_fn(*args)
+
+def instrument_job(func: Callable, name: str, store) -> Callable:
+    """
+    Wrap a background callback to record its metrics in the job process.
+
+    The call's wall time, the job process's CPU time and the cache lookups
+    and output build times recorded while it runs are pushed to ``store`` as
+    one report when the callback returns, before Dash stores its result.
+    The call runs under cProfile when the request that started the job asked
+    for a profile.
+
+    Args:
+        func (Callable): The callback function
+        name (str): Callback name
+        store (diskcache.Cache): Cache of the background callback manager
+
+    Returns:
+        Callable: Wrapped function
+    """
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        request = _job_request.get() or {}
+        registry = CallbackMetrics()
+        tokens = _current_callback.set(name), _job_metrics.set(registry)
+        outcome = 'error'
+        # The job process only runs this callback, so its CPU time includes
+        # the threads that build outputs in parallel
+        started_wall, started_cpu = time.perf_counter(), time.process_time()
+        try:
+            if request.get('profile'):
+                response = profile_call(name, func, *args, **kwargs)
+            else:
+                response = func(*args, **kwargs)
+            outcome = 'ok'
+            return response
+        except PreventUpdate:
+            outcome = 'no_update'
+            raise
+        finally:
+            duration = time.perf_counter() - started_wall
+            cpu = time.process_time() - started_cpu
+            _job_metrics.reset(tokens[1])
+            _current_callback.reset(tokens[0])
+            registry.observe(name, outcome, {'duration_seconds': duration, 'cpu_seconds': cpu})
+            call = CallRecord(time.time(), name, duration, cpu, request.get('request_bytes', 0),
+                              0, outcome, request.get('inputs'))
+            try:
+                store.push({'metrics': registry.state(), 'call': call},
+                           prefix=JOB_REPORT_PREFIX, expire=METRICS_CONFIG['job_report_expire'])
+            except Exception:
+                logger.exception(f"Could not report metrics of background callback {name}")
+
+    return timed
+
+def collect_job_metrics() -> int:
+    """
+    Merge the reports of finished background jobs into this process's metrics.
+
+    Returns:
+        int: Number of reports merged
+    """
+    if _job_store is None:
+        return 0
+    merged = 0
+    while True:
+        _, report = _job_store.pull(prefix=JOB_REPORT_PREFIX)
+        if report is None:
+            return merged
+        metrics.merge(report['metrics'])
+        recent_calls.append(report['call'])
+        merged += 1
+
+def init_metrics(app) -> None:
+    """
+    Instrument all callbacks of a Dash app and serve ``/metrics``.
+
+    Callbacks registered with ``dash.callback`` move into the app's map on
+    the first request, so the map is checked again before each request
+    (a length comparison when nothing changed).
+
+    Args:
+        app (dash.Dash): The app; call after its own callbacks are defined
+    """
+    instrumented = {'count': 0}
+
+    def instrument_pending():
+        if len(app.callback_map) != instrumented['count']:
+            wrapped = instrument_callbacks(app.callback_map)
+            instrumented['count'] = len(app.callback_map)
+            if wrapped:
+                logger.info(f"Instrumented {wrapped} callbacks")
+
+    # Registered after Dash's own setup hook, so global callbacks are in the map
+    app.server.before_request(instrument_pending)
+    app.server.register_blueprint(metrics_bp)
+
+@metrics_bp.route(METRICS_CONFIG['path'])
+def metrics_endpoint():
+    """Prometheus text exposition of the callback metrics of this process."""
+    collect_job_metrics()
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,107 @@
+"""
+Parallel output construction for multi-output Dash callbacks.
+Builds independent figures and components concurrently in a bounded
+thread pool against one shared, read-only filtered DataFrame.
+"""
+
+import contextvars
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from utils.constants import PARALLEL_BUILD_CONFIG
+from utils.metrics import record_output
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide output builder pool.
+
+    The pool is created lazily and re-created after a fork, because threads
+    do not survive into background callback processes.
+
+    Returns:
+    --------
+    ThreadPoolExecutor
+        Bounded executor shared by all callbacks in this process
+    """
+    global _executor, _executor_pid
+
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=PARALLEL_BUILD_CONFIG['max_workers'],
+                thread_name_prefix='output-builder'
+            )
+            _executor_pid = os.getpid()
+    return _executor
+
+def build_outputs(name: str,
+                  builders: Dict[str, Callable[[pd.DataFrame], Any]],
+                  df: pd.DataFrame,
+                  on_complete: Optional[Callable[[str, int, int], None]] = None) -> List[Any]:
+    """
+    Build every output of a callback concurrently.
+
+    Each builder receives the same filtered DataFrame and must treat it as
+    read-only. Results are returned in the order of ``builders`` so they can
+    be returned straight from a multi-output callback. Builders run in the
+    caller's context, so their cache lookups and the per-output build times
+    are recorded against the callback being served.
+
+    Parameters:
+    -----------
+    name : str
+        Callback name used in log messages
+    builders : Dict[str, Callable]
+        Output name -> function building that output from the DataFrame
+    df : pandas.DataFrame
+        Shared filtered view of the dataset
+    on_complete : Callable, optional
+        Called as ``on_complete(output_name, done, total)`` in the calling
+        thread whenever an output finishes (e.g. to report progress)
+
+    Returns:
+    --------
+    List[Any]
+        Built outputs in builder order
+    """
+    def timed(output_name, builder):
+        start = time.perf_counter()
+        result = builder(df)
+        return result, time.perf_counter() - start
+
+    start = time.perf_counter()
+    executor = get_executor()
+    # One context copy per task: a context cannot be entered by two threads at once
+    futures = {
+        executor.submit(contextvars.copy_context().run, timed, output_name, builder): output_name
+        for output_name, builder in builders.items()
+    }
+
+    results, timings = {}, {}
+    for done, future in enumerate(
+            as_completed(futures, timeout=PARALLEL_BUILD_CONFIG['timeout']), start=1):
+        output_name = futures[future]
+        results[output_name], timings[output_name] = future.result()
+        record_output(output_name, timings[output_name])
+        if on_complete is not None:
+            on_complete(output_name, done, len(builders))
+
+    timings['total'] = time.perf_counter() - start
+    logger.debug(
+        f"{name} built {len(builders)} outputs in {timings['total']:.3f}s: "
+        + ", ".join(f"{k}={v:.3f}s" for k, v in timings.items() if k != 'total')
+    )
+
+    return [results[output_name] for output_name in builders]
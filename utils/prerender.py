@@ -0,0 +1,402 @@
+"""
+Static pre-rendering of dashboard pages for their default filter states.
+
+The build step (``python -m utils.prerender``) renders every page layout and
+runs its initial callbacks with the default input values found in that
+layout, then writes the results as JSON (plus an HTML snapshot of the
+figures) under ``prerendered/<dataset fingerprint>/``. At runtime
+``display_page`` and the initial callbacks return these artifacts instead of
+recomputing them, and the artifacts are ignored as soon as the dataset file
+changes.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import shutil
+import sys
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import plotly.io as pio
+from flask import Blueprint, abort, send_file
+from plotly.utils import PlotlyJSONEncoder
+
+from utils.constants import PRERENDER_CONFIG
+from utils.data_loading import get_dataset_fingerprint
+from utils.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+# Page name -> (module, layout factory, initial callbacks in dependency order)
+PRERENDER_PAGES = {
+    'overview': ('pages.overview', 'create_overview_layout', ['update_dashboard']),
+    'sales': ('pages.sales_analysis', 'create_sales_analysis_layout', [
+        'update_date_range',
+        'update_sales_trends',
+        'update_regional_distribution',
+        'update_genre_sales',
+        'update_platform_sales',
+        'update_top_games_visualization'
+    ]),
+    'genre': ('pages.genre_analysis', 'create_genre_analysis_layout', ['update_charts']),
+    'platform': ('pages.platform_analysis', 'create_platform_analysis_layout', [
+        'update_selected_years',
+        'update_end_year_options',
+        'update_charts',
+        'update_top_games'
+    ]),
+    'publisher': ('pages.publisher_analysis', 'create_publisher_analysis_layout', ['update_charts'])
+}
+
+# URL pathname -> page name (mirrors display_page; /logs is always live)
+PAGE_ROUTES = {
+    '/': 'overview',
+    '/overview': 'overview',
+    '/sales': 'sales',
+    '/genre': 'genre',
+    '/platform': 'platform',
+    '/publisher': 'publisher'
+}
+
+_MISSING = object()
+
+prerender_bp = Blueprint('prerendered', __name__, url_prefix='/prerendered')
+
+def _to_json(value: Any) -> str:
+    return json.dumps(value, cls=PlotlyJSONEncoder)
+
+def _normalize(value: Any) -> Any:
+    """
+    Give a value the shape the browser sends it back in.
+
+    JavaScript has a single number type, so a float with an integral value
+    (e.g. a numpy year of 1980.0 in a dropdown) comes back as 1980.
+    """
+    if hasattr(value, 'item') and not isinstance(value, (list, tuple, dict)):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    return value
+
+def _input_key(values: Sequence[Any], ignore: Sequence[int] = ()) -> str:
+    """Build the lookup key of a callback call from its input values."""
+    kept = [_normalize(value) for i, value in enumerate(values) if i not in ignore]
+    return json.dumps(kept, sort_keys=True, cls=PlotlyJSONEncoder)
+
+def _browser_values(values: Sequence[Any]) -> List[Any]:
+    """Input values as a browser sends them back after receiving them as JSON."""
+    def parse_number(text):
+        number = float(text)
+        return int(number) if number.is_integer() else number
+    return json.loads(_to_json(list(values)), parse_float=parse_number)
+
+def _artifact_dir(fingerprint: Optional[str] = None) -> Path:
+    fingerprint = fingerprint or get_dataset_fingerprint()
+    return Path(PRERENDER_CONFIG['output_dir']) / fingerprint
+
+def _current_artifacts() -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Pre-rendered layouts and outputs for the current dataset.
+
+    The artifact directory's modification time is part of the cache key, so
+    artifacts built by another process (or after this one started) are
+    picked up without a restart.
+    """
+    fingerprint = get_dataset_fingerprint()
+    try:
+        version = _artifact_dir(fingerprint).stat().st_mtime_ns
+    except OSError:
+        version = None
+    return _load_artifacts(fingerprint, version)
+
+@functools.lru_cache(maxsize=2)
+def _load_artifacts(fingerprint: str,
+                    version: Optional[int] = None) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Load the pre-rendered layouts and callback outputs of a dataset version.
+
+    Args:
+        fingerprint (str): Dataset fingerprint the artifacts were built for
+        version (int, optional): Modification time of the artifact directory
+            (only used as part of the cache key)
+
+    Returns:
+        Tuple[Dict, Dict]: Page name -> layout, and callback name -> {input key: output}
+    """
+    layouts, outputs = {}, {}
+    directory = _artifact_dir(fingerprint)
+    for page in PRERENDER_PAGES:
+        path = directory / f"{page}.json"
+        if not path.exists():
+            continue
+        with open(path, encoding='utf-8') as f:
+            artifact = json.load(f)
+        layouts[page] = artifact['layout']
+        for name, calls in artifact['callbacks'].items():
+            outputs.setdefault(name, {}).update(
+                (call['key'], call['output']) for call in calls
+            )
+
+    if layouts:
+        logger.info(f"Loaded pre-rendered pages {sorted(layouts)} for dataset {fingerprint}")
+    return layouts, outputs
+
+def get_prerendered_layout(pathname: str) -> Optional[Dict]:
+    """
+    Get the pre-rendered layout for a URL pathname.
+
+    Args:
+        pathname (str): URL pathname routed by display_page
+
+    Returns:
+        Optional[Dict]: Serialized layout, or None if the page has to be rendered live
+    """
+    page = PAGE_ROUTES.get(pathname)
+    if page is None:
+        return None
+    layouts, _ = _current_artifacts()
+    return layouts.get(page)
+
+def serve_prerendered(ignore: Sequence[int] = ()) -> Callable:
+    """
+    Serve a callback's pre-rendered output when called with default inputs.
+
+    Apply between ``@callback`` and the function. Calls whose inputs match a
+    pre-rendered call return the stored output without running the callback;
+    any other call runs it as usual. A ``set_progress`` argument passed to
+    background callbacks is not part of the inputs.
+
+    Args:
+        ignore (Sequence[int]): Positions of inputs/states that do not affect
+            whether the stored output can be reused (e.g. the viewport size)
+
+    Returns:
+        Callable: Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        name = f"{func.__module__}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            values = [arg for arg in args if not callable(arg)]
+            _, outputs = _current_artifacts()
+            output = outputs.get(name, {}).get(_input_key(values, ignore), _MISSING)
+            record_cache('prerender', output is not _MISSING)
+            if output is _MISSING:
+                return func(*args)
+            logger.debug(f"Serving pre-rendered output of {name}")
+            return output
+
+        wrapper.prerender_ignore = tuple(ignore)
+        return wrapper
+    return decorator
+
+def _collect_props(node: Any, props: Dict[Tuple[str, str], Any]) -> None:
+    """Record the props of every component with an id in a serialized layout."""
+    if isinstance(node, list):
+        for child in node:
+            _collect_props(child, props)
+    elif isinstance(node, dict):
+        if 'props' in node and 'type' in node:
+            component_id = node['props'].get('id')
+            if isinstance(component_id, str):
+                for prop, value in node['props'].items():
+                    props[(component_id, prop)] = value
+            _collect_props(node['props'].get('children'), props)
+        else:
+            for value in node.values():
+                _collect_props(value, props)
+
+def get_callback_spec(func: Callable) -> Dict:
+    """
+    Find the registered Dash callback spec of a page callback.
+
+    Args:
+        func (Callable): Page callback, with or without its decorators
+
+    Returns:
+        Dict: Spec with 'inputs', 'state', 'output' and 'long' entries
+    """
+    from dash._callback import GLOBAL_CALLBACK_MAP
+
+    target = inspect.unwrap(func)
+    for spec in GLOBAL_CALLBACK_MAP.values():
+        if inspect.unwrap(spec['callback']) is target:
+            return spec
+    raise LookupError(f"No registered callback for {func.__module__}.{func.__name__}")
+
+def _collect_figures(node: Any, figures: List[Dict]) -> None:
+    """Collect serialized plotly figures from layouts and callback outputs."""
+    if isinstance(node, list):
+        for child in node:
+            _collect_figures(child, figures)
+    elif isinstance(node, dict):
+        if 'data' in node and 'layout' in node and isinstance(node['data'], list):
+            figures.append(node)
+            return
+        for value in node.values():
+            _collect_figures(value, figures)
+
+def render_page(page: str) -> Dict[str, Any]:
+    """
+    Render a page layout and its initial callbacks for the default filter state.
+
+    Callbacks run in the order listed in PRERENDER_PAGES; each one reads its
+    inputs from the layout plus the outputs of the callbacks before it, the
+    same chain the browser runs on first load. Values are passed through JSON
+    so they match what the browser would send back.
+
+    Args:
+        page (str): Page name from PRERENDER_PAGES
+
+    Returns:
+        Dict[str, Any]: {'page', 'layout', 'callbacks'} ready to be written as JSON
+    """
+    module_name, layout_factory, callback_names = PRERENDER_PAGES[page]
+    module = import_module(module_name)
+
+    layout = json.loads(_to_json(getattr(module, layout_factory)()))
+    props: Dict[Tuple[str, str], Any] = {}
+    _collect_props(layout, props)
+
+    callbacks = {}
+    for callback_name in callback_names:
+        func = getattr(module, callback_name)
+        spec = get_callback_spec(func)
+        values = [props.get((dep['id'], dep['property']))
+                  for dep in spec['inputs'] + spec['state']]
+
+        args = list(values)
+        if spec['long'] is not None:
+            args.insert(0, lambda *_: None)  # set_progress
+        result = json.loads(_to_json(inspect.unwrap(func)(*args)))
+
+        outputs = spec['output'] if isinstance(spec['output'], list) else [spec['output']]
+        results = result if isinstance(spec['output'], list) else [result]
+        for output, value in zip(outputs, results):
+            props[(output.component_id, output.component_property)] = value
+
+        callbacks[f"{module_name}.{callback_name}"] = [{
+            'key': _input_key(values, getattr(func, 'prerender_ignore', ())),
+            'values': values,
+            'output': result
+        }]
+
+    return {'page': page, 'layout': layout, 'callbacks': callbacks}
+
+def _write_html(artifact: Dict[str, Any], path: Path) -> None:
+    """Write a static HTML snapshot of every figure on a pre-rendered page."""
+    figures: List[Dict] = []
+    _collect_figures([artifact['layout'], artifact['callbacks']], figures)
+    body = "\n".join(
+        pio.to_html(figure, full_html=False,
+                    include_plotlyjs='cdn' if i == 0 else False,
+                    validate=False)
+        for i, figure in enumerate(figures)
+    )
+    path.write_text(
+        f"<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\">"
+        f"<title>{artifact['page'].title()} - Video Game Sales Dashboard</title></head>\n"
+        f"<body>\n{body}\n</body>\n</html>\n",
+        encoding='utf-8'
+    )
+
+def build_prerendered(pages: Optional[Sequence[str]] = None) -> Path:
+    """
+    Pre-render pages for the current dataset and drop artifacts of older versions.
+
+    Args:
+        pages (Sequence[str], optional): Page names to render (defaults to all)
+
+    Returns:
+        Path: Directory the artifacts were written to
+    """
+    fingerprint = get_dataset_fingerprint()
+    directory = _artifact_dir(fingerprint)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    for page in pages or PRERENDER_PAGES:
+        artifact = render_page(page)
+        # Written beside and renamed into place: servers never read a partial
+        # file, and the rename updates the directory time they key their cache on
+        partial = directory / f".{page}.json.partial"
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump(artifact, f, separators=(',', ':'))
+        os.replace(partial, directory / f"{page}.json")
+        _write_html(artifact, directory / f"{page}.html")
+        logger.info(f"Pre-rendered page '{page}' for dataset {fingerprint}")
+
+    for stale in directory.parent.iterdir():
+        if stale.is_dir() and stale.name != fingerprint:
+            shutil.rmtree(stale)
+            logger.info(f"Removed pre-rendered pages for stale dataset {stale.name}")
+
+    _load_artifacts.cache_clear()
+    return directory
+
+def check_prerendered(fingerprint: Optional[str] = None) -> List[str]:
+    """
+    Check that browser-shaped calls with the default inputs hit the artifacts.
+
+    Replays every stored call the way the browser sends it (after a JSON
+    round trip through JavaScript numbers) through the same lookup that
+    ``serve_prerendered`` uses.
+
+    Args:
+        fingerprint (str, optional): Dataset version (defaults to the current one)
+
+    Returns:
+        List[str]: Callbacks whose default call would miss (empty when all hit)
+    """
+    fingerprint = fingerprint or get_dataset_fingerprint()
+    misses = []
+    for page, (module_name, _, callback_names) in PRERENDER_PAGES.items():
+        path = _artifact_dir(fingerprint) / f"{page}.json"
+        if not path.exists():
+            continue
+        with open(path, encoding='utf-8') as f:
+            artifact = json.load(f)
+        module = import_module(module_name)
+        for callback_name in callback_names:
+            name = f"{module_name}.{callback_name}"
+            ignore = getattr(getattr(module, callback_name), 'prerender_ignore', ())
+            keys = {call['key'] for call in artifact['callbacks'].get(name, [])}
+            for call in artifact['callbacks'].get(name, []):
+                if _input_key(_browser_values(call['values']), ignore) not in keys:
+                    misses.append(name)
+    return misses
+
+@prerender_bp.route('/<page>.<ext>')
+def serve_artifact(page: str, ext: str):
+    """Serve a pre-rendered page as JSON or HTML for the current dataset."""
+    if page not in PRERENDER_PAGES or ext not in ('json', 'html'):
+        abort(404)
+
+    fingerprint = get_dataset_fingerprint()
+    path = _artifact_dir(fingerprint) / f"{page}.{ext}"
+    if not path.exists():
+        abort(404)
+
+    response = send_file(path.resolve(), etag=f"{fingerprint}-{page}.{ext}")
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+if __name__ == "__main__":
+    # Usage: python -m utils.prerender [page ...]
+    unknown = [page for page in sys.argv[1:] if page not in PRERENDER_PAGES]
+    if unknown:
+        print(f"Unknown pages: {', '.join(unknown)}; choose from {', '.join(PRERENDER_PAGES)}")
+        sys.exit(1)
+    print(f"Pre-rendered pages written to {build_prerendered(sys.argv[1:] or None)}")
+    misses = check_prerendered()
+    if misses:
+        print(f"Browser-shaped default calls would miss the pre-rendered output of: {', '.join(misses)}")
+        sys.exit(1)
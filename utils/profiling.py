@@ -0,0 +1,188 @@
+"""
+Opt-in, admin-only profiling of individual callback requests.
+
+Profiling is disabled unless an admin token is configured (environment
+variable named by PROFILING_CONFIG['token_env']). A request is profiled
+when it carries that token in the ``X-Profile-Token`` header, the
+``profile`` query parameter, or the profiling cookie set by
+``/profiling/enable?token=...`` (which is how a browser session opts in,
+since Dash's own requests cannot be given extra headers). The callback runs
+under cProfile and the stats are written to the profiles directory, keeping
+only the newest files.
+"""
+
+import cProfile
+import hmac
+import io
+import logging
+import os
+import pstats
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import flask
+from flask import Blueprint, Response, abort, redirect, request, send_file
+
+from utils.constants import PROFILING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+PROFILE_NAME_PATTERN = re.compile(
+    r'^(?P<time>\d{8}-\d{6}-\d{3})_(?P<callback>[\w.]+)_(?P<ms>\d+)ms\.prof$'
+)
+
+profiling_bp = Blueprint('profiling', __name__)
+
+def _admin_token() -> Optional[str]:
+    return os.environ.get(PROFILING_CONFIG['token_env']) or None
+
+def _valid(token: Optional[str]) -> bool:
+    expected = _admin_token()
+    return bool(expected and token and hmac.compare_digest(token, expected))
+
+def should_profile(name: str) -> bool:
+    """
+    Whether a callback call in the current request should be profiled.
+
+    Args:
+        name (str): Callback name
+
+    Returns:
+        bool: True for admin requests, except for excluded callbacks
+    """
+    return name not in PROFILING_CONFIG['exclude_callbacks'] and is_admin()
+
+def is_admin() -> bool:
+    """
+    Whether the current request carries the admin token.
+
+    Returns:
+        bool: True for a header, query parameter or cookie matching the token
+    """
+    if not flask.has_request_context() or _admin_token() is None:
+        return False
+    return any(_valid(token) for token in (
+        request.headers.get('X-Profile-Token'),
+        request.args.get('profile'),
+        request.cookies.get(PROFILING_CONFIG['cookie'])
+    ))
+
+def _profile_dir() -> Path:
+    return Path(PROFILING_CONFIG['output_dir'])
+
+def _prune() -> None:
+    """Delete the oldest profiles beyond the retention limit."""
+    profiles = sorted(_profile_dir().glob("*.prof"), key=lambda path: path.name, reverse=True)
+    for path in profiles[PROFILING_CONFIG['max_profiles']:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+def profile_call(name: str, func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a callback under cProfile and store the stats.
+
+    The profile is written even when the callback raises (including
+    PreventUpdate), unless the call took less than PROFILING_CONFIG['min_ms'].
+
+    Args:
+        name (str): Callback name, used in the file name
+        func (Callable): Callback to run
+        *args, **kwargs: Passed to the callback
+
+    Returns:
+        Any: The callback's return value
+    """
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        if elapsed_ms >= PROFILING_CONFIG['min_ms']:
+            _save(profiler, name, elapsed_ms)
+
+def _save(profiler: cProfile.Profile, name: str, elapsed_ms: int) -> None:
+    """Write a profile and apply the retention limit."""
+    directory = _profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')[:-3]
+    path = directory / f"{stamp}_{name}_{elapsed_ms}ms.prof"
+    profiler.dump_stats(path)
+    _prune()
+    logger.info(f"Profiled {name} ({elapsed_ms} ms) to {path.name}")
+
+def list_profiles() -> List[Dict]:
+    """
+    List the retained profiles, newest first.
+
+    Returns:
+        List[Dict]: 'name', 'callback', 'ms', 'time' (datetime) and 'bytes' per file
+    """
+    profiles = []
+    for path in sorted(_profile_dir().glob("*.prof"), key=lambda path: path.name, reverse=True):
+        match = PROFILE_NAME_PATTERN.match(path.name)
+        if not match:
+            continue
+        try:
+            size = path.stat().st_size
+        except OSError:
+            continue
+        profiles.append({
+            'name': path.name,
+            'callback': match.group('callback'),
+            'ms': int(match.group('ms')),
+            'time': datetime.strptime(match.group('time'), '%Y%m%d-%H%M%S-%f'),
+            'bytes': size
+        })
+    return profiles
+
+def format_profile(name: str, limit: int = 40) -> str:
+    """
+    Render the top functions of a stored profile by cumulative time.
+
+    Args:
+        name (str): Profile file name
+        limit (int): Number of functions to list
+
+    Returns:
+        str: pstats report
+    """
+    stream = io.StringIO()
+    stats = pstats.Stats(str(_profile_dir() / name), stream=stream)
+    stats.strip_dirs().sort_stats('cumulative').print_stats(limit)
+    return stream.getvalue()
+
+@profiling_bp.route('/profiling/enable')
+def enable_profiling():
+    """Set the profiling cookie so this browser's callback requests are profiled."""
+    token = request.args.get('token')
+    if not _valid(token):
+        abort(403)
+    response = redirect('/perf')
+    response.set_cookie(PROFILING_CONFIG['cookie'], token, httponly=True, samesite='Strict',
+                        secure=request.is_secure)
+    return response
+
+@profiling_bp.route('/profiling/disable')
+def disable_profiling():
+    """Clear the profiling cookie."""
+    response = redirect('/perf')
+    response.delete_cookie(PROFILING_CONFIG['cookie'])
+    return response
+
+@profiling_bp.route('/profiling/<name>')
+def download_profile(name: str):
+    """Download a stored profile (``.prof`` for pstats/snakeviz, or ``?format=txt``)."""
+    if not is_admin():
+        abort(403)
+    if not PROFILE_NAME_PATTERN.match(name) or not (_profile_dir() / name).exists():
+        abort(404)
+    if request.args.get('format') == 'txt':
+        return Response(format_profile(name), mimetype='text/plain')
+    return send_file((_profile_dir() / name).resolve(), as_attachment=True,
+                     mimetype='application/octet-stream')
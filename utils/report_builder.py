@@ -0,0 +1,372 @@
+"""
+Batch report generator for the video game sales dashboard.
+
+Builds every figure from ``components/charts`` and the page callbacks for a
+list of filter presets without starting Dash, then renders one
+self-contained HTML report per preset (plus PNG/SVG images when kaleido is
+installed) through a process pool.
+
+Figures are built once per distinct input, not once per preset: presets
+that share a year range reuse the page figures that only depend on it, and
+presets with identical filters reuse everything. The dataset is loaded and
+cleaned once in the parent process and inherited by the forked workers.
+
+Usage:
+    python -m utils.report_builder [--presets presets.json] [--output reports]
+                                   [--formats png svg] [--workers N] [--cdn]
+"""
+
+import argparse
+import html as html_lib
+import importlib.util
+import inspect
+import json
+import logging
+import multiprocessing
+import os
+import re
+import time
+from importlib import import_module
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from utils.constants import REPORT_CONFIG, EXPORT_CONFIG, TIME_PERIODS
+from utils.data_loading import load_vgsales_data, filter_data
+from utils.shared_data import get_shared_dataset
+
+logger = logging.getLogger(__name__)
+
+def default_presets() -> List[Dict[str, Any]]:
+    """
+    Get the built-in presets: the full dataset plus one report per decade.
+
+    Returns:
+        List[Dict[str, Any]]: Preset definitions
+    """
+    dataset = get_shared_dataset()
+    years = dataset.year[~np.isnan(dataset.year)]
+    presets = [{'name': 'all_time', 'years': [int(years.min()), int(years.max())]}]
+    for decade, (start, end) in TIME_PERIODS['by_decade'].items():
+        presets.append({'name': decade, 'years': [start, end]})
+    return presets
+
+def load_presets(path: str) -> List[Dict[str, Any]]:
+    """
+    Load and normalize filter presets from a JSON file.
+
+    Each preset is an object with a ``name`` and ``years`` ([start, end]) and
+    optional ``platforms``, ``genres``, ``publishers`` lists and ``region``
+    (sales column for the genre page).
+
+    Args:
+        path (str): Path to a JSON list of presets
+
+    Returns:
+        List[Dict[str, Any]]: Normalized presets
+
+    Raises:
+        ValueError: If the file holds no presets, a preset is missing a field
+            or two names map to the same report directory
+    """
+    with open(path, encoding='utf-8') as f:
+        presets = json.load(f)
+
+    if not presets:
+        raise ValueError(f"No presets in {path}")
+
+    for preset in presets:
+        if 'name' not in preset or 'years' not in preset:
+            raise ValueError(f"Preset needs 'name' and 'years': {preset}")
+    _check_report_dirs(presets)
+    return presets
+
+def _check_report_dirs(presets: List[Dict[str, Any]]) -> None:
+    """Raise ValueError if two presets would write to the same report directory."""
+    slugs: Dict[str, str] = {}
+    for preset in presets:
+        slug = _slug(preset['name'])
+        if slug in slugs:
+            raise ValueError(f"Preset names {slugs[slug]!r} and {preset['name']!r} "
+                             f"both map to report directory {slug!r}")
+        slugs[slug] = preset['name']
+
+def _normalize(preset: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'name': preset['name'],
+        'years': (int(preset['years'][0]), int(preset['years'][1])),
+        'platforms': tuple(sorted(preset.get('platforms') or [])),
+        'genres': tuple(sorted(preset.get('genres') or [])),
+        'publishers': tuple(sorted(preset.get('publishers') or [])),
+        'region': preset.get('region', 'Global_Sales')
+    }
+
+def _as_figure(value: Any) -> Optional[go.Figure]:
+    """Extract a plotly figure from a builder result, if it holds one."""
+    if isinstance(value, go.Figure):
+        return value
+    if hasattr(value, 'figure') and value.figure is not None:
+        return go.Figure(value.figure)
+    if isinstance(value, dict) and 'data' in value and 'layout' in value:
+        return go.Figure(value)
+    return None
+
+def _chart_builders(preset: Dict[str, Any]) -> Dict[str, Callable]:
+    """Figure builders from components/charts, keyed by figure name."""
+    from components.charts import (
+        dashboard_charts, genre_charts, platform_charts,
+        publisher_charts, regional_charts, yearly_sales
+    )
+    return {
+        'sales_trend': dashboard_charts.create_sales_trend_chart,
+        'regional_distribution': dashboard_charts.create_regional_distribution_chart,
+        'genre_distribution': dashboard_charts.create_genre_distribution_chart,
+        'platform_share': dashboard_charts.create_platform_share_chart,
+        'genre_sales': genre_charts.create_genre_sales_chart,
+        'genre_timeline': genre_charts.create_genre_timeline,
+        'genre_platform_distribution':
+            lambda df: genre_charts.create_genre_platform_distribution(df, preset['region']),
+        'genre_regional_analysis': genre_charts.create_genre_regional_analysis,
+        'genre_publisher_affinity': genre_charts.create_genre_publisher_affinity,
+        'platform_sales': platform_charts.create_platform_sales_chart,
+        'platform_timeline': platform_charts.create_platform_timeline,
+        'platform_genre_distribution': platform_charts.create_platform_genre_distribution,
+        'platform_regional_share': platform_charts.create_platform_regional_share,
+        'top_publishers': publisher_charts.create_top_publishers_chart,
+        'publisher_genre_analysis': publisher_charts.create_publisher_genre_analysis,
+        'publisher_timeline': publisher_charts.create_publisher_timeline,
+        'publisher_regional_performance': publisher_charts.create_publisher_regional_performance,
+        'regional_distribution_pie': regional_charts.create_regional_distribution_pie,
+        'regional_heatmap': regional_charts.create_regional_heatmap,
+        'yearly_sales': yearly_sales.create_yearly_sales_chart,
+        'yearly_regional_sales': yearly_sales.create_yearly_regional_sales
+    }
+
+def _page_calls(preset: Dict[str, Any]) -> Dict[str, Tuple[str, str, tuple]]:
+    """
+    Page callbacks to run for a preset.
+
+    Returns:
+        Dict: Section -> (module, callback, input values). The inputs are
+        exactly what the callback depends on, so they double as the key for
+        reusing the section across presets.
+    """
+    start, end = preset['years']
+    dates = (f"{start}-01-01", f"{end}-12-31", 0)
+    return {
+        'overview': ('pages.overview', 'update_dashboard', (start, end)),
+        'sales_trends': ('pages.sales_analysis', 'update_sales_trends', dates),
+        'sales_regional': ('pages.sales_analysis', 'update_regional_distribution', dates),
+        'sales_genre': ('pages.sales_analysis', 'update_genre_sales', dates),
+        'sales_platform': ('pages.sales_analysis', 'update_platform_sales', dates),
+        'genre': ('pages.genre_analysis', 'update_charts', (start, end, preset['region'])),
+        'platform': ('pages.platform_analysis', 'update_charts',
+                     (start, end, list(preset['platforms']))),
+        'publisher': ('pages.publisher_analysis', 'update_charts',
+                      (start, end, list(preset['publishers']), None))
+    }
+
+def _build_task(kind: str, key: Any, preset: Dict[str, Any]) -> Tuple[str, Any, Dict[str, Dict]]:
+    """
+    Build one shared unit of figures in a worker.
+
+    Args:
+        kind (str): 'charts' for components/charts on the filtered data, or a
+            page section name from _page_calls
+        key (Any): Reuse key of the unit
+        preset (Dict[str, Any]): Any preset that maps to this unit
+
+    Returns:
+        Tuple[str, Any, Dict[str, Dict]]: kind, key and figure name -> figure JSON
+    """
+    from utils.prerender import get_callback_spec
+
+    figures = {}
+    if kind == 'charts':
+        df = filter_data(
+            get_shared_dataset().clean_frame, preset['years'],
+            list(preset['platforms']), list(preset['genres']), list(preset['publishers'])
+        )
+        for name, builder in _chart_builders(preset).items():
+            try:
+                figure = _as_figure(builder(df))
+            except Exception as e:
+                logger.warning(f"Skipping {name} for preset {preset['name']}: {e}")
+                continue
+            if figure is not None:
+                figures[name] = figure.to_plotly_json()
+    else:
+        module_name, callback_name, values = _page_calls(preset)[kind]
+        func = getattr(import_module(module_name), callback_name)
+        spec = get_callback_spec(func)
+        args = list(values)
+        if spec['long'] is not None:
+            args.insert(0, lambda *_: None)  # set_progress
+        result = inspect.unwrap(func)(*args)
+
+        outputs = spec['output'] if isinstance(spec['output'], list) else [spec['output']]
+        results = result if isinstance(spec['output'], list) else [result]
+        for output, value in zip(outputs, results):
+            figure = _as_figure(value)
+            if figure is not None:
+                figures[output.component_id] = figure.to_plotly_json()
+
+    return kind, key, figures
+
+def _slug(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_') or 'report'
+
+def _render_report(preset: Dict[str, Any],
+                   sections: Dict[str, Dict[str, Dict]],
+                   output_dir: str,
+                   image_formats: List[str],
+                   cdn: bool) -> Tuple[str, int, float]:
+    """
+    Write one preset's HTML report and images in a worker.
+
+    Args:
+        preset (Dict[str, Any]): Normalized preset
+        sections (Dict[str, Dict[str, Dict]]): Section -> figure name -> figure JSON
+        output_dir (str): Root output directory
+        image_formats (List[str]): Static image formats to export
+        cdn (bool): Load plotly.js from the CDN instead of inlining it
+
+    Returns:
+        Tuple[str, int, float]: Preset name, number of figures and seconds spent
+    """
+    start = time.perf_counter()
+    directory = Path(output_dir) / _slug(preset['name'])
+    directory.mkdir(parents=True, exist_ok=True)
+
+    parts, count = [], 0
+    for section, figures in sections.items():
+        parts.append(f"<h2>{html_lib.escape(section.replace('_', ' ').title())}</h2>")
+        for name, figure_json in figures.items():
+            figure = go.Figure(figure_json, skip_invalid=True)
+            parts.append(pio.to_html(
+                figure, full_html=False, validate=False,
+                include_plotlyjs=('cdn' if cdn else True) if count == 0 else False
+            ))
+            for fmt in image_formats:
+                figure.write_image(str(directory / f"{section}_{name}.{fmt}"),
+                                   format=fmt, scale=REPORT_CONFIG['image_scale'])
+            count += 1
+
+    filters = ", ".join(
+        f"{field}: {', '.join(map(str, preset[field]))}"
+        for field in ('platforms', 'genres', 'publishers') if preset[field]
+    )
+    title = html_lib.escape(f"Video Game Sales Report - {preset['name']}")
+    (directory / 'report.html').write_text(
+        f"<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\"><title>{title}</title></head>\n"
+        f"<body>\n<h1>{title}</h1>\n"
+        f"<p>Years {preset['years'][0]}-{preset['years'][1]}"
+        f"{html_lib.escape('; ' + filters) if filters else ''}</p>\n"
+        + "\n".join(parts) + "\n</body>\n</html>\n",
+        encoding='utf-8'
+    )
+    return preset['name'], count, time.perf_counter() - start
+
+def build_reports(presets: List[Dict[str, Any]],
+                  output_dir: str = None,
+                  image_formats: Optional[List[str]] = None,
+                  workers: Optional[int] = None,
+                  cdn: bool = False) -> Dict[str, int]:
+    """
+    Build the reports for a list of presets.
+
+    Args:
+        presets (List[Dict[str, Any]]): Filter presets (see load_presets)
+        output_dir (str, optional): Root output directory
+        image_formats (List[str], optional): Static image formats (e.g. ['png', 'svg'])
+        workers (int, optional): Worker processes (defaults to the CPU count)
+        cdn (bool): Load plotly.js from the CDN instead of inlining it
+
+    Returns:
+        Dict[str, int]: Preset name -> number of figures written
+
+    Raises:
+        ValueError: If there are no presets or two presets map to the same
+            report directory
+    """
+    output_dir = output_dir or REPORT_CONFIG['output_dir']
+    image_formats = list(image_formats or [])
+    if image_formats and importlib.util.find_spec('kaleido') is None:
+        logger.warning(f"kaleido is not installed; skipping {', '.join(image_formats)} export "
+                       "(pip install kaleido to enable static images)")
+        image_formats = []
+
+    presets = [_normalize(preset) for preset in presets]
+    if not presets:
+        raise ValueError("No presets to build reports for")
+    _check_report_dirs(presets)
+
+    # Load, clean and index once here (and import the figure modules) so
+    # forked workers inherit the data instead of rebuilding it
+    get_shared_dataset()
+    load_vgsales_data()
+    _chart_builders(presets[0])
+    for module_name, _, _ in _page_calls(presets[0]).values():
+        import_module(module_name)
+
+    # Distinct build units: components/charts depend on the full filter,
+    # each page section only on its own inputs
+    units: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+    for preset in presets:
+        filter_key = (preset['years'], preset['platforms'], preset['genres'],
+                      preset['publishers'], preset['region'])
+        units.setdefault(('charts', filter_key), preset)
+        for section, (_, _, values) in _page_calls(preset).items():
+            units.setdefault((section, json.dumps(values)), preset)
+
+    context = (multiprocessing.get_context('fork')
+               if 'fork' in multiprocessing.get_all_start_methods() else None)
+    workers = workers or os.cpu_count()
+    start = time.perf_counter()
+
+    built: Dict[Tuple[str, Any], Dict[str, Dict]] = {}
+    written: Dict[str, int] = {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(_build_task, kind, key, preset)
+                   for (kind, key), preset in units.items()]
+        for future in as_completed(futures):
+            kind, key, figures = future.result()
+            built[(kind, key)] = figures
+        logger.info(f"Built {len(units)} figure groups for {len(presets)} presets "
+                    f"in {time.perf_counter() - start:.1f}s")
+
+        futures = []
+        for preset in presets:
+            filter_key = (preset['years'], preset['platforms'], preset['genres'],
+                          preset['publishers'], preset['region'])
+            sections = {'charts': built[('charts', filter_key)]}
+            for section, (_, _, values) in _page_calls(preset).items():
+                sections[section] = built[(section, json.dumps(values))]
+            futures.append(pool.submit(_render_report, preset, sections,
+                                       output_dir, image_formats, cdn))
+        for future in as_completed(futures):
+            name, count, seconds = future.result()
+            written[name] = count
+            logger.info(f"Wrote report '{name}' with {count} figures in {seconds:.1f}s")
+
+    logger.info(f"Wrote {len(written)} reports to {output_dir} "
+                f"in {time.perf_counter() - start:.1f}s")
+    return written
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build static dashboard reports for filter presets")
+    parser.add_argument('--presets', help="JSON file with a list of presets (defaults to all time plus decades)")
+    parser.add_argument('--output', default=REPORT_CONFIG['output_dir'], help="Output directory")
+    parser.add_argument('--formats', nargs='*', default=[],
+                        choices=EXPORT_CONFIG['chart_formats'], help="Static image formats to export")
+    parser.add_argument('--workers', type=int, help="Worker processes (defaults to the CPU count)")
+    parser.add_argument('--cdn', action='store_true', help="Load plotly.js from the CDN instead of inlining it")
+    args = parser.parse_args()
+
+    presets = load_presets(args.presets) if args.presets else default_presets()
+    written = build_reports(presets, args.output, args.formats, args.workers, args.cdn)
+    print(f"Wrote {len(written)} reports ({sum(written.values())} figures) to {args.output}")
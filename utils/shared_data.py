@@ -0,0 +1,248 @@
+"""
+Shared, fork-friendly dataset store for the video game sales dashboard.
+
+In the pre-fork serving mode the gunicorn master loads, cleans and indexes
+the data once, then freezes the garbage collector before forking workers,
+so workers start without loading anything themselves. The indexes (games
+table, sales cube) read a handful of large numpy arrays (categorical codes,
+years, sales); reference-count and GC writes only touch their object
+headers, so those buffers stay shared copy-on-write between workers. The
+page callbacks still work on the validated DataFrame, whose object-dtype
+columns (names, platforms, genres, publishers) are Python objects: the
+pages holding them are copied into a worker as its callbacks touch them.
+"""
+
+import gc
+import logging
+import os
+import sys
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.constants import SALES_COLUMNS
+from utils.data_loading import load_vgsales_data, get_dataset_fingerprint
+from utils.data_processing import clean_dataset
+from utils.metrics import record_load
+
+logger = logging.getLogger(__name__)
+
+CATEGORY_COLUMNS = ['Platform', 'Genre', 'Publisher']
+
+class SharedDataset:
+    """
+    Columnar, indexed view of the dataset built once per process tree.
+
+    Attributes:
+        frame (pd.DataFrame): Validated dataset as returned by load_vgsales_data
+        clean_frame (pd.DataFrame): Output of clean_dataset for the same data
+        fingerprint (str): Dataset version the store was built from
+        codes (Dict[str, np.ndarray]): Integer codes per categorical column
+            (-1 marks a missing value)
+        categories (Dict[str, np.ndarray]): Code -> label per categorical column
+        year (np.ndarray): Release year per row (NaN when unknown)
+        sales (Dict[str, np.ndarray]): Sales arrays per sales column
+        year_order (np.ndarray): Row positions sorted by year
+    """
+
+    def __init__(self, frame: pd.DataFrame, fingerprint: str):
+        self.frame = frame
+        self.clean_frame = clean_dataset(frame)
+        self.fingerprint = fingerprint
+
+        self.codes: Dict[str, np.ndarray] = {}
+        self.categories: Dict[str, np.ndarray] = {}
+        for col in CATEGORY_COLUMNS:
+            codes, uniques = pd.factorize(frame[col], sort=True)
+            self.codes[col] = codes.astype(np.int32)
+            self.categories[col] = np.asarray(uniques, dtype=object)
+
+        self.year = frame['Year'].to_numpy(dtype=np.float64)
+        self.sales = {col: frame[col].to_numpy(dtype=np.float64) for col in SALES_COLUMNS}
+
+        # NaN years sort last, so year ranges are contiguous slices of year_order
+        self.year_order = np.argsort(self.year, kind='stable')
+        self._sorted_years = self.year[self.year_order]
+
+    def __len__(self) -> int:
+        return len(self.year)
+
+    def rows_for_years(self, start_year: float, end_year: float) -> np.ndarray:
+        """
+        Get the row positions released within an inclusive year range.
+
+        Args:
+            start_year (float): First year to include
+            end_year (float): Last year to include
+
+        Returns:
+            np.ndarray: Row positions (ordered by year)
+        """
+        lo = np.searchsorted(self._sorted_years, start_year, side='left')
+        hi = np.searchsorted(self._sorted_years, end_year, side='right')
+        return self.year_order[lo:hi]
+
+    def codes_for(self, column: str, labels: Iterable[str]) -> np.ndarray:
+        """
+        Translate category labels to their integer codes, ignoring unknown labels.
+
+        Args:
+            column (str): Categorical column name
+            labels (Iterable[str]): Labels to translate
+
+        Returns:
+            np.ndarray: Codes of the labels present in the dataset
+        """
+        categories = self.categories[column]
+        labels = np.asarray(list(labels), dtype=object)
+        positions = np.searchsorted(categories, labels)
+        positions = np.clip(positions, 0, max(len(categories) - 1, 0))
+        return positions[categories[positions] == labels]
+
+    def game(self, row_id: int) -> Dict:
+        """
+        Get the full record of a single game by row id.
+
+        Args:
+            row_id (int): Row position in the dataset
+
+        Returns:
+            Dict: Column -> value, with missing values as None
+
+        Raises:
+            IndexError: If the row id is out of range
+        """
+        if not 0 <= row_id < len(self):
+            raise IndexError(f"Row id {row_id} out of range for {len(self)} rows")
+        record = self.frame.iloc[row_id]
+        return {col: (None if pd.isna(value) else value.item() if hasattr(value, 'item') else value)
+                for col, value in record.items()}
+
+_dataset: Optional[SharedDataset] = None
+
+def get_shared_dataset(file_path: str = "data/vgsales.csv") -> SharedDataset:
+    """
+    Get the shared dataset store, rebuilding it when the dataset file changes.
+
+    Args:
+        file_path (str): Path to the CSV file
+
+    Returns:
+        SharedDataset: The indexed dataset for the current dataset version
+    """
+    global _dataset
+
+    fingerprint = get_dataset_fingerprint(file_path)
+    if _dataset is None or _dataset.fingerprint != fingerprint:
+        reload = _dataset is not None
+        started = time.perf_counter()
+        _dataset = SharedDataset(load_vgsales_data(file_path), fingerprint)
+        record_load('dataset', time.perf_counter() - started,
+                    f"{'reloaded' if reload else 'loaded'} {fingerprint}, {len(_dataset)} rows")
+        logger.info(f"Indexed dataset {fingerprint} with {len(_dataset)} rows")
+    return _dataset
+
+def preload_dataset(file_path: str = "data/vgsales.csv") -> SharedDataset:
+    """
+    Load, clean and index the dataset, then freeze the GC for forking.
+
+    Call this in the process that forks workers (the gunicorn master). Every
+    object alive at this point is moved to the GC's permanent generation, so
+    collections in the workers never write to the pages holding it.
+
+    Args:
+        file_path (str): Path to the CSV file
+
+    Returns:
+        SharedDataset: The preloaded dataset store
+    """
+    dataset = get_shared_dataset(file_path)
+    gc.collect()
+    gc.freeze()
+    logger.info(f"Preloaded dataset; {gc.get_freeze_count()} objects frozen before fork")
+    return dataset
+
+def process_memory(pid: int = None) -> Dict[str, int]:
+    """
+    Get the memory breakdown of a process in kilobytes.
+
+    Uses /proc/<pid>/smaps_rollup, which separates pages still shared with
+    the master from pages a worker has copied (private).
+
+    Args:
+        pid (int, optional): Process id (defaults to the current process)
+
+    Returns:
+        Dict[str, int]: rss, pss, shared and private memory in kB
+    """
+    pid = pid or os.getpid()
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == 'kB':
+                    fields[parts[0].rstrip(':')] = int(parts[1])
+    except OSError:
+        import psutil
+        info = psutil.Process(pid).memory_full_info()
+        return {
+            'rss': info.rss // 1024,
+            'pss': getattr(info, 'pss', 0) // 1024,
+            'shared': getattr(info, 'shared', 0) // 1024,
+            'private': info.uss // 1024
+        }
+
+    return {
+        'rss': fields.get('Rss', 0),
+        'pss': fields.get('Pss', 0),
+        'shared': fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0),
+        'private': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)
+    }
+
+def worker_pids(master_pid: int) -> List[int]:
+    """
+    List the worker processes forked by a gunicorn master.
+
+    Args:
+        master_pid (int): Process id of the gunicorn master
+
+    Returns:
+        List[int]: Child process ids
+    """
+    import psutil
+    return [child.pid for child in psutil.Process(master_pid).children()]
+
+def format_memory_report(pids: Iterable[int]) -> str:
+    """
+    Format a per-process memory table.
+
+    Args:
+        pids (Iterable[int]): Processes to report on
+
+    Returns:
+        str: Human-readable table with one row per process plus totals
+    """
+    rows = [(pid, process_memory(pid)) for pid in pids]
+    lines = [f"{'pid':>8} {'rss MB':>9} {'pss MB':>9} {'shared MB':>10} {'private MB':>11}"]
+    for pid, mem in rows:
+        lines.append(
+            f"{pid:>8} {mem['rss'] / 1024:>9.1f} {mem['pss'] / 1024:>9.1f} "
+            f"{mem['shared'] / 1024:>10.1f} {mem['private'] / 1024:>11.1f}"
+        )
+    lines.append(
+        f"{'total':>8} {sum(m['rss'] for _, m in rows) / 1024:>9.1f} "
+        f"{sum(m['pss'] for _, m in rows) / 1024:>9.1f} "
+        f"{'':>10} {sum(m['private'] for _, m in rows) / 1024:>11.1f}"
+    )
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    # Usage: python -m utils.shared_data <gunicorn master pid>
+    if len(sys.argv) != 2:
+        print("Usage: python -m utils.shared_data <master_pid>")
+        sys.exit(1)
+    master = int(sys.argv[1])
+    print(format_memory_report([master] + worker_pids(master)))
@@ -0,0 +1,252 @@
+"""
+Synthetic video game sales data for load and scale testing.
+
+SalesModel learns the structure of the real vgsales.csv and samples new rows
+in the same schema:
+
+- platform and release year jointly, so each platform keeps its lifecycle
+  (including the share of rows with a missing year)
+- genre given platform
+- publisher given genre, plus a long tail of new publishers drawn at the
+  Good-Turing rate of unseen publishers (the share of rows whose publisher
+  appears once), so publisher cardinality keeps growing with size
+- regional sales copied from a real game of the same platform and genre and
+  scaled by lognormal noise, which keeps the regional split, the skew of the
+  sales distribution and its dependence on platform era
+
+write_synthetic_dataset streams any number of rows to CSV (or Parquet when
+pyarrow is installed) in fixed-size chunks, so memory use does not depend on
+the number of rows. Output is deterministic for a given seed and chunk size.
+
+Usage:
+    python -m utils.synthetic_data --rows 10000000 --output data/synthetic/vgsales_10m.csv
+"""
+
+import argparse
+import importlib.util
+import logging
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.constants import SYNTHETIC_DATA_CONFIG
+
+logger = logging.getLogger(__name__)
+
+REGIONAL_COLUMNS = ['NA_Sales', 'EU_Sales', 'JP_Sales', 'Other_Sales']
+
+class SalesModel:
+    """
+    Distributions learned from a vgsales DataFrame, used to sample new rows.
+    """
+
+    def __init__(self, df: pd.DataFrame, sales_noise: float = None):
+        """
+        Fit the model to a raw vgsales DataFrame.
+
+        Args:
+            df (pd.DataFrame): Real dataset in the vgsales schema
+            sales_noise (float, optional): Sigma of the lognormal factor applied
+                to copied sales figures
+        """
+        df = df.reset_index(drop=True)
+        self.sales_noise = SYNTHETIC_DATA_CONFIG['sales_noise'] if sales_noise is None else sales_noise
+
+        # Platform and year jointly (a missing year is its own category)
+        platform_codes, self.platforms = pd.factorize(df['Platform'])
+        year_codes, self.years = pd.factorize(df['Year'], use_na_sentinel=False)
+        self.years = np.asarray(self.years, dtype=float)
+        pairs = pd.Series(platform_codes * len(self.years) + year_codes).value_counts()
+        self.pair_codes = pairs.index.to_numpy()
+        self.pair_probs = (pairs / pairs.sum()).to_numpy()
+
+        # Genre given platform
+        genre_codes, self.genres = pd.factorize(df['Genre'])
+        self.genre_given_platform = self._conditional(platform_codes, len(self.platforms),
+                                                      genre_codes, len(self.genres))
+
+        # Publisher given genre (a missing publisher is its own category)
+        publisher_codes, self.publishers = pd.factorize(df['Publisher'], use_na_sentinel=False)
+        self.publisher_given_genre = self._conditional(genre_codes, len(self.genres),
+                                                       publisher_codes, len(self.publishers))
+        counts = np.bincount(publisher_codes)
+        self.new_publisher_rate = float((counts == 1).sum()) / len(df)
+
+        # Real rows to copy sales from, per (platform, genre) cell
+        self.sales = df[REGIONAL_COLUMNS].to_numpy(dtype=float)
+        cells = platform_codes * len(self.genres) + genre_codes
+        order = np.argsort(cells, kind='stable')
+        self.cell_rows = {
+            cell: order[start:start + count]
+            for cell, start, count in zip(*np.unique(cells[order], return_index=True, return_counts=True))
+        }
+        self.platform_rows = {
+            code: np.flatnonzero(platform_codes == code) for code in range(len(self.platforms))
+        }
+
+    @staticmethod
+    def _conditional(given: np.ndarray, n_given: int, values: np.ndarray, n_values: int) -> np.ndarray:
+        """Row-normalized matrix of P(value | given) from paired codes."""
+        counts = np.zeros((n_given, n_values))
+        np.add.at(counts, (given, values), 1)
+        return counts / counts.sum(axis=1, keepdims=True)
+
+    @staticmethod
+    def _sample_grouped(rng: np.random.Generator, groups: np.ndarray, probs: np.ndarray) -> np.ndarray:
+        """Sample one category per row from the distribution of its group."""
+        out = np.empty(len(groups), dtype=np.int64)
+        for group in np.unique(groups):
+            rows = np.flatnonzero(groups == group)
+            out[rows] = rng.choice(probs.shape[1], size=len(rows), p=probs[group])
+        return out
+
+    def sample(self, rng: np.random.Generator, n: int, first_rank: int = 1) -> pd.DataFrame:
+        """
+        Sample rows in the vgsales schema.
+
+        Args:
+            rng (np.random.Generator): Random source
+            n (int): Number of rows
+            first_rank (int): Rank of the first row (ranks are consecutive)
+
+        Returns:
+            pd.DataFrame: Synthetic rows with the columns of vgsales.csv
+        """
+        pairs = self.pair_codes[rng.choice(len(self.pair_codes), size=n, p=self.pair_probs)]
+        platform_codes, year_codes = np.divmod(pairs, len(self.years))
+        genre_codes = self._sample_grouped(rng, platform_codes, self.genre_given_platform)
+        publisher_codes = self._sample_grouped(rng, genre_codes, self.publisher_given_genre)
+
+        publishers = np.asarray(self.publishers, dtype=object)[publisher_codes]
+        new = rng.random(n) < self.new_publisher_rate
+        if new.any():
+            # Zipf keeps the new publishers a long tail rather than uniform noise
+            tail = rng.zipf(SYNTHETIC_DATA_CONFIG['publisher_tail_exponent'], size=int(new.sum()))
+            publishers[new] = [f"Publisher {k}" for k in tail]
+
+        # Copy the regional sales of a real game from the same platform and genre
+        templates = np.empty(n, dtype=np.int64)
+        cells = platform_codes * len(self.genres) + genre_codes
+        for cell in np.unique(cells):
+            rows = np.flatnonzero(cells == cell)
+            candidates = self.cell_rows.get(cell)
+            if candidates is None:
+                candidates = self.platform_rows[cell // len(self.genres)]
+            templates[rows] = candidates[rng.integers(len(candidates), size=len(rows))]
+        noise = rng.lognormal(0.0, self.sales_noise, size=(n, len(REGIONAL_COLUMNS)))
+        regional = np.round(self.sales[templates] * noise, 2)
+        global_sales = np.maximum(np.round(regional.sum(axis=1), 2), 0.01)
+
+        ranks = np.arange(first_rank, first_rank + n)
+        genres = np.asarray(self.genres, dtype=object)[genre_codes]
+        frame = pd.DataFrame({
+            'Rank': ranks,
+            'Name': [f"{genre} Game {rank}" for genre, rank in zip(genres, ranks)],
+            'Platform': np.asarray(self.platforms, dtype=object)[platform_codes],
+            'Year': self.years[year_codes],
+            'Genre': genres,
+            'Publisher': publishers
+        })
+        frame[REGIONAL_COLUMNS] = regional
+        frame['Global_Sales'] = global_sales
+        return frame
+
+def generate_chunks(rows: int,
+                    seed: int = None,
+                    chunk_rows: int = None,
+                    source: str = "data/vgsales.csv") -> Iterator[pd.DataFrame]:
+    """
+    Generate synthetic rows chunk by chunk.
+
+    Args:
+        rows (int): Total number of rows
+        seed (int, optional): Random seed
+        chunk_rows (int, optional): Rows per chunk
+        source (str): Real dataset the model is fitted to
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of at most ``chunk_rows`` rows
+    """
+    seed = SYNTHETIC_DATA_CONFIG['seed'] if seed is None else seed
+    chunk_rows = chunk_rows or SYNTHETIC_DATA_CONFIG['chunk_rows']
+    model = SalesModel(pd.read_csv(source))
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, chunk_rows):
+        yield model.sample(rng, min(chunk_rows, rows - start), first_rank=start + 1)
+
+def write_synthetic_dataset(path: str,
+                            rows: int,
+                            seed: int = None,
+                            chunk_rows: int = None,
+                            source: str = "data/vgsales.csv",
+                            file_format: Optional[str] = None) -> Path:
+    """
+    Stream a synthetic dataset to disk.
+
+    The file is written under a temporary name and renamed when complete, so
+    an interrupted run never leaves a truncated dataset behind.
+
+    Args:
+        path (str): Output file
+        rows (int): Number of rows
+        seed (int, optional): Random seed
+        chunk_rows (int, optional): Rows generated and written at a time
+        source (str): Real dataset the model is fitted to
+        file_format (str, optional): 'csv' or 'parquet' (default: from the suffix)
+
+    Returns:
+        Path: The written file
+    """
+    path = Path(path)
+    file_format = file_format or ('parquet' if path.suffix == '.parquet' else 'csv')
+    if file_format not in ('csv', 'parquet'):
+        raise ValueError(f"Unsupported format: {file_format}")
+    if file_format == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        raise ImportError("Writing Parquet requires pyarrow (pip install pyarrow)")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + '.partial')
+    started = time.perf_counter()
+    written = 0
+
+    if file_format == 'csv':
+        with open(partial, 'w', newline='') as f:
+            for chunk in generate_chunks(rows, seed, chunk_rows, source):
+                chunk.to_csv(f, header=(written == 0), index=False)
+                written += len(chunk)
+                logger.debug(f"Wrote {written:,} of {rows:,} rows")
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for chunk in generate_chunks(rows, seed, chunk_rows, source):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(partial, table.schema)
+                writer.write_table(table)
+                written += len(chunk)
+                logger.debug(f"Wrote {written:,} of {rows:,} rows")
+        finally:
+            if writer is not None:
+                writer.close()
+
+    partial.replace(path)
+    logger.info(f"Wrote {written:,} synthetic rows to {path} in {time.perf_counter() - started:.1f}s")
+    return path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic video game sales dataset")
+    parser.add_argument('--rows', type=int, required=True, help="Number of rows")
+    parser.add_argument('--output', required=True, help="Output file (.csv or .parquet)")
+    parser.add_argument('--seed', type=int, help="Random seed")
+    parser.add_argument('--chunk-rows', type=int, help="Rows generated at a time")
+    parser.add_argument('--source', default="data/vgsales.csv", help="Real dataset to learn from")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    write_synthetic_dataset(args.output, args.rows, args.seed, args.chunk_rows, args.source)